@@ -1,76 +1,303 @@
+import os
 import threading
-from core.submodules.search_modules.search_files import search_files_func
-from core.submodules.search_modules.search_by_extension import search_by_extension_func
-from core.submodules.search_modules.search_folders import search_folders_func
+from typing import Optional
+from core.submodules.search_modules.search_files import search_files_func, files_query_spec
+from core.submodules.search_modules.search_by_extension import search_by_extension_func, extension_query_spec
+from core.submodules.search_modules.search_folders import search_folders_func, folders_query_spec
+from core.submodules.search_modules.query_spec import QuerySpec
+from core.submodules.search_modules.query_page import query_page_func
+from core.submodules.search_modules.iter_query import iter_query_func
+from core.submodules.search_modules.count_query import count_query_func
+from core.submodules.search_modules.index_query import index_query_spec
+from core.submodules.search_modules.filter_query import filter_query_spec
+from core.submodules.search_modules.largest_files import largest_files_func
+from core.submodules.search_modules.not_modified_since import files_not_modified_since_func
+from core.submodules.search_modules.largest_folders import largest_folders_func, largest_folders_spec
+from core.submodules.search_modules.result_cache import QueryResultCache, RESULT_CACHE_ENTRIES, RESULT_CACHE_BYTES
+from core.submodules.search_modules.filename_snapshot import FilenameSnapshot, snapshot_path
+from core.submodules.export_modules.export_query import export_query_func
 from core.submodules.scan_modules.scan_streaming import scan_network_folder_func
 from core.submodules.scan_modules.process_file import process_single_file_func
 from core.submodules.scan_modules.scan_batch import scan_network_folder_batch_func
 from core.submodules.scan_modules.scan_folders import scan_network_folders_func
-from core.submodules.scan_modules.process_folder import process_single_folder_func
+from core.submodules.scan_modules.list_directory import list_directory_func
+from core.submodules.scan_modules.scandir_walk import scandir_walk_func
+from core.submodules.scan_modules.parallel_walk import parallel_walk_func
+from core.submodules.scan_modules.async_walk import async_walk_func
+from core.submodules.scan_modules.scan_pipeline import scan_pipeline_func
+from core.submodules.scan_modules.filter_changed import filter_changed_records_func
+from core.submodules.scan_modules.get_directory_mtime import get_directory_mtime_func
+from core.submodules.scan_modules.get_child_directories import get_child_directories_func
+from core.submodules.scan_modules.get_completed_directory import get_completed_directory_func
+from core.submodules.scan_modules.concurrency_controller import ConcurrencyController
+from core.submodules.scan_modules.scan_checkpoint import (
+    get_scan_checkpoint_func, save_scan_checkpoint_func, clear_scan_checkpoint_func
+)
 from core.submodules.db_modules.setup_logging import setup_logging_func
 from core.submodules.db_modules.get_connection import get_db_connection_func
 from core.submodules.db_modules.setup_schema import setup_database_schema_func
 from core.submodules.db_modules.close_connection import close_connection_func
+from core.submodules.db_modules.read_pool import ReadConnectionPool
+from core.submodules.db_modules.drop_indexes import drop_secondary_indexes_func
+from core.submodules.db_modules.rebuild_indexes import rebuild_indexes_func
+from core.submodules.db_modules.next_scan_generation import next_scan_generation_func
+from core.submodules.db_modules.rebuild_filename_fts import rebuild_filename_fts_func
+from core.submodules.db_modules.rebuild_filename_snapshot import rebuild_filename_snapshot_func
 from core.submodules.insert_modules.insert_batch import insert_batch_records_func
 from core.submodules.insert_modules.insert_single import insert_record_func
 from core.submodules.insert_modules.insert_file import insert_file_record_func
+from core.submodules.insert_modules.record_writer import RecordWriter
+from core.submodules.insert_modules.sweep_subtree import sweep_subtree_func
 from core.submodules.stats_modules.get_stats import get_stats_func
 from core.submodules.stats_modules.clear_index import clear_index_func
+from core.submodules.stats_modules.is_index_empty import is_index_empty_func
+from core.submodules.stats_modules.check_stats import check_stats_func
+from core.submodules.stats_modules.rebuild_stats import rebuild_stats_func
+from core.submodules.stats_modules.refresh_stale_stats import refresh_stale_stats_func
+from core.submodules.stats_modules.rollup_folder_sizes import rollup_folder_sizes_func
+
+# 'threads': listagem no pool de threads (paralela com parallel_walk=True);
+# 'asyncio': travessia num loop asyncio com até max_in_flight chamadas em andamento;
+# esse limite é fixo: min_workers, adaptive_concurrency e max_parallel_listings não se aplicam.
+SCAN_ENGINES = ('threads', 'asyncio')
 
 class FileIndexer:
-    def __init__(self, db_path: str = "file_index.db", max_workers: int = 8):
+    def __init__(self, db_path: str = "file_index.db", max_workers: int = 8,
+                 parallel_walk: bool = False, max_parallel_listings: Optional[int] = None,
+                 commit_rows: int = 20000, commit_interval: float = 2.0,
+                 bulk_commit_rows: int = 100000, filename_fts: bool = False,
+                 min_workers: int = 1, adaptive_concurrency: bool = True,
+                 scan_engine: str = 'threads', max_in_flight: int = 128,
+                 wal_checkpoint_interval: float = 10.0,
+                 result_cache_entries: int = RESULT_CACHE_ENTRIES,
+                 result_cache_bytes: int = RESULT_CACHE_BYTES,
+                 filename_snapshot: bool = False):
+        if scan_engine not in SCAN_ENGINES:
+            raise ValueError(f"Modo de escaneamento inválido: {scan_engine} (use {', '.join(SCAN_ENGINES)})")
         self.db_path = db_path
         self.max_workers = max_workers
+        self.min_workers = min_workers
+        self.adaptive_concurrency = adaptive_concurrency
+        self.scan_engine = scan_engine
+        self.max_in_flight = max_in_flight
+        self.wal_checkpoint_interval = wal_checkpoint_interval
+        self.parallel_walk = parallel_walk
+        self.max_parallel_listings = max_parallel_listings
+        self.commit_rows = commit_rows
+        self.commit_interval = commit_interval
+        self.bulk_commit_rows = bulk_commit_rows
         self.thread_local_db = threading.local()
+        self.result_cache = QueryResultCache(result_cache_entries, result_cache_bytes)
+        # O snapshot existe mesmo desativado: invalidate() apaga o arquivo deixado por
+        # outra instância, que ficaria desatualizado depois das gravações desta.
+        self.filename_snapshot = FilenameSnapshot(snapshot_path(db_path))
+        self.filename_snapshot_enabled = filename_snapshot
         
         setup_logging_func(self)
         setup_database_schema_func(self)
+        self.read_pool = ReadConnectionPool(self)
+        if filename_fts and not self.filename_fts_enabled:
+            self.rebuild_filename_search_index()
+        if self.filename_snapshot_enabled and not self.filename_snapshot.load():
+            self.rebuild_filename_snapshot()
 
     def get_db_connection(self):
         return get_db_connection_func(self)
 
+    def read_connection(self):
+        return self.read_pool.connection()
+
+    def read_snapshot(self):
+        return self.read_pool.snapshot()
+
+    def bump_index_generation(self):
+        # Chamado depois de cada commit que altera registros; invalida o snapshot de
+        # nomes e depois o cache de buscas, para que nada calculado pelo snapshot
+        # antigo fique guardado na geração nova.
+        self.filename_snapshot.invalidate()
+        self.result_cache.invalidate()
+
     def setup_database_schema(self):
         setup_database_schema_func(self)
 
-    def scan_network_folder(self, network_path: str, update_existing: bool = False):
-        scan_network_folder_func(self, network_path, update_existing)
+    def drop_secondary_indexes(self):
+        drop_secondary_indexes_func(self)
+
+    def rebuild_indexes(self):
+        rebuild_indexes_func(self)
+
+    def rebuild_filename_search_index(self):
+        rebuild_filename_fts_func(self)
+
+    def rebuild_filename_snapshot(self):
+        rebuild_filename_snapshot_func(self)
+
+    def next_scan_generation(self) -> int:
+        return next_scan_generation_func(self)
+
+    def scan_network_folder(self, network_path: str, update_existing: bool = False,
+                            bulk_load: Optional[bool] = None, resume: bool = True):
+        scan_network_folder_func(self, network_path, update_existing, bulk_load, resume)
+
+    def process_single_file(self, filename: str, full_path: str, entry: Optional[os.DirEntry] = None):
+        return process_single_file_func(self, filename, full_path, entry)
+
+    def list_directory(self, dir_path: str, incremental: bool = False, resume_generation: Optional[int] = None):
+        return list_directory_func(self, dir_path, incremental, resume_generation)
 
-    def process_single_file(self, filename: str, full_path: str):
-        return process_single_file_func(self, filename, full_path)
+    def walk_directory(self, network_path: str, incremental: bool = False, resume_generation: Optional[int] = None,
+                       stat_files: bool = True):
+        # `stat_files` só afeta os motores paralelos; o scandir_walk nunca faz stat.
+        if self.scan_engine == 'asyncio':
+            return async_walk_func(self, network_path, self.max_in_flight, incremental, resume_generation,
+                                   stat_files)
+        if self.parallel_walk:
+            return parallel_walk_func(self, network_path, self.max_parallel_listings, incremental,
+                                      resume_generation, stat_files)
+        return scandir_walk_func(self, network_path, incremental, resume_generation)
 
-    def scan_network_folder_batch(self, network_path: str, update_existing: bool = False):
-        scan_network_folder_batch_func(self, network_path, update_existing)
+    def concurrency_controller(self, name: str, max_limit: int) -> ConcurrencyController:
+        return ConcurrencyController(name, self.logger, self.min_workers, max_limit, self.adaptive_concurrency)
+
+    def get_directory_mtime(self, dir_path: str):
+        return get_directory_mtime_func(self, dir_path)
+
+    def get_child_directories(self, dir_path: str):
+        return get_child_directories_func(self, dir_path)
+
+    def get_completed_directory(self, dir_path: str, generation: int):
+        return get_completed_directory_func(self, dir_path, generation)
+
+    def get_scan_checkpoint(self, network_path: str):
+        return get_scan_checkpoint_func(self, network_path)
+
+    def save_scan_checkpoint(self, network_path: str, generation: int, bulk_load: bool):
+        save_scan_checkpoint_func(self, network_path, generation, bulk_load)
+
+    def clear_scan_checkpoint(self, network_path: str):
+        clear_scan_checkpoint_func(self, network_path)
+
+    def filter_changed_records(self, batch_data):
+        return filter_changed_records_func(self, batch_data)
+
+    def run_scan_pipeline(self, network_path: str, on_discovered=None, on_processed=None,
+                          bulk_load: Optional[bool] = None, incremental: bool = False, resume: bool = True):
+        return scan_pipeline_func(self, network_path, on_discovered, on_processed, bulk_load, incremental, resume)
+
+    def scan_network_folder_batch(self, network_path: str, update_existing: bool = False,
+                                  bulk_load: Optional[bool] = None, resume: bool = True):
+        scan_network_folder_batch_func(self, network_path, update_existing, bulk_load, resume)
 
     def scan_network_folders(self, network_path: str):
         scan_network_folders_func(self, network_path)
 
-    def _process_single_folder(self, folder_name: str, full_path: str):
-        return process_single_folder_func(self, folder_name, full_path)
-
     def insert_batch_records(self, batch_data):
         insert_batch_records_func(self, batch_data)
 
-    def insert_record(self, filename, full_path, parent_path, file_size, modified_date, item_type):
-        insert_record_func(self, filename, full_path, parent_path, file_size, modified_date, item_type)
+    def open_record_writer(self, sorted_load: bool = False, generation: int = 0) -> RecordWriter:
+        commit_rows = self.bulk_commit_rows if sorted_load else self.commit_rows
+        return RecordWriter(self, commit_rows, self.commit_interval, sorted_load, generation,
+                            checkpoint_interval=self.wal_checkpoint_interval)
+
+    def sweep_subtree(self, network_path: str, generation: int) -> int:
+        return sweep_subtree_func(self, network_path, generation)
 
-    def insert_file_record(self, filename, full_path, file_size, modified_date):
-        insert_file_record_func(self, filename, full_path, file_size, modified_date)
+    def insert_record(self, filename, full_path, parent_path, file_size, modified_date, item_type, mtime=None):
+        insert_record_func(self, filename, full_path, parent_path, file_size, modified_date, item_type, mtime)
 
-    def search_files(self, search_term: str, exact_match: bool = False):
-        return search_files_func(self, search_term, exact_match)
+    def insert_file_record(self, filename, full_path, file_size, modified_date, mtime=None):
+        insert_file_record_func(self, filename, full_path, file_size, modified_date, mtime)
 
-    def search_by_extension(self, extension: str):
-        return search_by_extension_func(self, extension)
+    def search_files(self, search_term: str, exact_match: bool = False, root_path: Optional[str] = None,
+                     mode: Optional[str] = None):
+        return search_files_func(self, search_term, exact_match, root_path, mode)
 
-    def search_folders(self, search_term: str, exact_match: bool = False):
-        return search_folders_func(self, search_term, exact_match)
+    def search_by_extension(self, extension: str, root_path: Optional[str] = None):
+        return search_by_extension_func(self, extension, root_path)
+
+    def search_folders(self, search_term: str, exact_match: bool = False, root_path: Optional[str] = None,
+                       mode: Optional[str] = None):
+        return search_folders_func(self, search_term, exact_match, root_path, mode)
+
+    def files_query(self, search_term: str, exact_match: bool = False, root_path: Optional[str] = None,
+                    mode: Optional[str] = None) -> QuerySpec:
+        return files_query_spec(self, search_term, exact_match, root_path=root_path, mode=mode)
+
+    def extension_query(self, extension: str, root_path: Optional[str] = None) -> QuerySpec:
+        return extension_query_spec(self, extension, root_path)
+
+    def folders_query(self, search_term: str, exact_match: bool = False, root_path: Optional[str] = None,
+                      mode: Optional[str] = None) -> QuerySpec:
+        return folders_query_spec(self, search_term, exact_match, root_path, mode)
+
+    def index_query(self, root_path: Optional[str] = None) -> QuerySpec:
+        return index_query_spec(self, root_path)
+
+    def filter_query(self, name: Optional[str] = None, extension: Optional[str] = None,
+                     min_size: Optional[int] = None, max_size: Optional[int] = None,
+                     modified_after=None, modified_before=None,
+                     root_path: Optional[str] = None, order: str = 'size') -> QuerySpec:
+        return filter_query_spec(self, name, extension, min_size, max_size,
+                                 modified_after, modified_before, root_path, order)
+
+    def largest_files(self, limit: int = 10, extension: Optional[str] = None, root_path: Optional[str] = None):
+        return largest_files_func(self, limit, extension, root_path)
+
+    def files_not_modified_since(self, since, limit: int = 10, root_path: Optional[str] = None):
+        return files_not_modified_since_func(self, since, limit, root_path)
+
+    def largest_folders_query(self, root_path: Optional[str] = None) -> QuerySpec:
+        return largest_folders_spec(self, root_path)
+
+    def largest_folders(self, limit: int = 50, root_path: Optional[str] = None):
+        return largest_folders_func(self, limit, root_path)
+
+    def query_page(self, spec: QuerySpec, limit: int = 10, page_cursor: Optional[str] = None):
+        return query_page_func(self, spec, limit, page_cursor)
+
+    def iter_query(self, spec: QuerySpec, batch_size: int = 1000):
+        return iter_query_func(self, spec, batch_size)
+
+    def count_query(self, spec: QuerySpec) -> int:
+        return count_query_func(self, spec)
+
+    def export_query(self, spec: QuerySpec, output_path: str, fmt: Optional[str] = None,
+                     compress: Optional[bool] = None) -> int:
+        return export_query_func(self, spec, output_path, fmt, compress)
+
+    def search_files_page(self, search_term: str, exact_match: bool = False, root_path: Optional[str] = None,
+                          limit: int = 10, page_cursor: Optional[str] = None, mode: Optional[str] = None):
+        return self.query_page(self.files_query(search_term, exact_match, root_path, mode), limit, page_cursor)
+
+    def search_by_extension_page(self, extension: str, root_path: Optional[str] = None,
+                                 limit: int = 10, page_cursor: Optional[str] = None):
+        return self.query_page(self.extension_query(extension, root_path), limit, page_cursor)
+
+    def search_folders_page(self, search_term: str, exact_match: bool = False, root_path: Optional[str] = None,
+                            limit: int = 10, page_cursor: Optional[str] = None, mode: Optional[str] = None):
+        return self.query_page(self.folders_query(search_term, exact_match, root_path, mode), limit, page_cursor)
 
     def get_stats(self) -> dict:
         return get_stats_func(self)
+
+    def check_stats(self) -> bool:
+        return check_stats_func(self)
+
+    def rebuild_stats(self):
+        rebuild_stats_func(self)
+
+    def refresh_stale_stats(self):
+        refresh_stale_stats_func(self)
+
+    def rollup_folder_sizes(self, root_path: Optional[str] = None):
+        rollup_folder_sizes_func(self, root_path)
     
     def clear_index(self):
         clear_index_func(self)
 
+    def is_index_empty(self) -> bool:
+        return is_index_empty_func(self)
+
     def close(self):
         close_connection_func(self)
 
@@ -1,4 +1,6 @@
 def close_connection_func(indexer):
+    indexer.read_pool.close()
+    indexer.filename_snapshot.close()
     if hasattr(indexer.thread_local_db, "conn") and indexer.thread_local_db.conn:
         indexer.thread_local_db.conn.close()
         del indexer.thread_local_db.conn
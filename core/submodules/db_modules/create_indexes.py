@@ -0,0 +1,15 @@
+# A restrição UNIQUE (dir_id, filename) já cria o índice usado para achar os itens de
+# uma pasta; por isso não há índice próprio para dir_id.
+# idx_type_extension_size também responde "maior arquivo da extensão" sem varrer a extensão.
+# idx_type_size substitui o antigo idx_item_type (é prefixo dele) e, com idx_type_mtime,
+# atende filtros por tamanho/data e os "maiores"/"mais antigos" direto na ordem do índice.
+SECONDARY_INDEXES = {
+    'idx_filename': 'CREATE INDEX IF NOT EXISTS idx_filename ON files(filename)',
+    'idx_type_size': 'CREATE INDEX IF NOT EXISTS idx_type_size ON files(item_type, file_size)',
+    'idx_type_mtime': 'CREATE INDEX IF NOT EXISTS idx_type_mtime ON files(item_type, mtime)',
+    'idx_type_extension_size': 'CREATE INDEX IF NOT EXISTS idx_type_extension_size ON files(item_type, extension, file_size)',
+}
+
+def create_secondary_indexes_func(indexer, cursor):
+    for index_sql in SECONDARY_INDEXES.values():
+        cursor.execute(index_sql)
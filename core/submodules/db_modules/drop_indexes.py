@@ -0,0 +1,21 @@
+import sqlite3
+from core.submodules.db_modules.create_indexes import SECONDARY_INDEXES
+from core.submodules.db_modules.filename_fts import drop_filename_fts_triggers
+from core.submodules.db_modules.stats_aggregates import drop_stats_triggers
+from core.submodules.db_modules.folder_sizes import drop_folder_size_triggers
+
+def drop_secondary_indexes_func(indexer):
+    conn = indexer.get_db_connection()
+    cursor = conn.cursor()
+    try:
+        for index_name in SECONDARY_INDEXES:
+            cursor.execute(f'DROP INDEX IF EXISTS {index_name}')
+        if indexer.filename_fts_enabled:
+            drop_filename_fts_triggers(cursor)
+        drop_stats_triggers(cursor)
+        drop_folder_size_triggers(cursor)
+        conn.commit()
+        indexer.logger.info("Índices secundários e triggers removidos para carga em massa")
+    except sqlite3.Error as e:
+        indexer.logger.error(f"Erro ao remover índices secundários: {e}")
+        raise
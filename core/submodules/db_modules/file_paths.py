@@ -0,0 +1,7 @@
+import os
+
+# files guarda só (dir_id, filename); o caminho completo é montado na leitura a
+# partir de directories.path. O rtrim cobre pastas raiz ('/', 'C:\'), que já
+# terminam com o separador.
+FILES_WITH_DIRECTORIES = "files JOIN directories ON directories.id = files.dir_id"
+FULL_PATH_SQL = f"rtrim(directories.path, '{os.sep}') || '{os.sep}' || files.filename"
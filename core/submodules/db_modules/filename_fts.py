@@ -0,0 +1,47 @@
+# Índice FTS5 (tokenizer trigram) espelhando files.filename. É uma tabela de
+# conteúdo externo: guarda só os trigramas e aponta para files.id pelo rowid.
+CREATE_FILENAME_FTS_SQL = '''
+    CREATE VIRTUAL TABLE IF NOT EXISTS files_fts
+    USING fts5(filename, content='files', content_rowid='id', tokenize='trigram')
+'''
+
+FILENAME_FTS_TRIGGERS = {
+    'files_fts_insert': '''
+        CREATE TRIGGER IF NOT EXISTS files_fts_insert AFTER INSERT ON files BEGIN
+            INSERT INTO files_fts(rowid, filename) VALUES (new.id, new.filename);
+        END
+    ''',
+    'files_fts_delete': '''
+        CREATE TRIGGER IF NOT EXISTS files_fts_delete AFTER DELETE ON files BEGIN
+            INSERT INTO files_fts(files_fts, rowid, filename) VALUES ('delete', old.id, old.filename);
+        END
+    ''',
+    'files_fts_update': '''
+        CREATE TRIGGER IF NOT EXISTS files_fts_update AFTER UPDATE OF filename ON files BEGIN
+            INSERT INTO files_fts(files_fts, rowid, filename) VALUES ('delete', old.id, old.filename);
+            INSERT INTO files_fts(rowid, filename) VALUES (new.id, new.filename);
+        END
+    ''',
+}
+
+# O trigram só consegue usar o índice para termos com pelo menos 3 caracteres.
+MIN_FTS_TERM_LENGTH = 3
+
+def has_filename_fts(cursor) -> bool:
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'files_fts'")
+    return cursor.fetchone() is not None
+
+def has_filename_fts_triggers(cursor) -> bool:
+    cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'files_fts_%'")
+    return cursor.fetchone()[0] == len(FILENAME_FTS_TRIGGERS)
+
+def create_filename_fts_triggers(cursor):
+    for trigger_sql in FILENAME_FTS_TRIGGERS.values():
+        cursor.execute(trigger_sql)
+
+def drop_filename_fts_triggers(cursor):
+    for trigger_name in FILENAME_FTS_TRIGGERS:
+        cursor.execute(f'DROP TRIGGER IF EXISTS {trigger_name}')
+
+def rebuild_filename_fts(cursor):
+    cursor.execute("INSERT INTO files_fts(files_fts) VALUES ('rebuild')")
@@ -0,0 +1,104 @@
+import os
+
+# Tamanho das pastas em duas camadas, nas colunas de directories:
+# - own_*: só os arquivos diretamente na pasta, mantidos por triggers em files a
+#   cada gravação (uma linha de directories por arquivo alterado);
+# - total_*: a subárvore inteira, somando os own_* das pastas na faixa de
+#   directories.path. É recalculado ao final de cada escaneamento só para a pasta
+#   escaneada e suas ancestrais, então "maiores pastas" vira uma leitura ordenada
+#   de idx_directories_total em vez de um GROUP BY recursivo sobre files.
+# Quando o arquivo mais recente de uma pasta sai ou muda, own_stale marca que
+# own_newest_mtime deve ser recalculado antes do próximo rollup.
+_ADD_FILE_SQL = '''
+    UPDATE directories SET
+        own_files = own_files + 1,
+        own_bytes = own_bytes + COALESCE(new.file_size, 0),
+        own_newest_mtime = MAX(COALESCE(own_newest_mtime, new.mtime), COALESCE(new.mtime, own_newest_mtime))
+    WHERE id = new.dir_id AND new.item_type = 'file';
+'''
+
+_REMOVE_FILE_SQL = '''
+    UPDATE directories SET
+        own_files = own_files - 1,
+        own_bytes = own_bytes - COALESCE(old.file_size, 0),
+        own_stale = own_stale OR COALESCE(old.mtime >= own_newest_mtime, 0)
+    WHERE id = old.dir_id AND old.item_type = 'file';
+'''
+
+FOLDER_SIZE_TRIGGERS = {
+    'files_folder_size_insert': f'''
+        CREATE TRIGGER IF NOT EXISTS files_folder_size_insert AFTER INSERT ON files BEGIN
+            {_ADD_FILE_SQL}
+        END
+    ''',
+    'files_folder_size_delete': f'''
+        CREATE TRIGGER IF NOT EXISTS files_folder_size_delete AFTER DELETE ON files BEGIN
+            {_REMOVE_FILE_SQL}
+        END
+    ''',
+    # O upsert do reescaneamento regrava linhas sem mudança; elas não mexem nos totais.
+    'files_folder_size_update': f'''
+        CREATE TRIGGER IF NOT EXISTS files_folder_size_update
+        AFTER UPDATE OF file_size, mtime, item_type, dir_id ON files
+        WHEN old.file_size IS NOT new.file_size OR old.mtime IS NOT new.mtime
+          OR old.item_type IS NOT new.item_type OR old.dir_id IS NOT new.dir_id
+        BEGIN
+            {_REMOVE_FILE_SQL}
+            {_ADD_FILE_SQL}
+        END
+    ''',
+}
+
+CREATE_FOLDER_SIZE_INDEX_SQL = ('CREATE INDEX IF NOT EXISTS idx_directories_total '
+                                'ON directories(total_bytes)')
+
+# Recalcula os own_* direto de files, pelo índice UNIQUE (dir_id, filename); o '+'
+# impede o SQLite de preferir os índices por item_type, que varrem todos os arquivos.
+REBUILD_OWN_SIZES_SQL = '''
+    UPDATE directories SET (own_files, own_bytes, own_newest_mtime, own_stale) = (
+        SELECT COUNT(*), COALESCE(SUM(file_size), 0), MAX(mtime), 0
+        FROM files WHERE dir_id = directories.id AND +item_type = 'file'
+    )
+'''
+
+REFRESH_STALE_NEWEST_SQL = '''
+    UPDATE directories SET
+        own_newest_mtime = (SELECT MAX(mtime) FROM files
+                            WHERE dir_id = directories.id AND +item_type = 'file'),
+        own_stale = 0
+    WHERE own_stale
+'''
+
+# Para cada pasta, soma os own_* das pastas na faixa do seu caminho (a própria e as
+# que começam com caminho + separador), a mesma faixa de restrict_to_subtree.
+ROLLUP_SQL = '''
+    UPDATE directories SET (total_files, total_bytes, newest_mtime) = (
+        SELECT COALESCE(SUM(sub.own_files), 0), COALESCE(SUM(sub.own_bytes), 0), MAX(sub.own_newest_mtime)
+        FROM directories AS sub
+        WHERE sub.path >= directories.path
+          AND sub.path < rtrim(directories.path, :sep) || :next_sep
+          AND (sub.path = directories.path OR sub.path >= rtrim(directories.path, :sep) || :sep)
+    )
+    WHERE {condition}
+'''
+
+ROLLUP_PARAMS = {'sep': os.sep, 'next_sep': chr(ord(os.sep) + 1)}
+
+def has_folder_size_triggers(cursor) -> bool:
+    cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'files_folder_size_%'")
+    return cursor.fetchone()[0] == len(FOLDER_SIZE_TRIGGERS)
+
+def create_folder_size_triggers(cursor):
+    for trigger_sql in FOLDER_SIZE_TRIGGERS.values():
+        cursor.execute(trigger_sql)
+
+def drop_folder_size_triggers(cursor):
+    for trigger_name in FOLDER_SIZE_TRIGGERS:
+        cursor.execute(f'DROP TRIGGER IF EXISTS {trigger_name}')
+
+def rebuild_own_folder_sizes(cursor):
+    cursor.execute(REBUILD_OWN_SIZES_SQL)
+
+def rebuild_folder_sizes(cursor):
+    rebuild_own_folder_sizes(cursor)
+    cursor.execute(ROLLUP_SQL.format(condition='1'), ROLLUP_PARAMS)
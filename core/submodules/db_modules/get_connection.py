@@ -1,8 +1,6 @@
-import sqlite3
+from core.submodules.db_modules.open_connection import open_db_connection_func
 
 def get_db_connection_func(indexer):
     if not hasattr(indexer.thread_local_db, "conn"):
-        indexer.thread_local_db.conn = sqlite3.connect(indexer.db_path)
-        indexer.thread_local_db.conn.execute('PRAGMA journal_mode = WAL;')
-        indexer.thread_local_db.conn.execute('PRAGMA synchronous = OFF;')
+        indexer.thread_local_db.conn = open_db_connection_func(indexer)
     return indexer.thread_local_db.conn
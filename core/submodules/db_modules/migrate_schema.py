@@ -0,0 +1,34 @@
+from core.submodules.insert_modules.file_extension import file_extension
+
+# Colunas adicionadas depois da primeira versão do esquema. Bancos antigos recebem
+# a coluna via ALTER TABLE e, quando houver, o UPDATE de preenchimento é executado uma vez.
+ADDED_COLUMNS = [
+    ('files', 'scan_generation', 'INTEGER DEFAULT 0', None),
+    ('directories', 'scan_generation', 'INTEGER DEFAULT 0', None),
+    ('files', 'extension', 'TEXT',
+     "UPDATE files SET extension = file_extension(filename) WHERE item_type = 'file'"),
+    # modified_date foi gravado em hora local; 'utc' converte de volta para epoch.
+    ('files', 'mtime', 'INTEGER',
+     "UPDATE files SET mtime = CAST(strftime('%s', modified_date, 'utc') AS INTEGER) "
+     "WHERE modified_date IS NOT NULL"),
+    # Tamanho das pastas; preenchido em setup_schema quando os triggers ainda não existem.
+    ('directories', 'own_files', 'INTEGER DEFAULT 0', None),
+    ('directories', 'own_bytes', 'INTEGER DEFAULT 0', None),
+    ('directories', 'own_newest_mtime', 'INTEGER', None),
+    ('directories', 'own_stale', 'INTEGER DEFAULT 0', None),
+    ('directories', 'total_files', 'INTEGER DEFAULT 0', None),
+    ('directories', 'total_bytes', 'INTEGER DEFAULT 0', None),
+    ('directories', 'newest_mtime', 'INTEGER', None),
+]
+
+def migrate_schema_func(indexer, cursor):
+    cursor.connection.create_function('file_extension', 1, file_extension, deterministic=True)
+    for table, column, definition, backfill_sql in ADDED_COLUMNS:
+        cursor.execute(f'PRAGMA table_info({table})')
+        existing_columns = {row[1] for row in cursor.fetchall()}
+        if column in existing_columns:
+            continue
+        indexer.logger.info(f"Migrando banco de dados: adicionando coluna {table}.{column}")
+        cursor.execute(f'ALTER TABLE {table} ADD COLUMN {column} {definition}')
+        if backfill_sql:
+            cursor.execute(backfill_sql)
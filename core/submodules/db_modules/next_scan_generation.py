@@ -0,0 +1,17 @@
+import sqlite3
+
+def next_scan_generation_func(indexer) -> int:
+    conn = indexer.get_db_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute('''
+            INSERT INTO index_meta (key, value) VALUES ('scan_generation', 1)
+            ON CONFLICT(key) DO UPDATE SET value = value + 1
+        ''')
+        cursor.execute("SELECT value FROM index_meta WHERE key = 'scan_generation'")
+        generation = cursor.fetchone()[0]
+        conn.commit()
+        return generation
+    except sqlite3.Error as e:
+        indexer.logger.error(f"Erro ao gerar identificador do escaneamento: {e}")
+        raise
@@ -0,0 +1,103 @@
+import os
+
+# Esquema anterior: files guardava full_path e parent_path em texto em cada linha.
+# Agora cada pasta aparece uma vez em directories e files guarda só (dir_id, filename).
+CREATE_FILES_SQL = '''
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        filename TEXT NOT NULL,
+        dir_id INTEGER NOT NULL,
+        file_size INTEGER,
+        modified_date TEXT,
+        mtime INTEGER,
+        item_type TEXT NOT NULL,
+        indexed_date TEXT DEFAULT CURRENT_TIMESTAMP,
+        scan_generation INTEGER DEFAULT 0,
+        extension TEXT,
+        UNIQUE (dir_id, filename)
+    )
+'''
+
+CREATE_DIRECTORIES_SQL = '''
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY,
+        path TEXT NOT NULL UNIQUE,
+        parent_id INTEGER,
+        mtime_ns INTEGER,
+        scan_generation INTEGER DEFAULT 0,
+        own_files INTEGER DEFAULT 0,
+        own_bytes INTEGER DEFAULT 0,
+        own_newest_mtime INTEGER,
+        own_stale INTEGER DEFAULT 0,
+        total_files INTEGER DEFAULT 0,
+        total_bytes INTEGER DEFAULT 0,
+        newest_mtime INTEGER
+    )
+'''
+
+def _dirname(path):
+    if path is None:
+        return None
+    return os.path.dirname(path)
+
+def normalize_paths_func(indexer, cursor):
+    cursor.execute('PRAGMA table_info(files)')
+    if 'full_path' not in {row[1] for row in cursor.fetchall()}:
+        return
+
+    indexer.logger.info("Migrando banco de dados: caminhos de files para a tabela directories (pode demorar)")
+    conn = cursor.connection
+    conn.create_function('path_dirname', 1, _dirname, deterministic=True)
+    conn.commit()
+    cursor.execute('BEGIN IMMEDIATE')
+    try:
+        cursor.execute(CREATE_DIRECTORIES_SQL.format(table='directories_new'))
+        cursor.execute('''
+            INSERT INTO directories_new (id, path, mtime_ns, scan_generation)
+            SELECT id, path, mtime_ns, scan_generation FROM directories
+        ''')
+        cursor.execute('''
+            INSERT OR IGNORE INTO directories_new (path)
+            SELECT DISTINCT path_dirname(full_path) FROM files
+        ''')
+        # Cada passada cria as pastas pai que faltam, até chegar à raiz.
+        while True:
+            cursor.execute('''
+                INSERT OR IGNORE INTO directories_new (path)
+                SELECT DISTINCT path_dirname(path) FROM directories_new
+                WHERE path_dirname(path) != path AND path_dirname(path) != ''
+            ''')
+            if cursor.rowcount <= 0:
+                break
+        cursor.execute('''
+            UPDATE directories_new SET parent_id = (
+                SELECT parent.id FROM directories_new AS parent
+                WHERE parent.path = path_dirname(directories_new.path)
+                  AND parent.path != directories_new.path
+            )
+        ''')
+
+        cursor.execute(CREATE_FILES_SQL.format(table='files_new'))
+        cursor.execute('''
+            INSERT OR IGNORE INTO files_new
+            (id, filename, dir_id, file_size, modified_date, mtime, item_type, indexed_date,
+             scan_generation, extension)
+            SELECT files.id, files.filename, directories_new.id, files.file_size, files.modified_date,
+                   files.mtime, files.item_type, files.indexed_date, files.scan_generation, files.extension
+            FROM files JOIN directories_new ON directories_new.path = path_dirname(files.full_path)
+        ''')
+
+        # Os triggers de FTS e de estatísticas caem junto com a tabela antiga e são
+        # recriados (com reconstrução) pelo setup do esquema.
+        cursor.execute('DROP TABLE files')
+        cursor.execute('ALTER TABLE files_new RENAME TO files')
+        cursor.execute('DROP TABLE directories')
+        cursor.execute('ALTER TABLE directories_new RENAME TO directories')
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+    indexer.logger.info("Compactando o banco de dados após a migração (VACUUM)...")
+    cursor.execute('VACUUM')
+    indexer.logger.info("Migração de caminhos concluída")
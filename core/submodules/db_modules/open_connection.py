@@ -0,0 +1,7 @@
+import sqlite3
+
+def open_db_connection_func(indexer) -> sqlite3.Connection:
+    conn = sqlite3.connect(indexer.db_path)
+    conn.execute('PRAGMA journal_mode = WAL;')
+    conn.execute('PRAGMA synchronous = OFF;')
+    return conn
@@ -0,0 +1,29 @@
+import os
+from typing import Tuple
+
+def subtree_range(path: str) -> Tuple[str, str]:
+    """Retorna os limites [inicio, fim) dos caminhos que ficam dentro de `path`.
+
+    Comparar directories.path com esses limites permite ao SQLite percorrer só o
+    trecho do índice da subárvore, o que um LIKE 'prefixo%' não garante.
+    """
+    prefix = path.rstrip(os.sep) + os.sep
+    return prefix, prefix[:-1] + chr(ord(os.sep) + 1)
+
+def directory_key(path: str) -> str:
+    """Retorna `path` na forma guardada em directories.path.
+
+    A chave é a mesma que os.path.dirname dá para os arquivos da pasta, então a
+    raiz escaneada e seus arquivos ficam numa única linha. No Windows a raiz de um
+    compartilhamento ('\\\\srv\\share') mantém a barra final, como no dirname de
+    '\\\\srv\\share\\a.txt'; sem ela os arquivos da raiz iriam para outra linha.
+    A letra de unidade fica sempre maiúscula ('c:\\dados' vira 'C:\\dados'), para que
+    a pasta digitada numa busca encontre a gravada pelo escaneamento.
+    """
+    path = os.path.normpath(path)
+    drive, rest = os.path.splitdrive(path)
+    if drive.endswith(':'):
+        path = drive.upper() + rest
+    elif drive and not rest:
+        path = drive + os.sep
+    return path
@@ -0,0 +1,71 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+from core.submodules.search_modules.pattern_query import regexp
+
+READ_CACHE_KIB = 64 * 1024
+READ_MMAP_BYTES = 256 * 1024 * 1024
+
+class ReadConnectionPool:
+    """Conexões somente leitura reaproveitadas pelas buscas.
+
+    Cada conexão tem `query_only`, cache de páginas maior e mmap, e continua aberta
+    entre buscas, então o cache já está quente na próxima. No modo WAL uma leitura
+    enxerga o banco como estava no início da transação e nunca espera pelo
+    RecordWriter, mesmo durante um escaneamento grande. `snapshot()` mantém a
+    mesma visão em várias consultas seguidas (ex.: estatísticas).
+    Uma conexão é usada por uma thread de cada vez; a pilha guarda até `max_idle`
+    conexões livres.
+    """
+
+    def __init__(self, indexer, max_idle: int = 4, cache_kib: int = READ_CACHE_KIB,
+                 mmap_bytes: int = READ_MMAP_BYTES):
+        self.indexer = indexer
+        self.max_idle = max_idle
+        self.cache_kib = cache_kib
+        self.mmap_bytes = mmap_bytes
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def _open(self) -> sqlite3.Connection:
+        # isolation_level=None: sem transações implícitas; snapshot() abre a sua.
+        conn = sqlite3.connect(self.indexer.db_path, check_same_thread=False, isolation_level=None)
+        conn.execute('PRAGMA query_only = ON')
+        conn.execute(f'PRAGMA cache_size = -{self.cache_kib}')
+        conn.execute(f'PRAGMA mmap_size = {self.mmap_bytes}')
+        conn.execute('PRAGMA temp_store = MEMORY')
+        conn.create_function('regexp', 2, regexp, deterministic=True)
+        return conn
+
+    @contextmanager
+    def connection(self):
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+        if conn is None:
+            conn = self._open()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            with self._lock:
+                if len(self._idle) < self.max_idle:
+                    self._idle.append(conn)
+                    conn = None
+            if conn is not None:
+                conn.close()
+
+    @contextmanager
+    def snapshot(self):
+        with self.connection() as conn:
+            conn.execute('BEGIN')
+            try:
+                yield conn
+            finally:
+                conn.rollback()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
@@ -0,0 +1,21 @@
+import sqlite3
+from core.submodules.db_modules.filename_fts import (
+    CREATE_FILENAME_FTS_SQL, create_filename_fts_triggers, rebuild_filename_fts
+)
+
+def rebuild_filename_fts_func(indexer):
+    # Cria o índice de substring se ainda não existir e o repopula a partir de files.
+    conn = indexer.get_db_connection()
+    cursor = conn.cursor()
+    try:
+        indexer.logger.info("Reconstruindo índice de busca por trecho do nome (FTS5 trigram)...")
+        cursor.execute(CREATE_FILENAME_FTS_SQL)
+        create_filename_fts_triggers(cursor)
+        rebuild_filename_fts(cursor)
+        conn.commit()
+        indexer.filename_fts_enabled = True
+        indexer.logger.info("Índice de busca por trecho do nome reconstruído")
+    except sqlite3.Error as e:
+        conn.rollback()
+        indexer.logger.error(f"Erro ao reconstruir índice FTS: {e}")
+        raise
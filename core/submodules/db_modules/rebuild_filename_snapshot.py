@@ -0,0 +1,25 @@
+import os
+import sqlite3
+from core.submodules.search_modules.filename_snapshot import write_filename_snapshot
+
+def rebuild_filename_snapshot_func(indexer):
+    # Gera o snapshot de nomes a partir de uma leitura consistente de files e o
+    # instala no lugar do anterior. Se o índice mudar durante a geração, o
+    # arquivo é descartado: a próxima reconstrução (fim do próximo escaneamento)
+    # o refaz.
+    snapshot = indexer.filename_snapshot
+    generation = indexer.result_cache.generation
+    new_path = snapshot.path + '.tmp'
+    try:
+        indexer.logger.info("Gerando snapshot de nomes para busca por trecho...")
+        with indexer.read_snapshot() as conn:
+            count = write_filename_snapshot(new_path, conn.execute("SELECT id, filename FROM files ORDER BY id"))
+        if snapshot.install(new_path, lambda: indexer.result_cache.generation == generation):
+            indexer.logger.info(f"Snapshot de nomes gerado: {count} nomes, "
+                                f"{os.path.getsize(snapshot.path) / 1024**2:.1f} MB")
+        else:
+            indexer.logger.warning("O índice mudou durante a geração do snapshot de nomes; ele foi descartado")
+    except (sqlite3.Error, OSError) as e:
+        indexer.logger.error(f"Erro ao gerar o snapshot de nomes: {e}")
+        if os.path.exists(new_path):
+            os.remove(new_path)
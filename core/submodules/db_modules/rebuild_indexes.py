@@ -0,0 +1,25 @@
+import sqlite3
+from core.submodules.db_modules.create_indexes import create_secondary_indexes_func
+from core.submodules.db_modules.filename_fts import create_filename_fts_triggers, rebuild_filename_fts
+from core.submodules.db_modules.stats_aggregates import create_stats_triggers, rebuild_stats_aggregates
+from core.submodules.db_modules.folder_sizes import create_folder_size_triggers, rebuild_own_folder_sizes
+
+def rebuild_indexes_func(indexer):
+    conn = indexer.get_db_connection()
+    cursor = conn.cursor()
+    try:
+        indexer.logger.info("Reconstruindo índices secundários...")
+        create_secondary_indexes_func(indexer, cursor)
+        if indexer.filename_fts_enabled:
+            create_filename_fts_triggers(cursor)
+            rebuild_filename_fts(cursor)
+        create_stats_triggers(cursor)
+        rebuild_stats_aggregates(cursor)
+        create_folder_size_triggers(cursor)
+        rebuild_own_folder_sizes(cursor)
+        cursor.execute('ANALYZE')
+        conn.commit()
+        indexer.logger.info("Índices reconstruídos e estatísticas atualizadas")
+    except sqlite3.Error as e:
+        indexer.logger.error(f"Erro ao reconstruir índices: {e}")
+        raise
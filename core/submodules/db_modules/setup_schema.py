@@ -1,4 +1,19 @@
 import sqlite3
+from core.submodules.db_modules.create_indexes import create_secondary_indexes_func
+from core.submodules.db_modules.migrate_schema import migrate_schema_func
+from core.submodules.db_modules.normalize_paths import (
+    normalize_paths_func, CREATE_FILES_SQL, CREATE_DIRECTORIES_SQL
+)
+from core.submodules.db_modules.stats_aggregates import (
+    create_stats_tables, has_stats_triggers, create_stats_triggers, drop_stats_triggers, rebuild_stats_aggregates
+)
+from core.submodules.db_modules.folder_sizes import (
+    CREATE_FOLDER_SIZE_INDEX_SQL, has_folder_size_triggers, create_folder_size_triggers, rebuild_folder_sizes
+)
+from core.submodules.scan_modules.scan_checkpoint import CREATE_SCAN_CHECKPOINTS_SQL
+from core.submodules.db_modules.filename_fts import (
+    has_filename_fts, has_filename_fts_triggers, create_filename_fts_triggers, rebuild_filename_fts
+)
 
 def setup_database_schema_func(indexer):
     conn = sqlite3.connect(indexer.db_path)
@@ -7,23 +22,44 @@ def setup_database_schema_func(indexer):
     cursor.execute('PRAGMA journal_mode = WAL;')
     cursor.execute('PRAGMA synchronous = OFF;')
     
+    cursor.execute(CREATE_FILES_SQL.format(table='files'))
+    cursor.execute(CREATE_DIRECTORIES_SQL.format(table='directories'))
+    
     cursor.execute('''
-        CREATE TABLE IF NOT EXISTS files (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            filename TEXT NOT NULL,
-            full_path TEXT NOT NULL UNIQUE,
-            parent_path TEXT,
-            file_size INTEGER,
-            modified_date TEXT,
-            item_type TEXT NOT NULL,
-            indexed_date TEXT DEFAULT CURRENT_TIMESTAMP
+        CREATE TABLE IF NOT EXISTS index_meta (
+            key TEXT PRIMARY KEY,
+            value INTEGER
         )
     ''')
     
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_filename ON files(filename)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_full_path ON files(full_path)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_item_type ON files(item_type)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_parent_path ON files(parent_path)')
+    cursor.execute(CREATE_SCAN_CHECKPOINTS_SQL)
+    
+    migrate_schema_func(indexer, cursor)
+    normalize_paths_func(indexer, cursor)
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_directories_parent ON directories(parent_id)')
+    cursor.execute(CREATE_FOLDER_SIZE_INDEX_SQL)
+    
+    cursor.execute('DROP INDEX IF EXISTS idx_full_path')
+    cursor.execute('DROP INDEX IF EXISTS idx_type_extension')
+    cursor.execute('DROP INDEX IF EXISTS idx_item_type')
+    cursor.execute('DROP INDEX IF EXISTS idx_parent_path')
+    create_secondary_indexes_func(indexer, cursor)
+    
+    # Sem os triggers (ex.: carga em massa interrompida) o FTS pode estar desatualizado.
+    indexer.filename_fts_enabled = has_filename_fts(cursor)
+    if indexer.filename_fts_enabled and not has_filename_fts_triggers(cursor):
+        create_filename_fts_triggers(cursor)
+        rebuild_filename_fts(cursor)
+    
+    # Bancos sem os agregados (ou com os triggers removidos) são recalculados uma vez.
+    create_stats_tables(cursor)
+    if not has_stats_triggers(cursor):
+        drop_stats_triggers(cursor)
+        create_stats_triggers(cursor)
+        rebuild_stats_aggregates(cursor)
+    if not has_folder_size_triggers(cursor):
+        create_folder_size_triggers(cursor)
+        rebuild_folder_sizes(cursor)
     
     conn.commit()
     conn.close()
@@ -0,0 +1,130 @@
+# Agregados mantidos por triggers em files, para que get_stats leia uma linha por
+# extensão/tipo em vez de agregar a tabela inteira. Quando o maior arquivo de uma
+# extensão é removido ou diminui, largest_stale marca que ele deve ser recalculado.
+CREATE_STATS_TABLES_SQL = [
+    '''
+    CREATE TABLE IF NOT EXISTS item_type_stats (
+        item_type TEXT PRIMARY KEY,
+        item_count INTEGER NOT NULL DEFAULT 0,
+        total_bytes INTEGER NOT NULL DEFAULT 0
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS extension_stats (
+        extension TEXT PRIMARY KEY,
+        file_count INTEGER NOT NULL DEFAULT 0,
+        total_bytes INTEGER NOT NULL DEFAULT 0,
+        largest_file_id INTEGER,
+        largest_size INTEGER,
+        largest_stale INTEGER NOT NULL DEFAULT 0
+    )
+    ''',
+]
+
+_ADD_ROW_SQL = '''
+    INSERT INTO item_type_stats (item_type, item_count, total_bytes)
+    VALUES (new.item_type, 1, COALESCE(new.file_size, 0))
+    ON CONFLICT(item_type) DO UPDATE SET
+        item_count = item_count + 1,
+        total_bytes = total_bytes + excluded.total_bytes;
+    INSERT INTO extension_stats (extension, file_count, total_bytes, largest_file_id, largest_size)
+    SELECT COALESCE(new.extension, ''), 1, COALESCE(new.file_size, 0), new.id, COALESCE(new.file_size, 0)
+    WHERE new.item_type = 'file'
+    ON CONFLICT(extension) DO UPDATE SET
+        file_count = file_count + 1,
+        total_bytes = total_bytes + excluded.total_bytes,
+        largest_file_id = CASE WHEN NOT largest_stale AND excluded.largest_size > COALESCE(largest_size, -1)
+                               THEN excluded.largest_file_id ELSE largest_file_id END,
+        largest_size = CASE WHEN NOT largest_stale AND excluded.largest_size > COALESCE(largest_size, -1)
+                            THEN excluded.largest_size ELSE largest_size END;
+'''
+
+_REMOVE_ROW_SQL = '''
+    UPDATE item_type_stats SET
+        item_count = item_count - 1,
+        total_bytes = total_bytes - COALESCE(old.file_size, 0)
+    WHERE item_type = old.item_type;
+    UPDATE extension_stats SET
+        file_count = file_count - 1,
+        total_bytes = total_bytes - COALESCE(old.file_size, 0),
+        largest_stale = largest_stale OR COALESCE(largest_file_id = old.id, 0)
+    WHERE old.item_type = 'file' AND extension = COALESCE(old.extension, '');
+'''
+
+STATS_TRIGGERS = {
+    'files_stats_insert': f'''
+        CREATE TRIGGER IF NOT EXISTS files_stats_insert AFTER INSERT ON files BEGIN
+            {_ADD_ROW_SQL}
+        END
+    ''',
+    'files_stats_delete': f'''
+        CREATE TRIGGER IF NOT EXISTS files_stats_delete AFTER DELETE ON files BEGIN
+            {_REMOVE_ROW_SQL}
+        END
+    ''',
+    # O upsert do reescaneamento regrava linhas sem mudança; elas não mexem nos
+    # agregados nem marcam o maior arquivo como desatualizado.
+    'files_stats_update': f'''
+        CREATE TRIGGER IF NOT EXISTS files_stats_update
+        AFTER UPDATE OF file_size, item_type, extension ON files
+        WHEN old.file_size IS NOT new.file_size OR old.item_type IS NOT new.item_type
+          OR old.extension IS NOT new.extension
+        BEGIN
+            {_REMOVE_ROW_SQL}
+            {_ADD_ROW_SQL}
+        END
+    ''',
+}
+
+# Valores esperados, recalculados direto de files (usado na reconstrução e na verificação).
+ITEM_TYPE_TOTALS_SQL = '''
+    SELECT item_type, COUNT(*), COALESCE(SUM(file_size), 0) FROM files GROUP BY item_type
+'''
+EXTENSION_TOTALS_SQL = '''
+    SELECT COALESCE(extension, ''), COUNT(*), COALESCE(SUM(file_size), 0), id, MAX(COALESCE(file_size, 0))
+    FROM files WHERE item_type = 'file' GROUP BY COALESCE(extension, '')
+'''
+
+# Recalcula o maior arquivo das extensões marcadas, pelo idx_type_extension_size.
+REFRESH_STALE_LARGEST_SQL = '''
+    UPDATE extension_stats SET
+        (largest_file_id, largest_size) = (
+            SELECT id, COALESCE(file_size, 0) FROM files
+            WHERE item_type = 'file' AND extension = extension_stats.extension
+            ORDER BY file_size DESC LIMIT 1
+        ),
+        largest_stale = 0
+    WHERE largest_stale
+'''
+
+def create_stats_tables(cursor):
+    for table_sql in CREATE_STATS_TABLES_SQL:
+        cursor.execute(table_sql)
+
+def has_stats_triggers(cursor) -> bool:
+    # Triggers de versões anteriores (sem o WHEN no update) contam como ausentes
+    # e são recriados.
+    cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'files_stats_%'"
+                   " AND (name != 'files_stats_update' OR sql LIKE '%WHEN%')")
+    return cursor.fetchone()[0] == len(STATS_TRIGGERS)
+
+def create_stats_triggers(cursor):
+    for trigger_sql in STATS_TRIGGERS.values():
+        cursor.execute(trigger_sql)
+
+def drop_stats_triggers(cursor):
+    for trigger_name in STATS_TRIGGERS:
+        cursor.execute(f'DROP TRIGGER IF EXISTS {trigger_name}')
+
+def refresh_stale_largest(cursor):
+    cursor.execute(REFRESH_STALE_LARGEST_SQL)
+
+def rebuild_stats_aggregates(cursor):
+    cursor.execute("DELETE FROM item_type_stats")
+    cursor.execute("DELETE FROM extension_stats")
+    cursor.execute(f"INSERT INTO item_type_stats (item_type, item_count, total_bytes) {ITEM_TYPE_TOTALS_SQL}")
+    # MAX() com coluna simples (id) faz o SQLite devolver o id da linha do máximo.
+    cursor.execute(f'''
+        INSERT INTO extension_stats (extension, file_count, total_bytes, largest_file_id, largest_size)
+        {EXTENSION_TOTALS_SQL}
+    ''')
@@ -0,0 +1,109 @@
+import csv
+import gzip
+import json
+import sqlite3
+from typing import Optional
+from core.submodules.search_modules.query_spec import QuerySpec
+
+EXPORT_FORMATS = ('csv', 'jsonl', 'txt')
+EXPORT_BATCH_SIZE = 5000
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+TXT_LABELS = {
+    'filename': 'Arquivo',
+    'folder_name': 'Pasta',
+    'full_path': 'Caminho',
+    'parent_path': 'Pasta Pai',
+    'file_size': 'Tamanho',
+    'modified_date': 'Modificado',
+    'item_type': 'Tipo',
+    'extension': 'Extensão',
+    'path': 'Pasta',
+    'total_bytes': 'Tamanho Total',
+    'total_files': 'Arquivos',
+    'newest_modified': 'Modificação Mais Recente',
+}
+SIZE_COLUMNS = ('file_size', 'total_bytes')
+
+def export_format_from_path(output_path: str) -> str:
+    name = output_path.lower()
+    if name.endswith('.gz'):
+        name = name[:-3]
+    for fmt in EXPORT_FORMATS:
+        if name.endswith('.' + fmt):
+            return fmt
+    return 'txt'
+
+def _open_output(output_path: str, compress: bool):
+    if compress:
+        # Nível 6 mantém a compressão perto da velocidade do disco; o 9 padrão não.
+        return gzip.open(output_path, 'wt', encoding='utf-8', newline='', compresslevel=6)
+    return open(output_path, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER_SIZE)
+
+def _write_csv(f, columns, batches):
+    writer = csv.writer(f)
+    writer.writerow(columns)
+    for rows in batches:
+        writer.writerows(rows)
+
+def _write_jsonl(f, columns, batches):
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    for rows in batches:
+        f.write(''.join(encode(dict(zip(columns, row))) + '\n' for row in rows))
+
+def _write_txt(f, columns, batches):
+    from core.indexer import format_file_size
+    labels = [TXT_LABELS.get(column, column) for column in columns]
+    size_positions = {position for position, column in enumerate(columns) if column in SIZE_COLUMNS}
+    separator = '-' * 80 + '\n'
+    for rows in batches:
+        lines = []
+        for row in rows:
+            for position, (label, value) in enumerate(zip(labels, row)):
+                if position in size_positions and value is not None:
+                    value = format_file_size(value)
+                lines.append(f"{label}: {value}\n")
+            lines.append(separator)
+        f.write(''.join(lines))
+
+WRITERS = {'csv': _write_csv, 'jsonl': _write_jsonl, 'txt': _write_txt}
+
+def export_query_func(indexer, spec: QuerySpec, output_path: str, fmt: Optional[str] = None,
+                      compress: Optional[bool] = None, batch_size: int = EXPORT_BATCH_SIZE) -> int:
+    # Lê o resultado em blocos com fetchmany e escreve cada bloco de uma vez num
+    # arquivo com buffer grande: a memória fica constante seja qual for o total.
+    # Formato e compressão saem da extensão do arquivo quando não são informados
+    # (ex.: 'resultado.csv.gz'). Retorna quantas linhas foram exportadas.
+    if fmt is None:
+        fmt = export_format_from_path(output_path)
+    if fmt not in WRITERS:
+        raise ValueError(f"Formato de exportação inválido: {fmt} (use {', '.join(EXPORT_FORMATS)})")
+    if compress is None:
+        compress = output_path.lower().endswith('.gz')
+
+    exported_rows = 0
+    try:
+        with indexer.read_connection() as conn:
+            cursor = conn.execute(spec.select_sql(), spec.params)
+            columns = [description[0] for description in cursor.description]
+
+            def batches():
+                nonlocal exported_rows
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        return
+                    exported_rows += len(rows)
+                    yield rows
+
+            try:
+                with _open_output(output_path, compress) as f:
+                    WRITERS[fmt](f, columns, batches())
+            finally:
+                cursor.close()
+    except sqlite3.Error as e:
+        indexer.logger.error(f"Erro ao exportar resultados: {e}")
+        raise
+
+    indexer.logger.info(f"Exportação concluída: {exported_rows} registros em {output_path} ({fmt}{', gzip' if compress else ''})")
+    return exported_rows
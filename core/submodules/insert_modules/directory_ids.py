@@ -0,0 +1,51 @@
+import os
+from collections import OrderedDict
+from typing import Optional
+
+class DirectoryIds:
+    """Converte caminhos de pasta nos ids da tabela directories.
+
+    `get` cria a linha (e as das pastas acima dela) quando ainda não existe; a
+    linha nasce sem mtime, que só é gravado quando a listagem da pasta termina.
+    Os ids mais usados ficam num cache LRU limitado: a escrita chega agrupada por
+    pasta, então poucas entradas bastam mesmo em árvores com milhões de pastas.
+    """
+
+    def __init__(self, cursor, max_cached: int = 4096):
+        self.cursor = cursor
+        self.max_cached = max_cached
+        self._cache = OrderedDict()
+
+    def lookup(self, dir_path: str) -> Optional[int]:
+        dir_id = self._cache.get(dir_path)
+        if dir_id is not None:
+            self._cache.move_to_end(dir_path)
+            return dir_id
+        self.cursor.execute("SELECT id FROM directories WHERE path = ?", (dir_path,))
+        row = self.cursor.fetchone()
+        if row:
+            self._remember(dir_path, row[0])
+            return row[0]
+        return None
+
+    def get(self, dir_path: str) -> int:
+        dir_id = self.lookup(dir_path)
+        if dir_id is not None:
+            return dir_id
+        parent = os.path.dirname(dir_path)
+        parent_id = self.get(parent) if parent and parent != dir_path else None
+        # Outra conexão pode ter criado a mesma pasta entre o SELECT e o INSERT.
+        self.cursor.execute("INSERT INTO directories (path, parent_id) VALUES (?, ?) ON CONFLICT(path) DO NOTHING",
+                            (dir_path, parent_id))
+        return self.lookup(dir_path)
+
+    def forget_subtree(self, dir_path: str):
+        # Chamado depois de apagar as linhas de uma subárvore em directories.
+        prefix = dir_path.rstrip(os.sep) + os.sep
+        for path in [path for path in self._cache if path == dir_path or path.startswith(prefix)]:
+            del self._cache[path]
+
+    def _remember(self, dir_path: str, dir_id: int):
+        self._cache[dir_path] = dir_id
+        if len(self._cache) > self.max_cached:
+            self._cache.popitem(last=False)
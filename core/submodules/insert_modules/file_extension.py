@@ -0,0 +1,5 @@
+import os
+
+def file_extension(filename: str) -> str:
+    """Extensão normalizada: a partir do último ponto e em minúsculas ('a.tar.gz' -> '.gz')."""
+    return os.path.splitext(filename)[1].lower()
@@ -1,17 +1,40 @@
 import sqlite3
 from typing import Optional
+from core.submodules.insert_modules.file_extension import file_extension
+from core.submodules.insert_modules.directory_ids import DirectoryIds
+from core.submodules.search_modules.to_epoch import to_epoch
 
 def insert_record_func(indexer, filename: str, full_path: str, parent_path: Optional[str],
-                      file_size: Optional[int], modified_date: Optional[str], item_type: str):
+                      file_size: Optional[int], modified_date: Optional[str], item_type: str,
+                      mtime: Optional[int] = None):
+    # full_path não é gravado: a linha guarda o id da pasta pai e o nome.
+    extension = file_extension(filename) if item_type == 'file' else None
+    # Sem mtime, ele vem de modified_date (hora local), como na migração da coluna;
+    # linhas com mtime NULL ficam fora das buscas e ordens por data.
+    if mtime is None and modified_date:
+        try:
+            mtime = to_epoch(modified_date)
+        except ValueError:
+            pass
     conn = indexer.get_db_connection()
     cursor = conn.cursor()
     try:
+        dir_id = DirectoryIds(cursor).get(parent_path)
         cursor.execute('''
-            INSERT OR REPLACE INTO files 
-            (filename, full_path, parent_path, file_size, modified_date, item_type)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (filename, full_path, parent_path, file_size, modified_date, item_type))
+            INSERT INTO files 
+            (filename, dir_id, file_size, modified_date, mtime, item_type, extension)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(dir_id, filename) DO UPDATE SET
+                file_size = excluded.file_size,
+                modified_date = excluded.modified_date,
+                mtime = excluded.mtime,
+                item_type = excluded.item_type,
+                extension = excluded.extension,
+                indexed_date = CURRENT_TIMESTAMP
+        ''', (filename, dir_id, file_size, modified_date, mtime, item_type, extension))
         conn.commit()
+        indexer.bump_index_generation()
     except sqlite3.Error as e:
+        conn.rollback()
         indexer.logger.error(f"Erro ao inserir registro: {e}")
         raise
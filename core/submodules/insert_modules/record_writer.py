@@ -0,0 +1,198 @@
+import sqlite3
+import threading
+import time
+from queue import Queue, Empty
+from typing import List, Optional, Tuple
+from core.submodules.db_modules.open_connection import open_db_connection_func
+from core.submodules.insert_modules.write_records import write_records_func
+from core.submodules.insert_modules.write_directories import write_directories_func
+from core.submodules.insert_modules.write_folders import write_folders_func
+from core.submodules.insert_modules.touch_records import touch_records_func
+from core.submodules.insert_modules.touch_subtree import touch_subtree_func
+from core.submodules.insert_modules.touch_directory import touch_directory_func
+from core.submodules.insert_modules.sweep_directory import sweep_directory_func
+from core.submodules.insert_modules.directory_ids import DirectoryIds
+
+_STOP = object()
+_FILES = 'files'
+_FOLDERS = 'folders'
+_TOUCH = 'touch'
+_TOUCH_SUBTREE = 'touch_subtree'
+_TOUCH_DIRECTORY = 'touch_directory'
+_FINISH_DIRECTORY = 'finish_directory'
+
+class RecordWriter:
+    """Única thread que escreve no banco durante um escaneamento.
+
+    Recebe lotes de registros por uma fila limitada e agrupa tudo em transações
+    grandes, fazendo commit a cada `commit_rows` linhas ou `commit_interval` segundos.
+    Com `sorted_load`, as linhas de cada transação são acumuladas e gravadas em
+    ordem de caminho, para que o índice UNIQUE (dir_id, filename) cresça de forma
+    sequencial.
+    Os itens são gravados na ordem da fila, então o mtime e a limpeza de uma pasta
+    enviados depois dos seus arquivos nunca são confirmados antes deles.
+    Toda linha gravada ou marcada recebe `generation`, a geração do escaneamento.
+    Na carga em massa o índice começa vazio, então a limpeza por pasta é pulada e
+    fica para o sweep_subtree no fim do escaneamento.
+    O checkpoint automático do WAL fica desligado nesta conexão: a cada
+    `checkpoint_interval` segundos um checkpoint PASSIVE copia para o banco o que
+    as leituras em andamento já não precisam, sem esperar por elas, e no fim um
+    TRUNCATE devolve o WAL ao tamanho zero.
+    Cada commit incrementa a geração do índice, invalidando o cache de buscas.
+    """
+
+    def __init__(self, indexer, commit_rows: int, commit_interval: float,
+                 sorted_load: bool = False, generation: int = 0, queue_size: int = 16,
+                 checkpoint_interval: float = 10.0):
+        self.indexer = indexer
+        self.sorted_load = sorted_load
+        self.generation = generation
+        self.commit_rows = max(1, commit_rows)
+        self.commit_interval = commit_interval
+        self.checkpoint_interval = checkpoint_interval
+        self.rows_written = 0
+        self.rows_deleted = 0
+        self.error: Optional[BaseException] = None
+        self._queue = Queue(maxsize=queue_size)
+        self._directory_ids: Optional[DirectoryIds] = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def put(self, records: List[Tuple]):
+        if records:
+            self._put((_FILES, records))
+
+    def put_folders(self, dir_path: str, folder_names: List[str]):
+        if folder_names:
+            self._put((_FOLDERS, (dir_path, folder_names)))
+
+    def touch(self, paths: List[str]):
+        if paths:
+            self._put((_TOUCH, paths))
+
+    def touch_subtree(self, dir_path: str):
+        self._put((_TOUCH_SUBTREE, dir_path))
+
+    def touch_directory(self, dir_path: str):
+        self._put((_TOUCH_DIRECTORY, dir_path))
+
+    def finish_directory(self, directory_record: Tuple, removed_subdirs: List[str]):
+        self._put((_FINISH_DIRECTORY, (directory_record, removed_subdirs)))
+
+    def _put(self, item: Tuple):
+        if self.error:
+            raise self.error
+        self._queue.put(item)
+
+    def close(self):
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        if self.error:
+            raise self.error
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            try:
+                self.close()
+            except Exception:
+                pass
+        return False
+
+    def _run(self):
+        conn = open_db_connection_func(self.indexer)
+        cursor = conn.cursor()
+        cursor.execute('PRAGMA wal_autocheckpoint = 0')
+        self._directory_ids = DirectoryIds(cursor)
+        pending_rows = 0
+        sorted_buffer = []
+        last_commit = time.monotonic()
+        last_checkpoint = last_commit
+        try:
+            while True:
+                timeout = None
+                if pending_rows:
+                    timeout = max(0.0, self.commit_interval - (time.monotonic() - last_commit))
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except Empty:
+                    item = None
+
+                if item is _STOP:
+                    break
+                if item:
+                    pending_rows += self._apply(cursor, item, sorted_buffer)
+
+                if pending_rows and (pending_rows >= self.commit_rows or
+                                     time.monotonic() - last_commit >= self.commit_interval):
+                    self._write_sorted(cursor, sorted_buffer)
+                    conn.commit()
+                    self.indexer.bump_index_generation()
+                    self.rows_written += pending_rows
+                    self.indexer.logger.debug(f"Commit de {pending_rows} registros")
+                    pending_rows = 0
+                    last_commit = time.monotonic()
+                    if last_commit - last_checkpoint >= self.checkpoint_interval:
+                        self._checkpoint(cursor, 'PASSIVE')
+                        last_checkpoint = time.monotonic()
+
+            self._write_sorted(cursor, sorted_buffer)
+            conn.commit()
+            self.indexer.bump_index_generation()
+            self.rows_written += pending_rows
+            self._checkpoint(cursor, 'TRUNCATE')
+        except Exception as e:
+            self.error = e
+            self.indexer.logger.error(f"Erro ao inserir lote de registros: {e}")
+            # Continua consumindo a fila para que os produtores não fiquem bloqueados.
+            while self._queue.get() is not _STOP:
+                pass
+        finally:
+            conn.close()
+
+    def _checkpoint(self, cursor, mode: str):
+        try:
+            cursor.execute(f'PRAGMA wal_checkpoint({mode})')
+            busy, wal_pages, checkpointed_pages = cursor.fetchone()
+            self.indexer.logger.debug(f"Checkpoint {mode} do WAL: {checkpointed_pages}/{wal_pages} páginas"
+                                      f"{' (leituras em andamento)' if busy else ''}")
+        except sqlite3.Error as e:
+            self.indexer.logger.warning(f"Checkpoint do WAL não concluído: {e}")
+
+    def _apply(self, cursor, item: Tuple, sorted_buffer: List[Tuple]) -> int:
+        kind, payload = item
+        if kind == _FILES:
+            if self.sorted_load:
+                sorted_buffer.extend(payload)
+                return len(payload)
+            return write_records_func(self.indexer, cursor, payload, self.generation, self._directory_ids)
+        if kind == _FOLDERS:
+            dir_path, folder_names = payload
+            return write_folders_func(self.indexer, cursor, dir_path, folder_names, self.generation,
+                                      self._directory_ids)
+        if kind == _TOUCH:
+            return touch_records_func(self.indexer, cursor, payload, self.generation, self._directory_ids)
+        if kind == _TOUCH_SUBTREE:
+            return touch_subtree_func(self.indexer, cursor, payload, self.generation)
+        if kind == _TOUCH_DIRECTORY:
+            return touch_directory_func(self.indexer, cursor, payload, self.generation, self._directory_ids)
+        directory_record, removed_subdirs = payload
+        if not self.sorted_load:
+            self.rows_deleted += sweep_directory_func(self.indexer, cursor, directory_record[0],
+                                                      self.generation, removed_subdirs, self._directory_ids)
+        return write_directories_func(self.indexer, cursor, [directory_record], self.generation,
+                                      self._directory_ids)
+
+    def _write_sorted(self, cursor, sorted_buffer: List[Tuple]):
+        if sorted_buffer:
+            sorted_buffer.sort(key=lambda record: record[1])
+            write_records_func(self.indexer, cursor, sorted_buffer, self.generation, self._directory_ids)
+            sorted_buffer.clear()
@@ -0,0 +1,30 @@
+from typing import List
+from core.submodules.db_modules.path_range import subtree_range
+from core.submodules.insert_modules.directory_ids import DirectoryIds
+
+SUBTREE_DIRECTORY_IDS_SQL = "SELECT id FROM directories WHERE path = ? OR (path >= ? AND path < ?)"
+
+def sweep_directory_func(indexer, cursor, dir_path: str, generation: int,
+                         removed_subdirs: List[str], directory_ids: DirectoryIds = None) -> int:
+    # Depois que a listagem de uma pasta foi inteiramente gravada, tudo nela (arquivos
+    # e subpastas) que não recebeu a geração atual deixou de existir. Subpastas
+    # removidas levam junto a subárvore inteira (linhas de files e de directories).
+    if directory_ids is None:
+        directory_ids = DirectoryIds(cursor)
+    dir_id = directory_ids.lookup(dir_path)
+    if dir_id is None:
+        return 0
+    cursor.execute(
+        "DELETE FROM files WHERE dir_id = ? AND scan_generation < ?",
+        (dir_id, generation)
+    )
+    deleted = cursor.rowcount
+    for subdir in removed_subdirs:
+        low, high = subtree_range(subdir)
+        cursor.execute(f"DELETE FROM files WHERE dir_id IN ({SUBTREE_DIRECTORY_IDS_SQL})",
+                       (subdir, low, high))
+        deleted += cursor.rowcount
+        cursor.execute("DELETE FROM directories WHERE path = ? OR (path >= ? AND path < ?)",
+                       (subdir, low, high))
+        directory_ids.forget_subtree(subdir)
+    return deleted
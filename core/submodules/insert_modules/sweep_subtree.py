@@ -0,0 +1,28 @@
+import sqlite3
+from core.submodules.db_modules.path_range import subtree_range
+
+def sweep_subtree_func(indexer, network_path: str, generation: int) -> int:
+    low, high = subtree_range(network_path)
+    conn = indexer.get_db_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute('''
+            DELETE FROM files
+            WHERE dir_id IN (SELECT id FROM directories WHERE path = ? OR (path >= ? AND path < ?))
+              AND scan_generation < ?
+        ''', (network_path, low, high, generation))
+        deleted = cursor.rowcount
+        # Pastas que não foram vistas saem junto com o que ainda restar nelas.
+        cursor.execute('''
+            DELETE FROM files
+            WHERE dir_id IN (SELECT id FROM directories WHERE path >= ? AND path < ? AND scan_generation < ?)
+        ''', (low, high, generation))
+        deleted += cursor.rowcount
+        cursor.execute("DELETE FROM directories WHERE path >= ? AND path < ? AND scan_generation < ?",
+                       (low, high, generation))
+        conn.commit()
+        indexer.bump_index_generation()
+        return deleted
+    except sqlite3.Error as e:
+        indexer.logger.error(f"Erro ao remover registros antigos de {network_path}: {e}")
+        raise
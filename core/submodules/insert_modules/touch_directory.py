@@ -0,0 +1,15 @@
+from core.submodules.insert_modules.directory_ids import DirectoryIds
+
+def touch_directory_func(indexer, cursor, dir_path: str, generation: int,
+                         directory_ids: DirectoryIds = None) -> int:
+    # Usado para pastas puladas no modo incremental (mtime sem mudança): a pasta
+    # e os itens diretamente nela continuam no índice sem serem regravados. As
+    # subpastas são percorridas e marcadas por conta própria.
+    if directory_ids is None:
+        directory_ids = DirectoryIds(cursor)
+    dir_id = directory_ids.lookup(dir_path)
+    if dir_id is None:
+        return 0
+    cursor.execute("UPDATE directories SET scan_generation = ? WHERE id = ?", (generation, dir_id))
+    cursor.execute("UPDATE files SET scan_generation = ? WHERE dir_id = ?", (generation, dir_id))
+    return cursor.rowcount
@@ -0,0 +1,17 @@
+import os
+from typing import List
+from core.submodules.insert_modules.directory_ids import DirectoryIds
+
+def touch_records_func(indexer, cursor, paths: List[str], generation: int,
+                       directory_ids: DirectoryIds = None) -> int:
+    # Marca como vistos arquivos que existem mas não foram regravados
+    # (sem alteração no modo incremental ou com erro de stat).
+    if directory_ids is None:
+        directory_ids = DirectoryIds(cursor)
+    rows = []
+    for path in paths:
+        dir_id = directory_ids.lookup(os.path.dirname(path))
+        if dir_id is not None:
+            rows.append((generation, dir_id, os.path.basename(path)))
+    cursor.executemany("UPDATE files SET scan_generation = ? WHERE dir_id = ? AND filename = ?", rows)
+    return len(paths)
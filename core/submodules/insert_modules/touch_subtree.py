@@ -0,0 +1,14 @@
+from core.submodules.db_modules.path_range import subtree_range
+
+def touch_subtree_func(indexer, cursor, dir_path: str, generation: int) -> int:
+    # Usado quando uma pasta não pôde ser listada: o que já estava indexado
+    # abaixo dela (arquivos e as próprias pastas) é mantido em vez de ser tratado
+    # como removido.
+    low, high = subtree_range(dir_path)
+    cursor.execute("UPDATE directories SET scan_generation = ? WHERE path = ? OR (path >= ? AND path < ?)",
+                   (generation, dir_path, low, high))
+    cursor.execute('''
+        UPDATE files SET scan_generation = ?
+        WHERE dir_id IN (SELECT id FROM directories WHERE path = ? OR (path >= ? AND path < ?))
+    ''', (generation, dir_path, low, high))
+    return cursor.rowcount
@@ -0,0 +1,13 @@
+from typing import List, Tuple
+from core.submodules.insert_modules.directory_ids import DirectoryIds
+
+def write_directories_func(indexer, cursor, directory_records: List[Tuple], generation: int = 0,
+                           directory_ids: DirectoryIds = None) -> int:
+    # Grava o mtime de pastas já listadas por completo; a linha pode já existir,
+    # criada quando os primeiros arquivos dela foram gravados.
+    if directory_ids is None:
+        directory_ids = DirectoryIds(cursor)
+    cursor.executemany("UPDATE directories SET mtime_ns = ?, scan_generation = ? WHERE id = ?",
+                       [(mtime_ns, generation, directory_ids.get(path))
+                        for path, mtime_ns in directory_records])
+    return len(directory_records)
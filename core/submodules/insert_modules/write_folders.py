@@ -0,0 +1,26 @@
+from typing import List
+from core.submodules.insert_modules.directory_ids import DirectoryIds
+
+INSERT_FOLDERS_SQL = '''
+    INSERT INTO files (filename, dir_id, item_type, scan_generation)
+    VALUES (?, ?, 'folder', ?)
+    ON CONFLICT(dir_id, filename) DO UPDATE SET
+        file_size = NULL,
+        modified_date = NULL,
+        mtime = NULL,
+        item_type = 'folder',
+        extension = NULL,
+        scan_generation = excluded.scan_generation,
+        indexed_date = CURRENT_TIMESTAMP
+'''
+
+def write_folders_func(indexer, cursor, dir_path: str, folder_names: List[str], generation: int = 0,
+                       directory_ids: DirectoryIds = None) -> int:
+    # Grava as subpastas de `dir_path` como linhas item_type='folder' de files.
+    if not folder_names:
+        return 0
+    if directory_ids is None:
+        directory_ids = DirectoryIds(cursor)
+    dir_id = directory_ids.get(dir_path)
+    cursor.executemany(INSERT_FOLDERS_SQL, [(name, dir_id, generation) for name in folder_names])
+    return len(folder_names)
@@ -0,0 +1,34 @@
+import os
+from typing import List, Tuple
+from core.submodules.insert_modules.file_extension import file_extension
+from core.submodules.insert_modules.directory_ids import DirectoryIds
+
+# UPSERT em vez de INSERT OR REPLACE: a linha mantém o mesmo id (o REPLACE apaga e
+# reinsere sem disparar triggers de DELETE). A chave é (dir_id, filename): o
+# caminho completo não é guardado em files, só o id da pasta e o nome.
+INSERT_FILES_SQL = '''
+    INSERT INTO files 
+    (filename, dir_id, file_size, modified_date, mtime, item_type, scan_generation, extension)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(dir_id, filename) DO UPDATE SET
+        file_size = excluded.file_size,
+        modified_date = excluded.modified_date,
+        mtime = excluded.mtime,
+        item_type = excluded.item_type,
+        scan_generation = excluded.scan_generation,
+        extension = excluded.extension,
+        indexed_date = CURRENT_TIMESTAMP
+'''
+
+def write_records_func(indexer, cursor, batch_data: List[Tuple], generation: int = 0,
+                       directory_ids: DirectoryIds = None) -> int:
+    # Usa sempre o mesmo SQL para o sqlite3 reaproveitar o statement preparado.
+    if directory_ids is None:
+        directory_ids = DirectoryIds(cursor)
+    records_to_insert = [
+        (filename, directory_ids.get(os.path.dirname(full_path)), file_size, modified_date, mtime,
+         'file', generation, file_extension(filename))
+        for filename, full_path, file_size, modified_date, mtime in batch_data
+    ]
+    cursor.executemany(INSERT_FILES_SQL, records_to_insert)
+    return len(records_to_insert)
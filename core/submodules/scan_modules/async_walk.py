@@ -0,0 +1,114 @@
+import os
+import threading
+from queue import Queue, Full
+from typing import Iterator, List, Optional, Tuple
+
+_WALK_DONE = object()
+STAT_BATCH_SIZE = 64
+
+def _stat_entries(entries: List[os.DirEntry]):
+    for entry in entries:
+        try:
+            entry.stat()
+        except OSError:
+            pass
+
+def async_walk_func(indexer, network_path: str, max_in_flight: int = 128, incremental: bool = False,
+                    resume_generation: Optional[int] = None, stat_files: bool = True) -> Iterator[Tuple[str, List, Optional[List[os.DirEntry]], Optional[int]]]:
+    # Mesmo contrato do parallel_walk, com a travessia num loop asyncio: as pastas
+    # pendentes e as chamadas em andamento são corrotinas, não threads bloqueadas
+    # esperando a vez. Cada listagem e cada lote de STAT_BATCH_SIZE stats é uma
+    # operação no executor, com no máximo `max_in_flight` ao mesmo tempo; assim
+    # os stats de uma pasta grande também rodam em paralelo, o que faz diferença
+    # quando cada chamada leva um round-trip da rede. Com `stat_files=False`
+    # (escaneamento só de pastas) os stats não são feitos.
+    # Diferente do parallel_walk, não há ConcurrencyController: `max_in_flight` é
+    # um limite fixo, e min_workers, adaptive_concurrency e max_parallel_listings
+    # são ignorados por este motor.
+    # asyncio só é importado quando este motor é usado, para não pesar na abertura do menu.
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+    max_in_flight = max(1, max_in_flight)
+    results = Queue(maxsize=max_in_flight)
+    stop_event = threading.Event()
+    walk_errors = []
+
+    async def put(item) -> bool:
+        # O consumidor está em outra thread; a fila cheia segura as corrotinas sem
+        # bloquear o loop.
+        while not stop_event.is_set():
+            try:
+                results.put_nowait(item)
+                return True
+            except Full:
+                await asyncio.sleep(0.01)
+        return False
+
+    async def walk():
+        loop = asyncio.get_running_loop()
+        in_flight = asyncio.Semaphore(max_in_flight)
+        pending = asyncio.LifoQueue()
+
+        async def run(function, *args):
+            async with in_flight:
+                return await loop.run_in_executor(executor, function, *args)
+
+        async def visit(root: str):
+            dirs, files, mtime_ns = await run(indexer.list_directory, root, incremental, resume_generation)
+            if files and stat_files:
+                await asyncio.gather(*(run(_stat_entries, files[start:start + STAT_BATCH_SIZE])
+                                       for start in range(0, len(files), STAT_BATCH_SIZE)))
+            for entry in reversed(dirs):
+                try:
+                    if not entry.is_symlink():
+                        pending.put_nowait(entry.path)
+                except OSError:
+                    pass
+            await put((root, dirs, files, mtime_ns))
+
+        async def worker():
+            while True:
+                root = await pending.get()
+                try:
+                    if not stop_event.is_set():
+                        await visit(root)
+                except Exception as e:
+                    indexer.logger.error(f"Erro ao percorrer {root}: {e}")
+                finally:
+                    pending.task_done()
+
+        pending.put_nowait(network_path)
+        with ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix='async-walk') as executor:
+            workers = [asyncio.create_task(worker()) for _ in range(max_in_flight)]
+            await pending.join()
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    def run_loop():
+        try:
+            asyncio.run(walk())
+        except Exception as e:
+            walk_errors.append(e)
+        finally:
+            results.put(_WALK_DONE)
+
+    threading.Thread(target=run_loop, daemon=True).start()
+
+    finished = False
+    try:
+        while True:
+            item = results.get()
+            if item is _WALK_DONE:
+                finished = True
+                break
+            yield item
+        # Uma falha do loop não pode parecer uma travessia completa, ou a limpeza
+        # apagaria o que não foi visto.
+        if walk_errors:
+            raise walk_errors[0]
+    finally:
+        if not finished:
+            stop_event.set()
+            while results.get() is not _WALK_DONE:
+                pass
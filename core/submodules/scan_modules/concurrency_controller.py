@@ -0,0 +1,133 @@
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+class _Operation:
+    __slots__ = ('items',)
+
+    def __init__(self):
+        self.items = 1
+
+class ConcurrencyController:
+    """Limite ajustável de operações simultâneas para um pool de threads de escaneamento.
+
+    As threads do pool são criadas no máximo configurado, mas só `limit` delas
+    executam uma operação (listagem ou stat) ao mesmo tempo. A cada janela de
+    medição o controlador compara a vazão (itens por segundo) com a melhor vista
+    até então e sobe ou desce o limite em direção ao ponto em que mais threads
+    deixam de render mais vazão: num SSD local ele fica baixo, num
+    compartilhamento com latência alta ele sobe até onde a rede responder.
+    Quando uma tentativa não melhora, o limite volta ao melhor nível e fica
+    parado por `hold_windows` janelas antes de testar de novo na outra direção.
+    Com `adaptive=False` o limite fica fixo em `max_limit`.
+    """
+
+    def __init__(self, name: str, logger, min_limit: int, max_limit: int, adaptive: bool = True,
+                 initial_limit: Optional[int] = None, window_seconds: float = 0.5,
+                 tolerance: float = 0.05, hold_windows: int = 10):
+        self.name = name
+        self.logger = logger
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.adaptive = adaptive and self.min_limit < self.max_limit
+        if not self.adaptive:
+            initial_limit = self.max_limit
+        elif initial_limit is None:
+            initial_limit = 4
+        self.limit = max(self.min_limit, min(initial_limit, self.max_limit))
+        self.window_seconds = window_seconds
+        self.tolerance = tolerance
+        self.hold_windows = hold_windows
+        self.total_items = 0
+        self.total_operations = 0
+        self.total_latency = 0.0
+        self._condition = threading.Condition()
+        self._active = 0
+        self._started = time.monotonic()
+        self._window_start = self._started
+        self._window_items = 0
+        self._window_operations = 0
+        self._direction = 1
+        self._best_limit = self.limit
+        self._best_rate = 0.0
+        self._held_windows = 0
+
+    @contextmanager
+    def slot(self):
+        # Envolve uma operação. O objeto devolvido tem `items`, quanto trabalho ela
+        # representou (ex.: as entradas de uma pasta listada), usado na vazão.
+        with self._condition:
+            while self._active >= self.limit:
+                self._condition.wait()
+            self._active += 1
+        operation = _Operation()
+        start = time.monotonic()
+        try:
+            yield operation
+        finally:
+            latency = time.monotonic() - start
+            items = operation.items
+            with self._condition:
+                self._active -= 1
+                self.total_items += items
+                self.total_operations += 1
+                self.total_latency += latency
+                self._window_items += items
+                self._window_operations += 1
+                if self.adaptive:
+                    self._maybe_adjust()
+                self._condition.notify_all()
+
+    def _maybe_adjust(self):
+        now = time.monotonic()
+        elapsed = now - self._window_start
+        # Janelas curtas ou com poucas operações dão medidas instáveis.
+        if elapsed < self.window_seconds or self._window_operations < 2 * self.limit:
+            return
+        rate = self._window_items / elapsed
+        self._window_start = now
+        self._window_items = 0
+        self._window_operations = 0
+
+        if self._held_windows:
+            self._held_windows -= 1
+            if not self._held_windows:
+                # Fim da pausa: o ambiente pode ter mudado, então a medida atual
+                # vira a referência e o próximo teste vai na direção oposta ao último.
+                self._best_limit, self._best_rate = self.limit, rate
+                self._set_limit(self._step(self._direction))
+            return
+
+        if self._direction > 0:
+            improved = rate > self._best_rate * (1 + self.tolerance)
+        else:
+            improved = rate >= self._best_rate * (1 - self.tolerance)
+        if improved:
+            self._best_limit = self.limit
+            self._best_rate = max(self._best_rate, rate)
+            next_limit = self._step(self._direction)
+            if next_limit != self.limit:
+                self._set_limit(next_limit)
+                return
+        self._direction = -self._direction
+        self._held_windows = self.hold_windows
+        self._set_limit(self._best_limit)
+
+    def _step(self, direction: int) -> int:
+        if direction > 0:
+            return min(self.max_limit, max(self.limit + 1, math.ceil(self.limit * 1.5)))
+        return max(self.min_limit, min(self.limit - 1, math.floor(self.limit / 1.5)))
+
+    def _set_limit(self, limit: int):
+        if limit != self.limit:
+            self.logger.debug(f"Concorrência de {self.name}: {self.limit} -> {limit}")
+            self.limit = limit
+
+    def log_summary(self):
+        elapsed = max(time.monotonic() - self._started, 1e-9)
+        average_latency = self.total_latency / self.total_operations * 1000 if self.total_operations else 0.0
+        mode = f"adaptativa, faixa {self.min_limit}-{self.max_limit}" if self.adaptive else "fixa"
+        self.logger.info(f"Concorrência de {self.name}: {self.limit} ({mode}); "
+                         f"{self.total_items / elapsed:.0f} itens/s, latência média {average_latency:.1f} ms")
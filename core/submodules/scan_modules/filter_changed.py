@@ -0,0 +1,28 @@
+import os
+import sqlite3
+from itertools import groupby
+from typing import List, Tuple
+
+def filter_changed_records_func(indexer, batch_data: List[Tuple]) -> List[Tuple]:
+    if not batch_data:
+        return batch_data
+    conn = indexer.get_db_connection()
+    cursor = conn.cursor()
+    stored = {}
+    try:
+        # Os blocos chegam por pasta, então normalmente há um único grupo.
+        for dir_path, records in groupby(batch_data, key=lambda record: os.path.dirname(record[1])):
+            names = [record[0] for record in records]
+            placeholders = ','.join('?' * len(names))
+            cursor.execute(f'''
+                SELECT files.filename, files.file_size, files.modified_date
+                FROM directories JOIN files ON files.dir_id = directories.id
+                WHERE directories.path = ? AND files.filename IN ({placeholders})
+            ''', [dir_path] + names)
+            stored.update(((dir_path, filename), (file_size, modified_date))
+                          for filename, file_size, modified_date in cursor)
+    except sqlite3.Error as e:
+        indexer.logger.error(f"Erro ao comparar registros com o índice: {e}")
+        return batch_data
+    return [record for record in batch_data
+            if stored.get((os.path.dirname(record[1]), record[0])) != (record[2], record[3])]
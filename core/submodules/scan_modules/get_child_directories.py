@@ -0,0 +1,16 @@
+import sqlite3
+from typing import List
+
+def get_child_directories_func(indexer, dir_path: str) -> List[str]:
+    conn = indexer.get_db_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute('''
+            SELECT child.path FROM directories AS parent
+            JOIN directories AS child ON child.parent_id = parent.id
+            WHERE parent.path = ?
+        ''', (dir_path,))
+        return [row[0] for row in cursor.fetchall()]
+    except sqlite3.Error as e:
+        indexer.logger.error(f"Erro ao consultar subpastas de {dir_path}: {e}")
+        return []
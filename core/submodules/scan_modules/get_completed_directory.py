@@ -0,0 +1,25 @@
+import os
+import sqlite3
+from typing import List, Optional, Tuple
+
+def get_completed_directory_func(indexer, dir_path: str, generation: int) -> Optional[Tuple[List[str], int]]:
+    # Se `dir_path` já foi concluída pelo escaneamento `generation`, retorna as
+    # subpastas gravadas na listagem dela e o mtime; senão, None. As subpastas vêm
+    # das linhas 'folder' de files porque as que ainda não foram escaneadas podem
+    # não ter linha em directories.
+    conn = indexer.get_db_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute('''
+            SELECT id, mtime_ns FROM directories
+            WHERE path = ? AND scan_generation = ? AND mtime_ns IS NOT NULL
+        ''', (dir_path, generation))
+        row = cursor.fetchone()
+        if not row:
+            return None
+        dir_id, mtime_ns = row
+        cursor.execute("SELECT filename FROM files WHERE dir_id = ? AND +item_type = 'folder'", (dir_id,))
+        return [os.path.join(dir_path, name) for name, in cursor.fetchall()], mtime_ns
+    except sqlite3.Error as e:
+        indexer.logger.error(f"Erro ao consultar pasta {dir_path}: {e}")
+        return None
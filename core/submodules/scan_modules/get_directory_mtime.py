@@ -0,0 +1,13 @@
+import sqlite3
+from typing import Optional
+
+def get_directory_mtime_func(indexer, dir_path: str) -> Optional[int]:
+    conn = indexer.get_db_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT mtime_ns FROM directories WHERE path = ?", (dir_path,))
+        row = cursor.fetchone()
+        return row[0] if row else None
+    except sqlite3.Error as e:
+        indexer.logger.error(f"Erro ao consultar pasta {dir_path}: {e}")
+        return None
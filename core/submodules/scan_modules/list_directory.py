@@ -0,0 +1,60 @@
+import os
+from typing import List, Optional, Tuple
+
+class StoredDirEntry:
+    """Subpasta conhecida pelo índice, usada no lugar do os.DirEntry quando a pasta pai não mudou."""
+    __slots__ = ('name', 'path')
+
+    def __init__(self, path: str):
+        self.path = path
+        self.name = os.path.basename(path)
+
+    def is_dir(self) -> bool:
+        return True
+
+    def is_symlink(self) -> bool:
+        return False
+
+    def stat(self):
+        return os.stat(self.path)
+
+def list_directory_func(indexer, dir_path: str, incremental: bool = False,
+                        resume_generation: Optional[int] = None) -> Tuple[List, Optional[List[os.DirEntry]], Optional[int]]:
+    # Ao retomar um escaneamento, pastas que ele já concluiu não são relidas: as
+    # subpastas vêm do índice e os arquivos já estão gravados.
+    if resume_generation is not None:
+        completed = indexer.get_completed_directory(dir_path, resume_generation)
+        if completed:
+            subdirs, mtime_ns = completed
+            return [StoredDirEntry(path) for path in subdirs], None, mtime_ns
+
+    # O mtime da pasta é lido antes da listagem: uma mudança durante a listagem
+    # deixa o valor gravado desatualizado e a pasta é relida no próximo escaneamento.
+    try:
+        mtime_ns = os.stat(dir_path).st_mtime_ns
+    except OSError as e:
+        indexer.logger.warning(f"Não foi possível listar a pasta {dir_path}: {e}")
+        return [], [], None
+
+    # A pasta só muda de mtime quando entradas são criadas, removidas ou renomeadas;
+    # sem mudança, os arquivos não são listados e as subpastas vêm do próprio índice.
+    if incremental and indexer.get_directory_mtime(dir_path) == mtime_ns:
+        return [StoredDirEntry(path) for path in indexer.get_child_directories(dir_path)], None, mtime_ns
+
+    dirs = []
+    files = []
+    try:
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    dirs.append(entry)
+                else:
+                    files.append(entry)
+    except OSError as e:
+        indexer.logger.warning(f"Não foi possível listar a pasta {dir_path}: {e}")
+        return [], [], None
+    return dirs, files, mtime_ns
@@ -0,0 +1,91 @@
+import os
+import threading
+from queue import Queue
+from typing import Iterator, List, Optional, Tuple
+
+_WALK_DONE = object()
+
+def parallel_walk_func(indexer, network_path: str, max_listings: Optional[int] = None,
+                       incremental: bool = False, resume_generation: Optional[int] = None,
+                       stat_files: bool = True) -> Iterator[Tuple[str, List, Optional[List[os.DirEntry]], Optional[int]]]:
+    # Mesmo contrato do scandir_walk, mas as pastas pendentes ficam numa pilha
+    # compartilhada e todas as threads do pool listam subpastas em paralelo.
+    # Quantas listagens rodam ao mesmo tempo é decidido pelo controlador adaptativo,
+    # até `max_listings` (ou o tamanho do pool). Com `stat_files=False` (escaneamento
+    # só de pastas) os arquivos listados não passam pelo stat antecipado.
+    num_workers = max(1, indexer.max_workers)
+    listing_slots = indexer.concurrency_controller('listagem', min(num_workers, max_listings or num_workers))
+    pending = [network_path]
+    in_progress = 0
+    condition = threading.Condition()
+    stop_event = threading.Event()
+    results = Queue(maxsize=num_workers * 4)
+
+    def walker():
+        nonlocal in_progress
+        while True:
+            with condition:
+                while not pending and in_progress and not stop_event.is_set():
+                    condition.wait()
+                if stop_event.is_set() or not pending:
+                    condition.notify_all()
+                    return
+                root = pending.pop()
+                in_progress += 1
+            try:
+                with listing_slots.slot() as operation:
+                    dirs, files, mtime_ns = indexer.list_directory(root, incremental, resume_generation)
+                    # O DirEntry guarda o resultado do stat; chamá-lo aqui distribui esse
+                    # custo entre as threads e deixa o processamento posterior sem I/O.
+                    if stat_files:
+                        for entry in files or ():
+                            try:
+                                entry.stat()
+                            except OSError:
+                                pass
+                    operation.items += len(files or ())
+                subdirs = []
+                for entry in dirs:
+                    try:
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    except OSError:
+                        pass
+                with condition:
+                    pending.extend(reversed(subdirs))
+                    condition.notify_all()
+                results.put((root, dirs, files, mtime_ns))
+            except Exception as e:
+                indexer.logger.error(f"Erro ao percorrer {root}: {e}")
+            finally:
+                with condition:
+                    in_progress -= 1
+                    condition.notify_all()
+
+    threads = [threading.Thread(target=walker, daemon=True) for _ in range(num_workers)]
+    for thread in threads:
+        thread.start()
+
+    def finisher():
+        for thread in threads:
+            thread.join()
+        listing_slots.log_summary()
+        results.put(_WALK_DONE)
+
+    threading.Thread(target=finisher, daemon=True).start()
+
+    finished = False
+    try:
+        while True:
+            item = results.get()
+            if item is _WALK_DONE:
+                finished = True
+                break
+            yield item
+    finally:
+        if not finished:
+            stop_event.set()
+            with condition:
+                condition.notify_all()
+            while results.get() is not _WALK_DONE:
+                pass
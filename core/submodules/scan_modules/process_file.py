@@ -2,14 +2,16 @@ import os
 import time
 from typing import Optional, Tuple
 
-def process_single_file_func(indexer, filename: str, full_path: str) -> Optional[Tuple]:
+def process_single_file_func(indexer, filename: str, full_path: str,
+                             entry: Optional[os.DirEntry] = None) -> Optional[Tuple]:
     try:
-        stat_info = os.stat(full_path)
+        stat_info = entry.stat() if entry is not None else os.stat(full_path)
         file_size = stat_info.st_size
         modified_date = time.strftime('%Y-%m-%d %H:%M:%S', 
                                     time.localtime(stat_info.st_mtime))
+        mtime = int(stat_info.st_mtime)
         
-        return (filename, full_path, file_size, modified_date)
+        return (filename, full_path, file_size, modified_date, mtime)
         
     except (OSError, PermissionError) as e:
         return None
@@ -0,0 +1,5 @@
+def progress_bar(**kwargs):
+    # O tqdm é importado só quando um escaneamento começa, para não pesar na
+    # abertura do menu.
+    from tqdm import tqdm
+    return tqdm(**kwargs)
@@ -0,0 +1,54 @@
+import sqlite3
+from typing import Optional, Tuple
+from core.submodules.db_modules.path_range import directory_key
+
+# Um escaneamento em andamento por pasta raiz. As pastas já concluídas não precisam
+# de registro próprio: são as linhas de directories com a geração do escaneamento e
+# mtime gravado, confirmadas na mesma transação que os arquivos delas. A fronteira
+# pendente são as subpastas dessas pastas que ainda não chegaram a esse estado.
+CREATE_SCAN_CHECKPOINTS_SQL = '''
+    CREATE TABLE IF NOT EXISTS scan_checkpoints (
+        root_path TEXT PRIMARY KEY,
+        generation INTEGER NOT NULL,
+        bulk_load INTEGER NOT NULL DEFAULT 0,
+        started_date TEXT DEFAULT CURRENT_TIMESTAMP
+    )
+'''
+
+def get_scan_checkpoint_func(indexer, network_path: str) -> Optional[Tuple[int, bool]]:
+    # Retorna (geração, carga em massa) do escaneamento interrompido de `network_path`.
+    conn = indexer.get_db_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT generation, bulk_load FROM scan_checkpoints WHERE root_path = ?",
+                       (directory_key(network_path),))
+        row = cursor.fetchone()
+        return (row[0], bool(row[1])) if row else None
+    except sqlite3.Error as e:
+        indexer.logger.error(f"Erro ao consultar checkpoint de {network_path}: {e}")
+        return None
+
+def save_scan_checkpoint_func(indexer, network_path: str, generation: int, bulk_load: bool):
+    conn = indexer.get_db_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute('''
+            INSERT INTO scan_checkpoints (root_path, generation, bulk_load) VALUES (?, ?, ?)
+            ON CONFLICT(root_path) DO UPDATE SET
+                generation = excluded.generation,
+                bulk_load = excluded.bulk_load,
+                started_date = CURRENT_TIMESTAMP
+        ''', (directory_key(network_path), generation, int(bulk_load)))
+        conn.commit()
+    except sqlite3.Error as e:
+        indexer.logger.error(f"Erro ao gravar checkpoint de {network_path}: {e}")
+        raise
+
+def clear_scan_checkpoint_func(indexer, network_path: str):
+    conn = indexer.get_db_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("DELETE FROM scan_checkpoints WHERE root_path = ?", (directory_key(network_path),))
+        conn.commit()
+    except sqlite3.Error as e:
+        indexer.logger.error(f"Erro ao remover checkpoint de {network_path}: {e}")
@@ -0,0 +1,240 @@
+import threading
+from queue import Queue, Empty, Full
+from typing import Callable, Optional, Tuple
+from core.submodules.db_modules.path_range import directory_key
+
+QUEUE_SIZE = 16
+CHUNK_SIZE = 500
+
+def scan_pipeline_func(indexer, network_path: str,
+                       on_discovered: Optional[Callable[[int], None]] = None,
+                       on_processed: Optional[Callable[[int], None]] = None,
+                       bulk_load: Optional[bool] = None,
+                       incremental: bool = False, resume: bool = True) -> Tuple[int, int]:
+    # Três estágios ligados por filas limitadas: listagem -> stat -> inserção.
+    # A inserção fica a cargo do RecordWriter; quando ele atrasa, as filas enchem e
+    # os estágios anteriores esperam, então a memória não cresce com a árvore.
+    # No modo incremental, pastas com o mesmo mtime não são listadas e só
+    # arquivos novos ou alterados (tamanho/data) são regravados.
+    # As subpastas de cada pasta listada seguem junto com o primeiro bloco dela e
+    # viram linhas item_type='folder' no mesmo writer, então uma única passada
+    # preenche arquivos e pastas.
+    # Cada linha vista recebe a geração deste escaneamento; ao terminar uma pasta,
+    # o que ficou com geração antiga nela (ou em subpastas removidas) é apagado.
+    # Na carga em massa essa limpeza é feita de uma vez para a raiz, no final.
+    # Um checkpoint em scan_checkpoints guarda a geração até a varredura terminar;
+    # se ela for interrompida, o próximo escaneamento da mesma raiz (com `resume`)
+    # reaproveita a geração e pula as pastas que já tinham sido concluídas.
+    # A raiz precisa ter o mesmo caminho que o dirname dos seus arquivos, ou eles
+    # iriam para uma segunda linha em directories (ver directory_key).
+    network_path = directory_key(network_path)
+    checkpoint = indexer.get_scan_checkpoint(network_path) if resume else None
+    if checkpoint:
+        generation, checkpoint_bulk_load = checkpoint
+        if bulk_load is None:
+            bulk_load = checkpoint_bulk_load
+        indexer.logger.info(f"Retomando escaneamento interrompido de {network_path}: "
+                            "pastas já concluídas não serão listadas novamente")
+    else:
+        if bulk_load is None:
+            bulk_load = indexer.is_index_empty()
+        generation = indexer.next_scan_generation()
+        indexer.save_scan_checkpoint(network_path, generation, bulk_load)
+    resume_generation = generation if checkpoint else None
+    num_workers = max(1, indexer.max_workers)
+    stat_slots = indexer.concurrency_controller('stat', num_workers)
+    entry_queue = Queue(maxsize=QUEUE_SIZE)
+    record_queue = Queue(maxsize=QUEUE_SIZE)
+    stop_event = threading.Event()
+
+    def put(queue, item) -> bool:
+        while not stop_event.is_set():
+            try:
+                queue.put(item, timeout=0.5)
+                return True
+            except Full:
+                continue
+        return False
+
+    def get(queue):
+        while not stop_event.is_set():
+            try:
+                return queue.get(timeout=0.5)
+            except Empty:
+                continue
+        return None
+
+    skipped_dirs = 0
+    walk_completed = False
+    failed_dirs = Queue()
+    unchanged_dirs = Queue()
+    worker_errors = []
+
+    def walker():
+        nonlocal skipped_dirs, walk_completed
+        files_found_in_walker = 0
+        walk = indexer.walk_directory(network_path, incremental, resume_generation)
+        try:
+            for root, dirs, files, mtime_ns in walk:
+                if files is None:
+                    # Na carga em massa só o sweep_subtree final limpa o índice: a pasta
+                    # pulada precisa receber a geração nova para não ser apagada nele.
+                    if bulk_load:
+                        unchanged_dirs.put(root)
+                    skipped_dirs += 1
+                    continue
+                # O mtime da pasta e a limpeza dela seguem junto com seus blocos e só
+                # são gravados depois que todos eles chegam ao writer. Se a listagem
+                # falhou, a pasta não é limpa para não apagar o que não foi visto
+                # (na carga em massa, a subárvore é marcada antes da limpeza final).
+                directory_state = None
+                if mtime_ns is None:
+                    if bulk_load:
+                        failed_dirs.put(root)
+                elif bulk_load:
+                    directory_state = ((root, mtime_ns), [])
+                else:
+                    listed_dirs = {entry.path for entry in dirs}
+                    removed_subdirs = [path for path in indexer.get_child_directories(root)
+                                       if path not in listed_dirs]
+                    directory_state = ((root, mtime_ns), removed_subdirs)
+                chunks = [files[start:start + CHUNK_SIZE]
+                          for start in range(0, len(files), CHUNK_SIZE)] or [[]]
+                folder_names = [entry.name for entry in dirs]
+                for chunk in chunks:
+                    if not put(entry_queue, (root, chunk, len(chunks), directory_state, folder_names)):
+                        return
+                    folder_names = []
+                    files_found_in_walker += len(chunk)
+                    if on_discovered and chunk:
+                        on_discovered(len(chunk))
+            walk_completed = True
+        except Exception as e:
+            indexer.logger.error(f"Erro durante coleta de arquivos: {e}")
+        finally:
+            try:
+                walk.close()
+            finally:
+                for _ in range(num_workers):
+                    put(entry_queue, None)
+            indexer.logger.info(f"Coleta de arquivos finalizada. Total de arquivos encontrados pelo coletor: {files_found_in_walker}")
+
+    def stat_worker():
+        # O None final sai mesmo se o worker falhar, ou o loop principal esperaria
+        # por ele para sempre; o erro vai para worker_errors e sobe lá.
+        try:
+            while True:
+                item = get(entry_queue)
+                if item is None:
+                    return
+                root, chunk, total_chunks, directory_state, folder_names = item
+                records = []
+                failed_paths = []
+                chunk_errors = 0
+                with stat_slots.slot() as operation:
+                    for entry in chunk:
+                        try:
+                            result = indexer.process_single_file(entry.name, entry.path, entry)
+                        except Exception as e:
+                            result = None
+                            indexer.logger.error(f"Erro inesperado ao processar arquivo: {e}")
+                        if result:
+                            records.append(result)
+                        else:
+                            failed_paths.append(entry.path)
+                            chunk_errors += 1
+                    operation.items = len(chunk)
+                changed = records
+                touched = failed_paths
+                if incremental:
+                    changed = indexer.filter_changed_records(records)
+                    changed_paths = {record[1] for record in changed}
+                    touched = failed_paths + [record[1] for record in records if record[1] not in changed_paths]
+                if not put(record_queue, (root, records, changed, touched, chunk_errors, total_chunks,
+                                          directory_state, folder_names)):
+                    return
+        except Exception as e:
+            indexer.logger.error(f"Erro no processamento de arquivos: {e}")
+            worker_errors.append(e)
+        finally:
+            put(record_queue, None)
+
+    if bulk_load:
+        indexer.logger.info("Modo de carga em massa: índices secundários serão reconstruídos ao final")
+        indexer.drop_secondary_indexes()
+
+    threads = [threading.Thread(target=walker, daemon=True)]
+    threads += [threading.Thread(target=stat_worker, daemon=True) for _ in range(num_workers)]
+    for thread in threads:
+        thread.start()
+
+    processed_files = 0
+    changed_files = 0
+    indexed_folders = 0
+    errors = 0
+    finished_workers = 0
+    pending_chunks = {}
+    try:
+        with indexer.open_record_writer(bulk_load, generation) as writer:
+            while finished_workers < num_workers:
+                item = record_queue.get()
+                if worker_errors:
+                    raise worker_errors[0]
+                if item is None:
+                    finished_workers += 1
+                    continue
+
+                while not failed_dirs.empty():
+                    writer.touch_subtree(failed_dirs.get())
+                while not unchanged_dirs.empty():
+                    writer.touch_directory(unchanged_dirs.get())
+
+                root, records, changed, touched, chunk_errors, total_chunks, directory_state, folder_names = item
+                writer.put_folders(root, folder_names)
+                writer.put(changed)
+                writer.touch(touched)
+                processed_files += len(records)
+                changed_files += len(changed)
+                indexed_folders += len(folder_names)
+                errors += chunk_errors
+
+                remaining = pending_chunks.pop(root, total_chunks) - 1
+                if remaining:
+                    pending_chunks[root] = remaining
+                elif directory_state:
+                    writer.finish_directory(*directory_state)
+
+                if on_processed:
+                    on_processed(len(records) + chunk_errors)
+
+            while not failed_dirs.empty():
+                writer.touch_subtree(failed_dirs.get())
+            while not unchanged_dirs.empty():
+                writer.touch_directory(unchanged_dirs.get())
+    finally:
+        stop_event.set()
+        for thread in threads:
+            thread.join()
+        if bulk_load:
+            indexer.rebuild_indexes()
+
+    stat_slots.log_summary()
+    rows_deleted = writer.rows_deleted
+    if bulk_load and walk_completed:
+        rows_deleted += indexer.sweep_subtree(network_path, generation)
+    indexer.rollup_folder_sizes(network_path)
+    indexer.refresh_stale_stats()
+    if indexer.filename_snapshot_enabled:
+        indexer.rebuild_filename_snapshot()
+    if walk_completed:
+        indexer.clear_scan_checkpoint(network_path)
+    else:
+        indexer.logger.warning("Escaneamento incompleto: o próximo escaneamento desta pasta continua de onde parou")
+    indexer.logger.info(f"Pastas indexadas: {indexed_folders}")
+    indexer.logger.info(f"Registros removidos (arquivos e pastas que não existem mais): {rows_deleted}")
+
+    if incremental:
+        indexer.logger.info(f"Pastas sem alteração puladas: {skipped_dirs}")
+        indexer.logger.info(f"Arquivos novos ou alterados gravados: {changed_files}")
+
+    return processed_files, errors
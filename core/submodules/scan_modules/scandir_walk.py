@@ -0,0 +1,17 @@
+import os
+from typing import Iterator, List, Optional, Tuple
+
+def scandir_walk_func(indexer, network_path: str, incremental: bool = False,
+                      resume_generation: Optional[int] = None) -> Iterator[Tuple[str, List, Optional[List[os.DirEntry]], Optional[int]]]:
+    # Parecido com o os.walk, mas devolve os DirEntry da listagem para que tipo,
+    # tamanho e data venham do próprio scandir, além do mtime da pasta.
+    # No modo incremental, `files` é None para pastas que não mudaram (e, ao
+    # retomar, para as que o escaneamento `resume_generation` já concluiu).
+    pending = [network_path]
+    while pending:
+        root = pending.pop()
+        dirs, files, mtime_ns = indexer.list_directory(root, incremental, resume_generation)
+        yield root, dirs, files, mtime_ns
+        for entry in reversed(dirs):
+            if not entry.is_symlink():
+                pending.append(entry.path)
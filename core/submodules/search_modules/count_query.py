@@ -0,0 +1,15 @@
+import sqlite3
+from core.submodules.search_modules.query_spec import QuerySpec
+
+def count_query_func(indexer, spec: QuerySpec) -> int:
+    count_sql = f"SELECT COUNT(*) FROM {spec.source} WHERE {spec.where}"
+
+    def fetch():
+        with indexer.read_connection() as conn:
+            return conn.execute(count_sql, spec.params).fetchone()[0]
+
+    try:
+        return indexer.result_cache.get_or_compute(('count', count_sql, spec.params), fetch)
+    except sqlite3.Error as e:
+        indexer.logger.error(f"Erro ao contar resultados: {e}")
+        return 0
@@ -0,0 +1,271 @@
+import bisect
+import mmap
+import os
+import re
+import struct
+import threading
+from array import array
+from typing import Callable, Iterable, List, Optional, Tuple
+
+SNAPSHOT_MAGIC = b'FSINAM02'
+# Os bytes zero no fim do cabeçalho fazem o primeiro nome também vir depois de um '\0'.
+_HEADER = struct.Struct('=8sqq8x')
+_ITEM_SIZE = array('q').itemsize
+_NAME_CHAR = rb'[^\x00]'
+# Um caractere em UTF-8 (o '_' do LIKE casa com caracteres, não com bytes).
+_ONE_CHAR = rb'(?:[\x01-\x7f]|[\xc0-\xff][\x80-\xbf]+)'
+
+def snapshot_path(db_path: str) -> str:
+    return db_path + '.names'
+
+def stale_marker_path(path: str) -> str:
+    return path + '.stale'
+
+def encode_name(name: str) -> bytes:
+    # Minúsculas só no ASCII, a mesma regra do LIKE do SQLite.
+    return name.encode('utf-8', 'replace').lower()
+
+def like_pattern(term: str) -> bytes:
+    # Expressão regular equivalente a LIKE '%termo%', com '%' e '_' como curingas,
+    # que nunca atravessa o separador entre dois nomes.
+    parts = []
+    for char in term:
+        if char == '%':
+            parts.append(_NAME_CHAR + b'*')
+        elif char == '_':
+            parts.append(_ONE_CHAR)
+        else:
+            parts.append(re.escape(encode_name(char)))
+    return b''.join(parts)
+
+def _class_body_start(pattern: str, position: int) -> int:
+    # Um ']' logo depois de '[' ou '[^' faz parte da classe, não a fecha.
+    start = position + 1
+    if pattern.startswith('^', start):
+        start += 1
+    return start
+
+def glob_pattern(pattern: str) -> bytes:
+    # Expressão regular que casa com o nome inteiro em pelo menos todos os nomes
+    # que `pattern` casaria no GLOB: as letras são comparadas em minúsculas e '?'
+    # ou uma classe '[...]' aceitam qualquer caractere (até 4 bytes em UTF-8).
+    # O resultado é um conjunto de candidatos, conferido depois pelo GLOB.
+    # Um '*' inicial vira busca sem âncora, que o motor de regex acelera pelo
+    # primeiro trecho fixo em vez de tentar casar a partir de cada byte.
+    stripped = pattern.lstrip('*')
+    parts = [] if len(stripped) < len(pattern) else [rb'(?<![^\x00])']
+    pattern = stripped
+    position = 0
+    while position < len(pattern):
+        char = pattern[position]
+        if char == '*':
+            parts.append(_NAME_CHAR + b'*')
+        elif char == '?':
+            parts.append(_NAME_CHAR + b'{1,4}')
+        elif char == '[' and ']' in pattern[_class_body_start(pattern, position) + 1:]:
+            parts.append(_NAME_CHAR + b'{1,4}')
+            position = pattern.index(']', _class_body_start(pattern, position) + 1)
+        else:
+            parts.append(re.escape(encode_name(char)))
+        position += 1
+    parts.append(rb'(?=\x00)')
+    return b''.join(parts)
+
+def write_filename_snapshot(path: str, rows: Iterable[Tuple[int, str]]) -> int:
+    # Formato: cabeçalho (assinatura, quantidade, tamanho do bloco de nomes), os
+    # nomes em minúsculas terminados em '\0' um atrás do outro, e os arrays de
+    # ids (files.id) e de início de cada nome, com um deslocamento extra no fim.
+    ids = array('q')
+    offsets = array('q')
+    position = 0
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(SNAPSHOT_MAGIC, 0, 0))
+        for row_id, name in rows:
+            data = encode_name(name) + b'\0'
+            ids.append(row_id)
+            offsets.append(position)
+            f.write(data)
+            position += len(data)
+        offsets.append(position)
+        f.write(b'\0' * (-position % _ITEM_SIZE))
+        ids.tofile(f)
+        offsets.tofile(f)
+        f.seek(0)
+        f.write(_HEADER.pack(SNAPSHOT_MAGIC, len(ids), position))
+    return len(ids)
+
+def _file_stamp(stat_result) -> Tuple[int, int, int]:
+    return stat_result.st_ino, stat_result.st_size, stat_result.st_mtime_ns
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+class FilenameSnapshot:
+    """Todos os nomes do índice num arquivo mapeado em memória, para busca por trecho.
+
+    Os nomes ficam num único bloco contíguo, então uma busca é um `find` (ou uma
+    expressão regular) sobre o bloco inteiro, sem decodificar linhas do SQLite;
+    cada ocorrência vira o índice do nome por busca binária nos deslocamentos e
+    daí o files.id. O arquivo é aberto com mmap: carregar leva milissegundos e as
+    páginas ficam no cache do sistema, não em objetos Python.
+    O snapshot vale para o índice como estava quando foi gerado; `invalidate()`
+    o fecha e apaga o arquivo assim que o índice muda, e as buscas voltam ao
+    SQLite até a próxima reconstrução.
+    No Windows o arquivo não pode ser apagado nem substituído enquanto outro
+    processo o mantém mapeado; nesse caso fica um marcador '.stale' ao lado dele.
+    `is_current()` confere o marcador e se o arquivo ainda é o que foi aberto,
+    então nenhum processo usa um snapshot que outro invalidou ou trocou.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.stale_path = stale_marker_path(path)
+        self.count = 0
+        self._lock = threading.Lock()
+        self._file = None
+        self._mmap = None
+        self._ids = None
+        self._offsets = None
+        self._base = _HEADER.size
+        self._end = _HEADER.size
+        self._file_stamp = None
+
+    def load(self) -> bool:
+        with self._lock:
+            self._close()
+            try:
+                self._open()
+            except (OSError, ValueError):
+                self._close()
+            return self._mmap is not None
+
+    def is_loaded(self) -> bool:
+        return self._mmap is not None
+
+    def is_current(self) -> bool:
+        # Carregado, sem marcador de desatualizado e ainda o mesmo arquivo (outro
+        # processo pode tê-lo apagado ou trocado depois de uma gravação).
+        if self._mmap is None or os.path.exists(self.stale_path):
+            return False
+        try:
+            return _file_stamp(os.stat(self.path)) == self._file_stamp
+        except OSError:
+            return False
+
+    def _open(self):
+        if os.path.exists(self.stale_path):
+            raise ValueError(f"Snapshot de nomes desatualizado: {self.path}")
+        self._file = open(self.path, 'rb')
+        self._file_stamp = _file_stamp(os.fstat(self._file.fileno()))
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count, blob_length = _HEADER.unpack_from(self._mmap)
+        ids_start = self._base + blob_length + (-blob_length % _ITEM_SIZE)
+        offsets_start = ids_start + count * _ITEM_SIZE
+        if magic != SNAPSHOT_MAGIC or offsets_start + (count + 1) * _ITEM_SIZE != len(self._mmap):
+            raise ValueError(f"Snapshot de nomes inválido: {self.path}")
+        view = memoryview(self._mmap)
+        self._ids = view[ids_start:offsets_start].cast('q')
+        self._offsets = view[offsets_start:].cast('q')
+        view.release()
+        self.count = count
+        self._end = self._base + blob_length
+
+    def _close(self):
+        # As views precisam ser liberadas antes do mmap, ou close() falha.
+        for view in (self._ids, self._offsets):
+            if view is not None:
+                view.release()
+        self._ids = self._offsets = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._file_stamp = None
+        self.count = 0
+
+    def _mark_stale(self):
+        try:
+            open(self.stale_path, 'wb').close()
+        except OSError:
+            pass
+
+    def install(self, new_path: str, is_current: Callable[[], bool]) -> bool:
+        # Troca o snapshot pelo arquivo recém-gerado, a não ser que o índice tenha
+        # mudado durante a geração; a checagem fica sob a mesma trava de
+        # invalidate(), então uma gravação concorrente sempre chega depois.
+        # Se o arquivo antigo não puder ser substituído (aberto por outro processo),
+        # o novo é descartado e o antigo fica marcado como desatualizado.
+        with self._lock:
+            if not is_current():
+                _remove(new_path)
+                return False
+            self._close()
+            try:
+                os.replace(new_path, self.path)
+                _remove(self.stale_path)
+            except OSError:
+                _remove(new_path)
+                self._mark_stale()
+                return False
+            try:
+                self._open()
+            except (OSError, ValueError):
+                self._close()
+                return False
+            return True
+
+    def invalidate(self):
+        # Roda depois de cada commit: uma falha ao apagar o arquivo não pode subir
+        # para o writer, então o snapshot só é marcado como desatualizado.
+        with self._lock:
+            self._close()
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                self._mark_stale()
+
+    def find_ids(self, term: str) -> Optional[List[int]]:
+        # ids dos nomes que contêm `term` (como LIKE '%term%'), na ordem de files.id;
+        # None se não houver snapshot carregado.
+        if '%' in term or '_' in term:
+            return self.match_ids(re.compile(like_pattern(term)))
+        needle = encode_name(term)
+        with self._lock:
+            if self._mmap is None:
+                return None
+            return self._collect(lambda start: self._mmap.find(needle, start, self._end))
+
+    def match_ids(self, pattern: re.Pattern) -> Optional[List[int]]:
+        # ids dos nomes em que `pattern` casa com algum trecho; o padrão é aplicado
+        # ao bloco em minúsculas e não deve casar com '\0'.
+        with self._lock:
+            if self._mmap is None:
+                return None
+
+            def search(start: int) -> int:
+                match = pattern.search(self._mmap, start, self._end)
+                return match.start() if match else -1
+            return self._collect(search)
+
+    def _collect(self, search: Callable[[int], int]) -> List[int]:
+        # Depois de cada ocorrência a busca continua no nome seguinte, então cada
+        # nome entra no máximo uma vez.
+        ids, offsets, base = self._ids, self._offsets, self._base
+        hits = []
+        position = search(base)
+        while position != -1 and position < self._end:
+            index = bisect.bisect_right(offsets, position - base) - 1
+            hits.append(ids[index])
+            position = search(base + offsets[index + 1])
+        return hits
+
+    def close(self):
+        with self._lock:
+            self._close()
@@ -0,0 +1,52 @@
+from typing import Optional
+from core.submodules.search_modules.query_spec import QuerySpec, FILE_COLUMNS, restrict_to_subtree
+from core.submodules.search_modules.search_by_extension import extension_filter
+from core.submodules.search_modules.to_epoch import DateValue, to_epoch
+
+# Ordens disponíveis: (colunas da chave, decrescente). Com item_type fixo, 'size' e
+# 'mtime' seguem idx_type_size/idx_type_mtime (o id é o rowid, último campo de todo índice).
+FILTER_ORDERS = {
+    'size': (['files.file_size', 'files.id'], True),
+    'mtime': (['files.mtime', 'files.id'], False),
+    'id': (['files.id'], False),
+}
+
+def filter_query_spec(indexer, name: Optional[str] = None, extension: Optional[str] = None,
+                      min_size: Optional[int] = None, max_size: Optional[int] = None,
+                      modified_after: Optional[DateValue] = None,
+                      modified_before: Optional[DateValue] = None,
+                      root_path: Optional[str] = None, order: str = 'size') -> QuerySpec:
+    # Combina os filtros de arquivo; tamanhos em bytes, datas inclusivas no início
+    # (modified_after) e exclusivas no fim (modified_before).
+    if order not in FILTER_ORDERS:
+        raise ValueError(f"Ordem inválida: {order} (use {', '.join(FILTER_ORDERS)})")
+    conditions = ["files.item_type = 'file'"]
+    params = ()
+    if extension:
+        extension_where, extension_params = extension_filter(extension)
+        conditions.append(extension_where)
+        params += extension_params
+    if name:
+        conditions.append("files.filename LIKE ?")
+        params += (f"%{name}%",)
+    if min_size is not None:
+        conditions.append("files.file_size >= ?")
+        params += (min_size,)
+    if max_size is not None:
+        conditions.append("files.file_size <= ?")
+        params += (max_size,)
+    if modified_after is not None:
+        conditions.append("files.mtime >= ?")
+        params += (to_epoch(modified_after),)
+    if modified_before is not None:
+        conditions.append("files.mtime < ?")
+        params += (to_epoch(modified_before),)
+
+    order_columns, descending = FILTER_ORDERS[order]
+    # A chave do cursor compara valores em linha ('(mtime, id) > (?, ?)'), que
+    # nunca é verdadeiro com NULL: sem esta condição a paginação pararia na
+    # primeira linha sem data ou tamanho.
+    if order != 'id':
+        conditions.append(f"{order_columns[0]} IS NOT NULL")
+    spec = QuerySpec(FILE_COLUMNS, ' AND '.join(conditions), params, order_columns, descending)
+    return restrict_to_subtree(spec, root_path)
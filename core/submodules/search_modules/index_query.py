@@ -0,0 +1,12 @@
+from typing import Optional
+from core.submodules.db_modules.file_paths import FULL_PATH_SQL
+from core.submodules.search_modules.query_spec import QuerySpec, restrict_to_subtree
+
+def index_query_spec(indexer, root_path: Optional[str] = None) -> QuerySpec:
+    # Todo o índice (arquivos e pastas), na ordem de inserção; limitado a uma
+    # pasta, segue a ordem das pastas percorridas na faixa de directories.path.
+    order = ['directories.path', 'files.filename'] if root_path else ['files.id']
+    spec = QuerySpec(f"files.filename, {FULL_PATH_SQL} AS full_path, directories.path AS parent_path, "
+                     "files.item_type, files.file_size, files.modified_date, files.extension",
+                     "1", (), order)
+    return restrict_to_subtree(spec, root_path)
@@ -0,0 +1,20 @@
+import sqlite3
+from typing import Iterator, Tuple
+from core.submodules.search_modules.query_spec import QuerySpec
+
+def iter_query_func(indexer, spec: QuerySpec, batch_size: int = 1000) -> Iterator[Tuple]:
+    # Lê o resultado em blocos com fetchmany; só `batch_size` linhas ficam em memória.
+    # A conexão de leitura fica com o gerador até ele terminar ou ser fechado.
+    try:
+        with indexer.read_connection() as conn:
+            cursor = conn.execute(spec.select_sql(), spec.params)
+            try:
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield from rows
+            finally:
+                cursor.close()
+    except sqlite3.Error as e:
+        indexer.logger.error(f"Erro na busca: {e}")
@@ -0,0 +1,11 @@
+from typing import List, Optional, Tuple
+from core.submodules.search_modules.filter_query import filter_query_spec
+from core.submodules.search_modules.query_page import query_page_func
+
+def largest_files_func(indexer, limit: int = 10, extension: Optional[str] = None,
+                       root_path: Optional[str] = None) -> List[Tuple]:
+    # Lê só as `limit` primeiras entradas do idx_type_size (ou do
+    # idx_type_extension_size, com extensão), do maior para o menor.
+    spec = filter_query_spec(indexer, extension=extension, root_path=root_path, order='size')
+    rows, _ = query_page_func(indexer, spec, limit)
+    return rows
@@ -0,0 +1,19 @@
+from typing import List, Optional, Tuple
+from core.submodules.search_modules.query_spec import QuerySpec, restrict_to_subtree
+from core.submodules.search_modules.query_page import query_page_func
+
+FOLDER_SIZE_COLUMNS = ("directories.path, directories.total_bytes, directories.total_files, "
+                       "datetime(directories.newest_mtime, 'unixepoch', 'localtime') AS newest_modified")
+
+def largest_folders_spec(indexer, root_path: Optional[str] = None) -> QuerySpec:
+    # Pastas pela soma recursiva (total_bytes), lida em ordem do idx_directories_total;
+    # com `root_path`, a faixa de directories.path limita às pastas dentro dela.
+    # Pastas sem mtime_ns só existem como ancestrais das raízes escaneadas e ficam de fora.
+    spec = QuerySpec(FOLDER_SIZE_COLUMNS, "directories.mtime_ns IS NOT NULL", (),
+                     ['directories.total_bytes', 'directories.id'], descending=True,
+                     source='directories')
+    return restrict_to_subtree(spec, root_path)
+
+def largest_folders_func(indexer, limit: int = 50, root_path: Optional[str] = None) -> List[Tuple]:
+    rows, _ = query_page_func(indexer, largest_folders_spec(indexer, root_path), limit)
+    return rows
@@ -0,0 +1,12 @@
+from typing import List, Optional, Tuple
+from core.submodules.search_modules.filter_query import filter_query_spec
+from core.submodules.search_modules.query_page import query_page_func
+from core.submodules.search_modules.to_epoch import DateValue
+
+def files_not_modified_since_func(indexer, since: DateValue, limit: int = 10,
+                                  root_path: Optional[str] = None) -> List[Tuple]:
+    # Mais antigos primeiro, na ordem do idx_type_mtime; para o relatório
+    # completo use filter_query(modified_before=...) com export/iter_query.
+    spec = filter_query_spec(indexer, modified_before=since, root_path=root_path, order='mtime')
+    rows, _ = query_page_func(indexer, spec, limit)
+    return rows
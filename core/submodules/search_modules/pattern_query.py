@@ -0,0 +1,68 @@
+import re
+from functools import lru_cache
+from typing import Optional, Tuple
+from core.submodules.search_modules.query_spec import QuerySpec, FILE_COLUMNS, restrict_to_subtree
+
+# Modos de busca por padrão no nome, além do trecho (LIKE) e do nome exato:
+# 'glob': curingas do GLOB do SQLite (*, ?, [abc]), diferenciando maiúsculas;
+# 'regex': expressão regular do Python (re.search), aplicada pela função REGEXP.
+PATTERN_MODES = ('glob', 'regex')
+
+_GLOB_SPECIAL = '*?['
+_REGEX_SPECIAL = '.^$*+?{}[]\\|()'
+
+@lru_cache(maxsize=64)
+def compile_regex(pattern: str) -> re.Pattern:
+    return re.compile(pattern)
+
+def regexp(pattern: str, value: Optional[str]) -> bool:
+    # Implementa `value REGEXP pattern`; o SQLite chama regexp(pattern, value) e
+    # o padrão compilado fica em cache entre as linhas.
+    return value is not None and compile_regex(pattern).search(value) is not None
+
+def glob_literal_prefix(pattern: str) -> str:
+    for position, char in enumerate(pattern):
+        if char in _GLOB_SPECIAL:
+            return pattern[:position]
+    return pattern
+
+def regex_literal_prefix(pattern: str) -> str:
+    # Só padrões ancorados no início ('^Relatorio_2024_.*') têm um prefixo fixo;
+    # com alternativa ('|') qualquer ramo pode casar, então não há prefixo.
+    if not pattern.startswith('^') or '|' in pattern:
+        return ''
+    body = pattern[1:]
+    for position, char in enumerate(body):
+        if char in _REGEX_SPECIAL:
+            # 'ab*', 'ab?' e 'ab{0,1}' podem casar sem o último caractere.
+            if char in '*?{':
+                position -= 1
+            return body[:max(position, 0)]
+    return body
+
+def prefix_range(prefix: str) -> Tuple[str, str]:
+    # Limites [inicio, fim) dos nomes que começam com `prefix`, na ordem binária
+    # do idx_filename (a ordem dos code points é a mesma dos bytes em UTF-8).
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+def pattern_query_spec(search_term: str, mode: str, item_type: str = 'file',
+                       columns: str = FILE_COLUMNS, root_path: Optional[str] = None) -> QuerySpec:
+    # O casamento fica no WHERE, então só as linhas que casam são materializadas.
+    # Se o padrão começa com um trecho fixo, a faixa sobre idx_filename limita a
+    # leitura aos nomes com esse prefixo e as linhas saem na ordem do índice.
+    if mode == 'regex':
+        compile_regex(search_term)  # padrão inválido vira re.error aqui, não no meio da consulta
+        prefix = regex_literal_prefix(search_term)
+        where = "files.filename REGEXP ? AND +files.item_type = ?"
+    else:
+        prefix = glob_literal_prefix(search_term)
+        where = "files.filename GLOB ? AND +files.item_type = ?"
+    params = (search_term, item_type)
+    order = ['files.id']
+    if prefix:
+        where = f"files.filename >= ? AND files.filename < ? AND {where}"
+        params = prefix_range(prefix) + params
+        order = ['files.filename', 'files.id']
+    if root_path:
+        order = ['directories.path', 'files.filename']
+    return restrict_to_subtree(QuerySpec(columns, where, params, order), root_path)
@@ -0,0 +1,48 @@
+import base64
+import json
+import sqlite3
+from typing import List, Optional, Tuple
+from core.submodules.search_modules.query_spec import QuerySpec
+
+def encode_page_cursor(key_values: Tuple) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(key_values)).encode()).decode()
+
+def decode_page_cursor(token: str) -> Tuple:
+    return tuple(json.loads(base64.urlsafe_b64decode(token.encode())))
+
+def query_page_func(indexer, spec: QuerySpec, limit: int = 10,
+                    page_cursor: Optional[str] = None) -> Tuple[List[Tuple], Optional[str]]:
+    # Paginação por keyset: a próxima página começa depois da chave de ordenação da
+    # última linha, então o custo de cada página não depende de quantas vieram antes.
+    # Retorna (linhas, cursor da próxima página ou None se não houver mais).
+    key_columns = ', '.join(spec.order)
+    where = spec.where
+    params = spec.params
+    if page_cursor:
+        key_values = decode_page_cursor(page_cursor)
+        comparison = '<' if spec.descending else '>'
+        placeholders = ', '.join('?' * len(key_values))
+        where = f"({where}) AND ({key_columns}) {comparison} ({placeholders})"
+        params = params + key_values
+
+    page_spec = spec._replace(columns=f"{spec.columns}, {key_columns}", where=where, params=params)
+    page_sql = f"{page_spec.select_sql()} LIMIT ?"
+    page_params = page_spec.params + (limit + 1,)
+
+    def fetch():
+        with indexer.read_connection() as conn:
+            return conn.execute(page_sql, page_params).fetchall()
+
+    try:
+        # A chave inclui o cursor e o limite: cada página fica no cache separada.
+        rows = indexer.result_cache.get_or_compute(('page', page_sql, page_params), fetch)
+    except sqlite3.Error as e:
+        indexer.logger.error(f"Erro na busca paginada: {e}")
+        return [], None
+
+    key_length = len(spec.order)
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_page_cursor(rows[-1][-key_length:])
+    return [row[:-key_length] for row in rows], next_cursor
@@ -0,0 +1,40 @@
+from typing import List, NamedTuple, Optional, Tuple
+from core.submodules.db_modules.path_range import directory_key, subtree_range
+from core.submodules.db_modules.file_paths import FILES_WITH_DIRECTORIES, FULL_PATH_SQL
+
+# Colunas devolvidas pelas buscas de arquivos.
+FILE_COLUMNS = f"files.filename, {FULL_PATH_SQL} AS full_path, files.file_size, files.modified_date"
+
+class QuerySpec(NamedTuple):
+    """Descrição de uma busca em files, compartilhada por listagem, paginação e streaming.
+
+    `order` lista as colunas da chave de ordenação (todas na mesma direção); elas
+    precisam identificar a linha de forma única para servirem de cursor (keyset).
+    `source` é a cláusula FROM: files junto com directories, de onde vem o caminho;
+    buscas pelo FTS juntam também files_fts.
+    """
+    columns: str
+    where: str
+    params: Tuple
+    order: List[str]
+    descending: bool = False
+    source: str = FILES_WITH_DIRECTORIES
+
+    def select_sql(self) -> str:
+        direction = 'DESC' if self.descending else 'ASC'
+        order_by = ', '.join(f'{column} {direction}' for column in self.order)
+        return f"SELECT {self.columns} FROM {self.source} WHERE {self.where} ORDER BY {order_by}"
+
+def restrict_to_subtree(spec: QuerySpec, root_path: Optional[str]) -> QuerySpec:
+    # Limita a busca às pastas dentro de `root_path` com uma faixa sobre
+    # directories.path (índice UNIQUE) que começa na própria pasta; a última
+    # condição descarta as irmãs que caem na faixa ('pasta-2', 'pasta.old').
+    # A pasta é normalizada como nos escaneamentos ('a\\b\\', 'a/./b' viram 'a\\b').
+    if not root_path:
+        return spec
+    low, high = subtree_range(directory_key(root_path))
+    root = low[:-1]
+    return spec._replace(
+        where=f"{spec.where} AND directories.path >= ? AND directories.path < ?"
+              f" AND (directories.path = ? OR directories.path >= ?)",
+        params=spec.params + (root, high, root, low))
@@ -0,0 +1,80 @@
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+RESULT_CACHE_ENTRIES = 256
+RESULT_CACHE_BYTES = 32 * 1024 * 1024
+
+def estimate_size(value: Any) -> int:
+    # Tamanho aproximado em memória de um resultado: listas/tuplas de linhas com
+    # textos, números e None.
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+class QueryResultCache:
+    """Cache LRU dos resultados de busca, por tipo de consulta, parâmetros e página.
+
+    `generation` é a geração do índice: os caminhos que gravam ou apagam registros
+    chamam `invalidate()`, que a incrementa e descarta o cache inteiro. Um
+    resultado calculado enquanto a geração mudou não é guardado, pois pode ter
+    lido o banco antes da gravação.
+    O limite é de `max_entries` resultados e `max_bytes` estimados; os menos
+    usados saem primeiro e um resultado maior que o limite inteiro nunca entra.
+    Os valores devolvidos são compartilhados entre chamadas e não devem ser
+    alterados.
+    Só as gravações feitas por este FileIndexer são vistas; outro processo
+    escrevendo no mesmo banco não invalida o cache.
+    """
+
+    def __init__(self, max_entries: int = RESULT_CACHE_ENTRIES, max_bytes: int = RESULT_CACHE_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        # Sem limite de entradas o cache fica desligado e toda chamada vai ao banco.
+        if self.max_entries <= 0:
+            return compute()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+            generation = self.generation
+        # Exceções de `compute` sobem sem guardar nada.
+        value = compute()
+        size = estimate_size(value)
+        with self._lock:
+            if generation == self.generation and size <= self.max_bytes and key not in self._entries:
+                self._entries[key] = (value, size)
+                self._bytes += size
+                while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                    _, (_, evicted_size) = self._entries.popitem(last=False)
+                    self._bytes -= evicted_size
+        return value
+
+    def invalidate(self):
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+def fetch_all_cached(indexer, spec) -> list:
+    # Todas as linhas de um QuerySpec, servidas pelo cache quando a mesma busca
+    # já foi feita na geração atual do índice.
+    def fetch():
+        with indexer.read_connection() as conn:
+            return conn.execute(spec.select_sql(), spec.params).fetchall()
+    return indexer.result_cache.get_or_compute(('rows', spec.select_sql(), spec.params), fetch)
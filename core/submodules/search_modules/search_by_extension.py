@@ -1,20 +1,34 @@
 import sqlite3
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+from core.submodules.search_modules.query_spec import QuerySpec, FILE_COLUMNS, restrict_to_subtree
+from core.submodules.search_modules.result_cache import fetch_all_cached
 
-def search_by_extension_func(indexer, extension: str) -> List[Tuple]:
-    conn = indexer.get_db_connection()
-    cursor = conn.cursor()
-    
+def extension_filter(extension: str, unindexed: str = '') -> Tuple[str, Tuple]:
+    # A coluna guarda só o trecho após o último ponto; para extensões compostas
+    # ('tar.gz') o índice filtra por '.gz' e o LIKE confere o restante.
+    if not extension.startswith('.'):
+        extension = '.' + extension
+    where = f"{unindexed}files.extension = ?"
+    params = ('.' + extension.rsplit('.', 1)[-1].lower(),)
+    if extension.count('.') > 1:
+        where += " AND files.filename LIKE ?"
+        params += (f"%{extension}",)
+    return where, params
+
+def extension_query_spec(indexer, extension: str, root_path: Optional[str] = None) -> QuerySpec:
+    # Dentro de uma pasta, o '+' desliga o idx_type_extension_size: a busca percorre
+    # só as pastas da subárvore e ordena apenas o que casou nela.
+    unindexed = '+' if root_path else ''
+    extension_where, params = extension_filter(extension, unindexed)
+    where = f"{unindexed}files.item_type = 'file' AND {extension_where}"
+    # Sem pasta, a ordem é a do idx_type_extension_size: maiores primeiro, sem ordenar em memória.
+    spec = QuerySpec(FILE_COLUMNS, where, params, ['files.file_size', 'files.id'], descending=True)
+    return restrict_to_subtree(spec, root_path)
+
+def search_by_extension_func(indexer, extension: str, root_path: Optional[str] = None) -> List[Tuple]:
     try:
-        if not extension.startswith('.'):
-            extension = '.' + extension
-        
-        query = "SELECT filename, full_path, file_size, modified_date FROM files WHERE filename LIKE ? AND item_type = 'file'"
-        cursor.execute(query, (f"%{extension}",))
-        
-        results = cursor.fetchall()
-        return results
-        
+        spec = extension_query_spec(indexer, extension, root_path)
+        return fetch_all_cached(indexer, spec)
     except sqlite3.Error as e:
         indexer.logger.error(f"Erro na busca por extensão: {e}")
         return []
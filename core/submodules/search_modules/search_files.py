@@ -1,21 +1,57 @@
+import re
 import sqlite3
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+from core.submodules.db_modules.filename_fts import MIN_FTS_TERM_LENGTH
+from core.submodules.search_modules.query_spec import QuerySpec, FILE_COLUMNS, restrict_to_subtree
+from core.submodules.search_modules.result_cache import fetch_all_cached
+from core.submodules.search_modules.snapshot_search import snapshot_search_func
+from core.submodules.search_modules.pattern_query import PATTERN_MODES, pattern_query_spec
 
-def search_files_func(indexer, search_term: str, exact_match: bool = False) -> List[Tuple]:
-    conn = indexer.get_db_connection()
-    cursor = conn.cursor()
-    
+def files_query_spec(indexer, search_term: str, exact_match: bool = False,
+                     item_type: str = 'file',
+                     columns: str = FILE_COLUMNS,
+                     root_path: Optional[str] = None,
+                     mode: Optional[str] = None) -> QuerySpec:
+    if mode is not None:
+        if mode not in PATTERN_MODES:
+            raise ValueError(f"Modo de busca inválido: {mode} (use {', '.join(PATTERN_MODES)})")
+        return pattern_query_spec(search_term, mode, item_type, columns, root_path)
+    # O '+' em item_type impede o planejador de escolher idx_type_size ou
+    # idx_type_mtime (item_type tem só dois valores) no lugar do índice do nome.
+    if exact_match:
+        spec = QuerySpec(columns, "files.filename = ? AND +files.item_type = ?",
+                         (search_term, item_type), ['files.id'])
+        return restrict_to_subtree(spec, root_path)
+    if root_path:
+        # Dentro de uma pasta, a faixa de directories.path limita o custo à subárvore
+        # e, pasta a pasta, os itens saem na ordem do índice (dir_id, filename).
+        spec = QuerySpec(columns, "files.filename LIKE ? AND +files.item_type = ?",
+                         (f"%{search_term}%", item_type), ['directories.path', 'files.filename'])
+        return restrict_to_subtree(spec, root_path)
+    if indexer.filename_fts_enabled and len(search_term) >= MIN_FTS_TERM_LENGTH:
+        # Percorrer o FTS na ordem do rowid devolve as primeiras linhas sem
+        # materializar todos os resultados antes.
+        return QuerySpec(columns, "files_fts.filename LIKE ? AND +files.item_type = ?",
+                         (f"%{search_term}%", item_type), ['files_fts.rowid'],
+                         source="files_fts JOIN files ON files.id = files_fts.rowid"
+                                " JOIN directories ON directories.id = files.dir_id")
+    return QuerySpec(columns, "files.filename LIKE ? AND +files.item_type = ?",
+                     (f"%{search_term}%", item_type), ['files.id'])
+
+def search_files_func(indexer, search_term: str, exact_match: bool = False,
+                      root_path: Optional[str] = None, mode: Optional[str] = None) -> List[Tuple]:
     try:
-        if exact_match:
-            query = "SELECT filename, full_path, file_size, modified_date FROM files WHERE filename = ? AND item_type = 'file'"
-            cursor.execute(query, (search_term,))
-        else:
-            query = "SELECT filename, full_path, file_size, modified_date FROM files WHERE filename LIKE ? AND item_type = 'file'"
-            cursor.execute(query, (f"%{search_term}%",))
-        
-        results = cursor.fetchall()
-        return results
-        
+        # O snapshot de nomes, quando ativo, atende a busca parcial no índice
+        # inteiro; dentro de uma pasta a faixa de caminhos do SQL é mais barata.
+        if (mode or not exact_match) and not root_path:
+            rows = snapshot_search_func(indexer, search_term, 'file', FILE_COLUMNS, mode)
+            if rows is not None:
+                return rows
+        spec = files_query_spec(indexer, search_term, exact_match, root_path=root_path, mode=mode)
+        return fetch_all_cached(indexer, spec)
+    except re.error as e:
+        indexer.logger.error(f"Expressão regular inválida: {e}")
+        return []
     except sqlite3.Error as e:
         indexer.logger.error(f"Erro na busca: {e}")
         return []
@@ -1,21 +1,32 @@
+import re
 import sqlite3
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+from core.submodules.db_modules.file_paths import FULL_PATH_SQL
+from core.submodules.search_modules.query_spec import QuerySpec
+from core.submodules.search_modules.search_files import files_query_spec
+from core.submodules.search_modules.result_cache import fetch_all_cached
+from core.submodules.search_modules.snapshot_search import snapshot_search_func
 
-def search_folders_func(indexer, search_term: str, exact_match: bool = False) -> List[Tuple]:
-    conn = indexer.get_db_connection()
-    cursor = conn.cursor()
-    
+FOLDER_COLUMNS = f"files.filename AS folder_name, {FULL_PATH_SQL} AS full_path, directories.path AS parent_path"
+
+def folders_query_spec(indexer, search_term: str, exact_match: bool = False,
+                       root_path: Optional[str] = None, mode: Optional[str] = None) -> QuerySpec:
+    return files_query_spec(indexer, search_term, exact_match, item_type='folder',
+                            columns=FOLDER_COLUMNS,
+                            root_path=root_path, mode=mode)
+
+def search_folders_func(indexer, search_term: str, exact_match: bool = False,
+                        root_path: Optional[str] = None, mode: Optional[str] = None) -> List[Tuple]:
     try:
-        if exact_match:
-            query = "SELECT filename, full_path, parent_path FROM files WHERE filename = ? AND item_type = 'folder'"
-            cursor.execute(query, (search_term,))
-        else:
-            query = "SELECT filename, full_path, parent_path FROM files WHERE filename LIKE ? AND item_type = 'folder'"
-            cursor.execute(query, (f"%{search_term}%",))
-        
-        results = cursor.fetchall()
-        return results
-        
+        if (mode or not exact_match) and not root_path:
+            rows = snapshot_search_func(indexer, search_term, 'folder', FOLDER_COLUMNS, mode)
+            if rows is not None:
+                return rows
+        spec = folders_query_spec(indexer, search_term, exact_match, root_path, mode)
+        return fetch_all_cached(indexer, spec)
+    except re.error as e:
+        indexer.logger.error(f"Expressão regular inválida: {e}")
+        return []
     except sqlite3.Error as e:
         indexer.logger.error(f"Erro na busca de pastas: {e}")
         return []
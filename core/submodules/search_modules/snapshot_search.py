@@ -0,0 +1,46 @@
+import re
+from typing import List, Optional, Tuple
+from core.submodules.search_modules.query_spec import QuerySpec
+from core.submodules.search_modules.filename_snapshot import glob_pattern
+from core.submodules.search_modules.pattern_query import glob_literal_prefix
+
+# Ids por consulta ao buscar as linhas dos nomes encontrados no snapshot.
+ID_CHUNK_SIZE = 500
+
+def snapshot_search_func(indexer, search_term: str, item_type: str, columns: str,
+                         mode: Optional[str] = None) -> Optional[List[Tuple]]:
+    # Busca parcial (ou por glob) pelo snapshot de nomes: o padrão é procurado no
+    # bloco mapeado em memória e só as linhas encontradas são lidas do SQLite,
+    # pela chave primária. Retorna None se o snapshot não estiver disponível ou
+    # não servir para o modo, para a busca seguir pelo SQL.
+    # No glob o snapshot só aponta candidatos (ele não diferencia maiúsculas) e o
+    # GLOB confere cada um; com prefixo fixo a faixa do idx_filename já é mais
+    # barata, e regex fica sempre com o SQL.
+    snapshot = indexer.filename_snapshot
+    if not snapshot.is_current():
+        return None
+    if mode == 'regex' or (mode == 'glob' and glob_literal_prefix(search_term)):
+        return None
+
+    where = "+files.item_type = ?"
+    extra_params = (item_type,)
+    if mode == 'glob':
+        where += " AND files.filename GLOB ?"
+        extra_params += (search_term,)
+
+    def fetch():
+        if mode == 'glob':
+            ids = snapshot.match_ids(re.compile(glob_pattern(search_term)))
+        else:
+            ids = snapshot.find_ids(search_term)
+        if ids is None:
+            return None
+        rows = []
+        with indexer.read_connection() as conn:
+            for start in range(0, len(ids), ID_CHUNK_SIZE):
+                chunk = tuple(ids[start:start + ID_CHUNK_SIZE])
+                spec = QuerySpec(columns, f"files.id IN ({', '.join('?' * len(chunk))}) AND {where}",
+                                 chunk + extra_params, ['files.id'])
+                rows.extend(conn.execute(spec.select_sql(), spec.params).fetchall())
+        return rows
+    return indexer.result_cache.get_or_compute(('snapshot', columns, mode, search_term, item_type), fetch)
@@ -0,0 +1,22 @@
+import time
+from datetime import date, datetime
+from typing import Union
+
+DateValue = Union[int, float, str, date, datetime]
+
+def to_epoch(value: DateValue) -> int:
+    """Converte uma data (epoch, datetime/date ou texto 'AAAA-MM-DD[ HH:MM:SS]' em
+    hora local, o mesmo formato de modified_date) para segundos desde a época."""
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    if isinstance(value, date):
+        return int(time.mktime(value.timetuple()))
+    text = value.strip()
+    for date_format in ('%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M', '%Y-%m-%d'):
+        try:
+            return int(time.mktime(time.strptime(text, date_format)))
+        except ValueError:
+            continue
+    raise ValueError(f"Data inválida: {value!r} (use AAAA-MM-DD ou AAAA-MM-DD HH:MM:SS)")
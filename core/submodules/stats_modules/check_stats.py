@@ -0,0 +1,46 @@
+import sqlite3
+from core.submodules.db_modules.stats_aggregates import ITEM_TYPE_TOTALS_SQL, EXTENSION_TOTALS_SQL
+
+def check_stats_func(indexer) -> bool:
+    # Recalcula os agregados a partir de files (varredura completa) e compara com as
+    # tabelas mantidas pelos triggers. Retorna True se estiverem consistentes.
+    try:
+        # Esperado e armazenado lidos na mesma visão, para não acusar divergência
+        # só porque um escaneamento gravou entre as consultas.
+        with indexer.read_snapshot() as conn:
+            cursor = conn.cursor()
+            cursor.execute(ITEM_TYPE_TOTALS_SQL)
+            expected_types = {item_type: (count, size) for item_type, count, size in cursor.fetchall()}
+            cursor.execute("SELECT item_type, item_count, total_bytes FROM item_type_stats WHERE item_count != 0")
+            stored_types = {item_type: (count, size) for item_type, count, size in cursor.fetchall()}
+
+            cursor.execute(EXTENSION_TOTALS_SQL)
+            expected_extensions = {extension: (count, size, largest_size)
+                                   for extension, count, size, _, largest_size in cursor.fetchall()}
+            cursor.execute('''
+                SELECT e.extension, e.file_count, e.total_bytes, e.largest_stale, f.file_size
+                FROM extension_stats e LEFT JOIN files f ON f.id = e.largest_file_id
+                WHERE e.file_count != 0
+            ''')
+            stored_extensions = {}
+            for extension, count, size, largest_stale, largest_size in cursor.fetchall():
+                # Um máximo marcado como desatualizado é recalculado na leitura, então só
+                # os totais precisam bater.
+                if largest_stale:
+                    largest_size = expected_extensions.get(extension, (None, None, None))[2]
+                stored_extensions[extension] = (count, size, largest_size)
+    except sqlite3.Error as e:
+        indexer.logger.error(f"Erro ao verificar estatísticas: {e}")
+        return False
+
+    consistent = True
+    for label, expected, stored in (('tipo', expected_types, stored_types),
+                                    ('extensão', expected_extensions, stored_extensions)):
+        for key in expected.keys() | stored.keys():
+            if expected.get(key) != stored.get(key):
+                consistent = False
+                indexer.logger.warning(f"Estatística divergente ({label} {key!r}): "
+                                       f"esperado {expected.get(key)}, armazenado {stored.get(key)}")
+    if consistent:
+        indexer.logger.info("Estatísticas consistentes com o índice")
+    return consistent
@@ -1,11 +1,32 @@
 import sqlite3
+from core.submodules.db_modules.filename_fts import (
+    create_filename_fts_triggers, drop_filename_fts_triggers
+)
+from core.submodules.db_modules.stats_aggregates import create_stats_triggers, drop_stats_triggers
+from core.submodules.db_modules.folder_sizes import create_folder_size_triggers, drop_folder_size_triggers
 
 def clear_index_func(indexer):
     conn = indexer.get_db_connection()
     cursor = conn.cursor()
     try:
+        # Sem triggers o DELETE usa o caminho rápido do SQLite em vez de apagar
+        # linha a linha; FTS e agregados são esvaziados de uma vez.
+        drop_stats_triggers(cursor)
+        drop_folder_size_triggers(cursor)
+        if indexer.filename_fts_enabled:
+            drop_filename_fts_triggers(cursor)
+            cursor.execute("INSERT INTO files_fts(files_fts) VALUES ('delete-all')")
         cursor.execute("DELETE FROM files")
+        cursor.execute("DELETE FROM directories")
+        cursor.execute("DELETE FROM item_type_stats")
+        cursor.execute("DELETE FROM extension_stats")
+        cursor.execute("DELETE FROM scan_checkpoints")
+        if indexer.filename_fts_enabled:
+            create_filename_fts_triggers(cursor)
+        create_stats_triggers(cursor)
+        create_folder_size_triggers(cursor)
         conn.commit()
+        indexer.bump_index_generation()
         indexer.logger.info("Índice limpo com sucesso")
     except sqlite3.Error as e:
         indexer.logger.error(f"Erro ao limpar índice: {e}")
@@ -1,35 +1,47 @@
 import sqlite3
+from core.submodules.db_modules.file_paths import FILES_WITH_DIRECTORIES, FULL_PATH_SQL
 
 def get_stats_func(indexer) -> dict:
-    conn = indexer.get_db_connection()
-    cursor = conn.cursor()
-    
     try:
-        cursor.execute("SELECT COUNT(*) FROM files WHERE item_type = 'file'")
-        total_files = cursor.fetchone()[0]
+        # Todas as leituras na mesma visão do banco, mesmo com um escaneamento gravando.
+        with indexer.read_snapshot() as conn:
+            cursor = conn.cursor()
+            # Lê os agregados mantidos pelos triggers; nada aqui percorre a tabela files.
+            cursor.execute("SELECT item_type, item_count, total_bytes FROM item_type_stats")
+            totals_by_type = {item_type: (count, size) for item_type, count, size in cursor.fetchall()}
+            total_files, total_size = totals_by_type.get('file', (0, 0))
+            total_folders = totals_by_type.get('folder', (0, 0))[0]
         
-        cursor.execute("SELECT COUNT(*) FROM files WHERE item_type = 'folder'")
-        total_folders = cursor.fetchone()[0]
+            cursor.execute('''
+                SELECT extension, file_count, total_bytes, largest_file_id, largest_stale
+                FROM extension_stats 
+                WHERE file_count > 0 AND extension != ''
+                ORDER BY file_count DESC 
+                LIMIT 10
+            ''')
+            extension_rows = cursor.fetchall()
         
-        cursor.execute("SELECT SUM(file_size) FROM files WHERE item_type = 'file'")
-        total_size = cursor.fetchone()[0] or 0
+            extension_details = []
+            for extension, count, extension_bytes, largest_file_id, largest_stale in extension_rows:
+                if largest_stale:
+                    cursor.execute('''
+                        SELECT id FROM files WHERE item_type = 'file' AND extension = ?
+                        ORDER BY file_size DESC LIMIT 1
+                    ''', (extension,))
+                    row = cursor.fetchone()
+                    largest_file_id = row[0] if row else None
+                cursor.execute(f"SELECT {FULL_PATH_SQL}, files.file_size FROM {FILES_WITH_DIRECTORIES} WHERE files.id = ?",
+                               (largest_file_id,))
+                largest_path, largest_size = cursor.fetchone() or (None, 0)
+                extension_details.append((extension, count, extension_bytes, largest_path, largest_size))
         
-        cursor.execute('''
-            SELECT SUBSTR(filename, INSTR(filename, '.')) as extension, COUNT(*) as count
-            FROM files 
-            WHERE filename LIKE '%.%' AND item_type = 'file'
-            GROUP BY extension 
-            ORDER BY count DESC 
-            LIMIT 10
-        ''')
-        top_extensions = cursor.fetchall()
-        
-        return {
-            'total_files': total_files,
-            'total_folders': total_folders,
-            'total_size_mb': round(total_size / (1024 * 1024), 2),
-            'top_extensions': top_extensions
-        }
+            return {
+                'total_files': total_files,
+                'total_folders': total_folders,
+                'total_size_mb': round(total_size / (1024 * 1024), 2),
+                'top_extensions': [(extension, count) for extension, count, *_ in extension_rows],
+                'extension_details': extension_details
+            }
         
     except sqlite3.Error as e:
         indexer.logger.error(f"Erro ao obter estatísticas: {e}")
@@ -0,0 +1,11 @@
+import sqlite3
+
+def is_index_empty_func(indexer) -> bool:
+    conn = indexer.get_db_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT 1 FROM files LIMIT 1")
+        return cursor.fetchone() is None
+    except sqlite3.Error as e:
+        indexer.logger.error(f"Erro ao verificar índice: {e}")
+        return False
@@ -0,0 +1,17 @@
+import sqlite3
+from core.submodules.db_modules.stats_aggregates import rebuild_stats_aggregates
+from core.submodules.db_modules.folder_sizes import rebuild_folder_sizes
+
+def rebuild_stats_func(indexer):
+    conn = indexer.get_db_connection()
+    cursor = conn.cursor()
+    try:
+        rebuild_stats_aggregates(cursor)
+        rebuild_folder_sizes(cursor)
+        conn.commit()
+        indexer.bump_index_generation()
+        indexer.logger.info("Estatísticas reconstruídas a partir do índice")
+    except sqlite3.Error as e:
+        conn.rollback()
+        indexer.logger.error(f"Erro ao reconstruir estatísticas: {e}")
+        raise
@@ -0,0 +1,15 @@
+import sqlite3
+from core.submodules.db_modules.stats_aggregates import refresh_stale_largest
+
+def refresh_stale_stats_func(indexer):
+    # Recalcula o maior arquivo das extensões em que ele saiu ou diminuiu, para
+    # que get_stats volte a ler só os agregados.
+    conn = indexer.get_db_connection()
+    cursor = conn.cursor()
+    try:
+        refresh_stale_largest(cursor)
+        conn.commit()
+    except sqlite3.Error as e:
+        conn.rollback()
+        indexer.logger.error(f"Erro ao atualizar estatísticas: {e}")
+        raise
@@ -0,0 +1,30 @@
+import os
+import sqlite3
+from typing import Optional
+from core.submodules.db_modules.path_range import directory_key, subtree_range
+from core.submodules.db_modules.folder_sizes import REFRESH_STALE_NEWEST_SQL, ROLLUP_SQL, ROLLUP_PARAMS
+
+def rollup_folder_sizes_func(indexer, root_path: Optional[str] = None):
+    # Atualiza total_* da subárvore de `root_path` e das pastas acima dela, que
+    # também incluem o que mudou; sem `root_path`, de todas as pastas do índice.
+    conn = indexer.get_db_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute(REFRESH_STALE_NEWEST_SQL)
+        if not root_path:
+            cursor.execute(ROLLUP_SQL.format(condition='1'), ROLLUP_PARAMS)
+        else:
+            root_path = directory_key(root_path)
+            low, high = subtree_range(root_path)
+            cursor.execute(ROLLUP_SQL.format(condition='path = :root OR (path >= :low AND path < :high)'),
+                           dict(ROLLUP_PARAMS, root=root_path, low=low, high=high))
+            ancestor = os.path.dirname(root_path)
+            while ancestor and ancestor != root_path:
+                cursor.execute(ROLLUP_SQL.format(condition='path = :root'), dict(ROLLUP_PARAMS, root=ancestor))
+                root_path, ancestor = ancestor, os.path.dirname(ancestor)
+        conn.commit()
+        indexer.bump_index_generation()
+    except sqlite3.Error as e:
+        conn.rollback()
+        indexer.logger.error(f"Erro ao calcular o tamanho das pastas: {e}")
+        raise
@@ -1,5 +1,4 @@
 import sys
-import os
 from core.indexer import FileIndexer
 from utils.updateRelease.updater import AppUpdater
 from modules.scan_streaming import scan_streaming_menu
@@ -10,12 +9,19 @@ from modules.show_stats import show_stats_menu
 from modules.clear_index import clear_index_menu
 from modules.scan_folders import scan_folders_menu
 from modules.search_folder import search_folder_menu
+from modules.rebuild_search_index import rebuild_search_index_menu
+from modules.check_stats import check_stats_menu
+from modules.export_index import export_index_menu
+from modules.file_report import file_report_menu
 from modules.display_menu import display_menu
 
+MAX_SCAN_WORKERS = 32
+
 def main_menu():
     print("=== INDEXADOR DE ARQUIVOS DE REDE ===\n")
 
     current_app_version = "0.0.0-dev"
+    updater = None
     try:
         import version
         current_app_version = version.__version__
@@ -24,18 +30,27 @@ def main_menu():
             repo_name="FileStorageIndexer",
             current_version=current_app_version
         )
-        updater.check_for_updates()
     except ImportError:
         print("Aviso: O arquivo 'version.py' não foi encontrado. Rodando em modo de desenvolvimento, verificações de atualização puladas.")
-    except Exception as e:
-        print(f"Erro ao verificar atualizações: {e}")
 
-    max_workers = os.cpu_count() - 1
-    indexer = FileIndexer(max_workers=max_workers)
+    # Listagem e stat esperam pelo disco ou pela rede, não pela CPU: max_workers é só
+    # o teto, e o controlador adaptativo escolhe quantas threads trabalham de fato.
+    indexer = FileIndexer(max_workers=MAX_SCAN_WORKERS, parallel_walk=True)
+
+    # A verificação roda em segundo plano (com resultado em cache no disco) e a
+    # oferta de atualização aparece antes do próximo menu, sem atrasar o primeiro.
+    if updater:
+        updater.start_background_check()
 
     running = True
     try:
         while running:
+            latest_release = updater.take_available_update() if updater else None
+            if latest_release:
+                try:
+                    updater.offer_update(latest_release)
+                except Exception as e:
+                    print(f"Erro ao atualizar: {e}")
             display_menu()
             choices = {
                 "1": lambda: scan_streaming_menu(indexer),
@@ -46,6 +61,10 @@ def main_menu():
                 "6": lambda: clear_index_menu(indexer),
                 "7": lambda: scan_folders_menu(indexer),
                 "8": lambda: search_folder_menu(indexer),
+                "9": lambda: rebuild_search_index_menu(indexer),
+                "10": lambda: check_stats_menu(indexer),
+                "11": lambda: export_index_menu(indexer),
+                "12": lambda: file_report_menu(indexer),
                 "0": lambda: False
             }
             choice = input("\nEscolha uma opção: ").strip()
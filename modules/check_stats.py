@@ -0,0 +1,14 @@
+from core.indexer import FileIndexer
+
+def check_stats_menu(indexer: FileIndexer):
+    """Handles the 'Check/Rebuild Statistics' menu option."""
+    print("Verificando estatísticas (percorre o índice inteiro)...")
+    if indexer.check_stats():
+        print("Estatísticas consistentes.")
+        return
+    confirm = input("Estatísticas divergentes. Reconstruir agora? (s/N): ")
+    if confirm.lower() == 's':
+        indexer.rebuild_stats()
+        print("Estatísticas reconstruídas.")
+    else:
+        print("Operação cancelada.")
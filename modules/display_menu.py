@@ -9,6 +9,10 @@ def display_menu():
         6. Limpar índice
         7. Escanear apenas pastas
         8. Buscar pasta
+        9. Criar/reconstruir índice de busca por nome
+        10. Verificar/reconstruir estatísticas
+        11. Exportar índice completo (CSV/JSONL/TXT)
+        12. Relatórios (maiores arquivos / sem modificação desde / maiores pastas)
         0. Sair
     """
     print(menu_options)
\ No newline at end of file
@@ -0,0 +1,6 @@
+from core.indexer import FileIndexer
+from modules.export_results import export_results_menu
+
+def export_index_menu(indexer: FileIndexer):
+    """Handles the 'Export Full Index' menu option."""
+    export_results_menu(indexer, indexer.index_query(), "indice_completo.csv.gz")
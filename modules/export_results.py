@@ -0,0 +1,13 @@
+import sqlite3
+from core.indexer import FileIndexer, QuerySpec
+
+def export_results_menu(indexer: FileIndexer, spec: QuerySpec, default_name: str = "resultados_busca.csv"):
+    """Handles exporting the results of a search (CSV, JSONL or TXT, optionally gzip)."""
+    output_filename = input(f"Nome do arquivo (.csv, .jsonl ou .txt; acrescente .gz para compactar) [{default_name}]: ").strip()
+    if not output_filename:
+        output_filename = default_name
+    try:
+        exported = indexer.export_query(spec, output_filename)
+        print(f"{exported} registro(s) salvos em '{output_filename}' com sucesso.")
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"Erro ao salvar arquivo: {e}")
@@ -0,0 +1,49 @@
+from core.indexer import FileIndexer, format_file_size
+from modules.export_results import export_results_menu
+
+def file_report_menu(indexer: FileIndexer):
+    """Handles the 'Reports (largest / not modified since / largest folders)' menu option."""
+    report = input("\nRelatórios:\n1. Maiores arquivos\n2. Arquivos não modificados desde uma data\n"
+                   "3. Maiores pastas\nEscolha uma opção: ").strip()
+    if report not in ("1", "2", "3"):
+        print("Opção inválida.")
+        return
+    root_path = input("Limitar à pasta (Enter para buscar em todo o índice): ").strip() or None
+    if report == "3":
+        folder_report(indexer, root_path)
+        return
+    limit_text = input("Quantos arquivos listar? [20]: ").strip()
+    limit = int(limit_text) if limit_text.isdigit() else 20
+
+    try:
+        if report == "1":
+            extension = input("Extensão (Enter para todas): ").strip() or None
+            results = indexer.largest_files(limit, extension, root_path)
+            spec = indexer.filter_query(extension=extension, root_path=root_path, order='size')
+        else:
+            since = input("Não modificados desde (AAAA-MM-DD): ").strip()
+            results = indexer.files_not_modified_since(since, limit, root_path)
+            spec = indexer.filter_query(modified_before=since, root_path=root_path, order='mtime')
+    except ValueError as e:
+        print(e)
+        return
+
+    if not results:
+        print("Nenhum arquivo encontrado.")
+        return
+    for filename, full_path, file_size, modified_date in results:
+        print(f"  {format_file_size(file_size):>10}  {modified_date}  {full_path}")
+    if input("\nExportar relatório completo? (s/N): ").lower() == 's':
+        export_results_menu(indexer, spec, "relatorio.csv")
+
+def folder_report(indexer: FileIndexer, root_path):
+    limit_text = input("Quantas pastas listar? [50]: ").strip()
+    limit = int(limit_text) if limit_text.isdigit() else 50
+    results = indexer.largest_folders(limit, root_path)
+    if not results:
+        print("Nenhuma pasta encontrada.")
+        return
+    for path, total_bytes, total_files, newest_modified in results:
+        print(f"  {format_file_size(total_bytes):>10}  {total_files:>8} arquivos  {newest_modified or '-'}  {path}")
+    if input("\nExportar relatório completo? (s/N): ").lower() == 's':
+        export_results_menu(indexer, indexer.largest_folders_query(root_path), "maiores_pastas.csv")
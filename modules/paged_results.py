@@ -0,0 +1,45 @@
+from core.indexer import FileIndexer
+from modules.export_results import export_results_menu
+
+def paged_results_menu(indexer: FileIndexer, spec, title: str, print_row, item_label: str,
+                       page_size: int = 10) -> int:
+    """Lists a query page by page, with options to list more, export or go back.
+
+    There is no total up front: a COUNT(*) over a LIKE, glob or regex search reads
+    the whole table, so the first page is shown as soon as it is fetched.
+    Returns the number of rows listed.
+    """
+    listed = 0
+    page = 1
+    page_cursor = None
+    while True:
+        results, page_cursor = indexer.query_page(spec, page_size, page_cursor)
+        if not results:
+            break
+        print(f"\n{title} - página {page}:")
+        for row in results:
+            print_row(row)
+
+        listed += len(results)
+
+        if not page_cursor:
+            print("\nTodos os resultados foram listados.")
+            break
+
+        print(f"  ... há mais {item_label}")
+
+        while True:
+            action = input(f"\nOpções:\n1. Listar mais {page_size} {item_label}\n2. Exportar lista completa (CSV/JSONL/TXT)\n3. Voltar ao menu\nEscolha uma opção: ").strip()
+            if action == "1":
+                break  # Continue o loop externo para listar mais
+            elif action == "2":
+                export_results_menu(indexer, spec)
+                break # Voltar ao menu principal após salvar
+            elif action == "3":
+                break # Voltar ao menu principal
+            else:
+                print("Opção inválida. Tente novamente.")
+        if action == "2" or action == "3":
+            break # Sair do loop principal se o usuário escolheu salvar ou voltar
+        page += 1
+    return listed
@@ -0,0 +1,10 @@
+from core.indexer import FileIndexer
+
+def rebuild_search_index_menu(indexer: FileIndexer):
+    """Handles the 'Build/Rebuild Filename Search Index' menu option."""
+    confirm = input("Criar/reconstruir o índice de busca por trecho do nome a partir do índice atual? (s/N): ")
+    if confirm.lower() == 's':
+        indexer.rebuild_filename_search_index()
+        print("Índice de busca reconstruído. Buscas parciais com 3 ou mais caracteres passam a usá-lo.")
+    else:
+        print("Operação cancelada.")
@@ -5,4 +5,8 @@ def scan_streaming_menu(indexer: FileIndexer):
     path = input("Digite o caminho da pasta de rede: ").strip()
     if path:
         print("Usando modo streaming (baixo uso de memória)")
-        indexer.scan_network_folder(path, update_existing=False)
+        update_existing = input("Atualizar apenas o que mudou desde o último escaneamento? (s/N): ").strip().lower() == 's'
+        resume = True
+        if indexer.get_scan_checkpoint(path):
+            resume = input("Há um escaneamento interrompido desta pasta. Continuar de onde parou? (S/n): ").strip().lower() != 'n'
+        indexer.scan_network_folder(path, update_existing=update_existing, resume=resume)
@@ -1,15 +1,35 @@
+import re
 from core.indexer import FileIndexer, format_file_size
+from modules.paged_results import paged_results_menu
+
+PATTERN_HELP = "(trecho do nome, glob:curingas * ? [abc] ou re:expressão regular)"
+
+# Sem prefixo o termo é sempre um trecho do nome, então nomes como
+# "Contrato [2023]" continuam sendo encontrados como antes.
+SEARCH_MODE_PREFIXES = {'glob:': 'glob', 're:': 'regex'}
+
+def parse_search_term(search_term: str):
+    """Returns the search term and mode: 'glob:' selects glob, 're:' selects regex."""
+    for prefix, mode in SEARCH_MODE_PREFIXES.items():
+        if search_term.startswith(prefix):
+            return search_term[len(prefix):], mode
+    return search_term, None
+
+def print_file(row):
+    filename, full_path, file_size, modified_date = row
+    print(f"\nArquivo: {filename}")
+    print(f"Caminho: {full_path}")
+    print(f"Tamanho: {format_file_size(file_size)}")
 
 def search_file_menu(indexer: FileIndexer):
     """Handles the 'Search File' menu option."""
-    search_term = input("Digite o nome do arquivo: ").strip()
+    search_term, mode = parse_search_term(input(f"Digite o nome do arquivo {PATTERN_HELP}: ").strip())
     if search_term:
-        results = indexer.search_files(search_term)
-        if results:
-            print(f"\nEncontrados {len(results)} arquivo(s):")
-            for filename, full_path, file_size, modified_date in results:
-                print(f"\nArquivo: {filename}")
-                print(f"Caminho: {full_path}")
-                print(f"Tamanho: {format_file_size(file_size)}")
-        else:
+        root_path = input("Limitar à pasta (Enter para buscar em todo o índice): ").strip() or None
+        try:
+            spec = indexer.files_query(search_term, root_path=root_path, mode=mode)
+        except re.error as e:
+            print(f"Expressão regular inválida: {e}")
+            return
+        if not paged_results_menu(indexer, spec, "Arquivos encontrados", print_file, "arquivos"):
             print("Nenhum arquivo encontrado.")
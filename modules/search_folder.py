@@ -1,15 +1,23 @@
+import re
 from core.indexer import FileIndexer
+from modules.paged_results import paged_results_menu
+from modules.search_file import PATTERN_HELP, parse_search_term
+
+def print_folder(row):
+    folder_name, full_path, parent_path = row
+    print(f"\nPasta: {folder_name}")
+    print(f"Caminho: {full_path}")
+    print(f"Pasta Pai: {parent_path}")
 
 def search_folder_menu(indexer: FileIndexer):
     """Handles the 'Search Folder' menu option."""
-    search_term = input("Digite o nome da pasta: ").strip()
+    search_term, mode = parse_search_term(input(f"Digite o nome da pasta {PATTERN_HELP}: ").strip())
     if search_term:
-        results = indexer.search_folders(search_term)
-        if results:
-            print(f"\nEncontradas {len(results)} pasta(s):")
-            for folder_name, full_path, parent_path in results:
-                print(f"\nPasta: {folder_name}")
-                print(f"Caminho: {full_path}")
-                print(f"Pasta Pai: {parent_path}")
-        else:
+        root_path = input("Limitar à pasta (Enter para buscar em todo o índice): ").strip() or None
+        try:
+            spec = indexer.folders_query(search_term, root_path=root_path, mode=mode)
+        except re.error as e:
+            print(f"Expressão regular inválida: {e}")
+            return
+        if not paged_results_menu(indexer, spec, "Pastas encontradas", print_folder, "pastas"):
             print("Nenhuma pasta encontrada.")
@@ -1,4 +1,4 @@
-from core.indexer import FileIndexer
+from core.indexer import FileIndexer, format_file_size
 
 def show_stats_menu(indexer: FileIndexer):
     """Handles the 'Show Statistics' menu option."""
@@ -8,5 +8,7 @@ def show_stats_menu(indexer: FileIndexer):
     print(f"Total de pastas: {stats.get('total_folders', 0):,}")
     print(f"Tamanho total de arquivos: {stats.get('total_size_mb', 0):,.2f} MB")
     print("\nExtensões mais comuns:")
-    for ext, count in stats.get('top_extensions', []):
-        print(f"  {ext}: {count:,} arquivos")
+    for ext, count, total_bytes, largest_path, largest_size in stats.get('extension_details', []):
+        print(f"  {ext}: {count:,} arquivos, {format_file_size(total_bytes)}")
+        if largest_path:
+            print(f"      maior: {largest_path} ({format_file_size(largest_size)})")
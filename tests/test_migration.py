@@ -0,0 +1,101 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from core.indexer import FileIndexer
+
+LOGGER_NAME = 'core.submodules.db_modules.setup_logging'
+MIGRATION_MESSAGE = "caminhos de files para a tabela directories"
+
+# Esquema da primeira versão: caminho completo e pasta pai em texto em cada linha.
+BASELINE_FILES_SQL = '''
+    CREATE TABLE files (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        filename TEXT NOT NULL,
+        full_path TEXT NOT NULL UNIQUE,
+        parent_path TEXT,
+        file_size INTEGER,
+        modified_date TEXT,
+        item_type TEXT NOT NULL,
+        indexed_date TEXT DEFAULT CURRENT_TIMESTAMP
+    )
+'''
+
+class PathMigrationTest(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.previous_dir = os.getcwd()
+        os.chdir(self.work_dir)
+        self.db_path = os.path.join(self.work_dir, 'index.db')
+        root = os.path.join(self.work_dir, 'raiz')
+        sub = os.path.join(root, 'sub')
+        self.rows = [
+            ('sub', sub, root, None, None, 'folder'),
+            ('a.txt', os.path.join(root, 'a.txt'), root, 10, "2024-01-01 10:00:00", 'file'),
+            ('b.pdf', os.path.join(root, 'b.pdf'), root, 20, "2024-01-02 10:00:00", 'file'),
+            ('c.txt', os.path.join(sub, 'c.txt'), sub, 30, "2024-01-03 10:00:00", 'file'),
+        ]
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(BASELINE_FILES_SQL)
+        conn.executemany('''
+            INSERT INTO files (filename, full_path, parent_path, file_size, modified_date, item_type)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', self.rows)
+        conn.commit()
+        conn.close()
+
+    def tearDown(self):
+        os.chdir(self.previous_dir)
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def open_indexer(self):
+        with self.assertLogs(LOGGER_NAME, level='INFO') as logs:
+            indexer = FileIndexer(self.db_path)
+        migrated = any(MIGRATION_MESSAGE in line for line in logs.output)
+        return indexer, migrated
+
+    def table_rows(self, indexer):
+        with indexer.read_connection() as conn:
+            return (conn.execute("SELECT * FROM files ORDER BY id").fetchall(),
+                    conn.execute("SELECT * FROM directories ORDER BY id").fetchall())
+
+    def test_baseline_schema_is_migrated_once(self):
+        indexer, migrated = self.open_indexer()
+        try:
+            self.assertTrue(migrated)
+            with indexer.read_connection() as conn:
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(files)")}
+                orphans = conn.execute('''
+                    SELECT COUNT(*) FROM files
+                    WHERE dir_id NOT IN (SELECT id FROM directories)
+                ''').fetchone()[0]
+                directories = conn.execute('''
+                    SELECT child.path, parent.path FROM directories AS child
+                    LEFT JOIN directories AS parent ON parent.id = child.parent_id
+                ''').fetchall()
+            self.assertNotIn('full_path', columns)
+            self.assertEqual(orphans, 0)
+            for path, parent_path in directories:
+                expected_parent = os.path.dirname(path)
+                self.assertEqual(parent_path, expected_parent if expected_parent != path else None, path)
+
+            indexed = {(row[0], row[1], row[2]) for row in indexer.iter_query(indexer.index_query())}
+            self.assertEqual(indexed, {row[:3] for row in self.rows})
+            self.assertEqual({row[0]: row[2] for row in indexer.search_files('.')},
+                             {row[0]: row[3] for row in self.rows if row[5] == 'file'})
+            self.assertEqual([row[1] for row in indexer.search_folders('sub')], [self.rows[0][1]])
+            self.assertTrue(indexer.check_stats())
+            before = self.table_rows(indexer)
+        finally:
+            indexer.close()
+
+        indexer, migrated = self.open_indexer()
+        try:
+            self.assertFalse(migrated)
+            self.assertEqual(self.table_rows(indexer), before)
+        finally:
+            indexer.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,208 @@
+import ntpath
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+from core.indexer import FileIndexer
+from core.submodules.db_modules import path_range
+from core.submodules.insert_modules import directory_ids, write_records
+
+class CountingEntry:
+    """DirEntry wrapper that counts stat() calls."""
+    stat_calls = 0
+
+    def __init__(self, entry):
+        self._entry = entry
+        self.name = entry.name
+        self.path = entry.path
+
+    def stat(self):
+        CountingEntry.stat_calls += 1
+        return self._entry.stat()
+
+    def __getattr__(self, name):
+        return getattr(self._entry, name)
+
+def build_tree(root: str, folders: int = 3, files_per_folder: int = 4):
+    for folder in range(folders):
+        path = os.path.join(root, f"pasta{folder}", "sub")
+        os.makedirs(path)
+        for number in range(files_per_folder):
+            for directory in (os.path.dirname(path), path):
+                with open(os.path.join(directory, f"arquivo{number}.txt"), 'w') as f:
+                    f.write('x' * (number + 1))
+
+class ScanPipelineTest(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.previous_dir = os.getcwd()
+        os.chdir(self.work_dir)
+        self.root = os.path.join(self.work_dir, 'raiz')
+        build_tree(self.root)
+        self.indexer = FileIndexer(os.path.join(self.work_dir, 'index.db'), max_workers=2)
+
+    def tearDown(self):
+        self.indexer.close()
+        os.chdir(self.previous_dir)
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def indexed_paths(self):
+        return {row[1] for row in self.indexer.iter_query(self.indexer.index_query())}
+
+    def test_incremental_bulk_load_keeps_unchanged_folders(self):
+        self.indexer.scan_network_folder(self.root, resume=False)
+        before = self.indexed_paths()
+        self.assertEqual(len(before), 3 * 2 * 4 + 3 * 2)
+
+        removed = os.path.join(self.root, 'pasta1', 'sub', 'arquivo0.txt')
+        os.remove(removed)
+        self.indexer.scan_network_folder(self.root, update_existing=True, bulk_load=True, resume=False)
+
+        self.assertEqual(self.indexed_paths(), before - {removed})
+
+    def stale_extensions(self):
+        with self.indexer.read_connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM extension_stats WHERE largest_stale").fetchone()[0]
+
+    def test_rescan_keeps_largest_file_fresh(self):
+        self.indexer.scan_network_folder(self.root, resume=False)
+        self.indexer.scan_network_folder(self.root, resume=False)
+        self.assertEqual(self.stale_extensions(), 0)
+
+        largest = os.path.join(self.root, 'pasta2', 'sub', 'arquivo3.txt')
+        os.remove(largest)
+        self.indexer.scan_network_folder(self.root, resume=False)
+        self.assertEqual(self.stale_extensions(), 0)
+        self.assertTrue(self.indexer.check_stats())
+
+    def summary(self, indexer):
+        stats = indexer.get_stats()
+        folders = [(path.replace(self.work_dir, ''), total_bytes, total_files)
+                   for path, total_bytes, total_files, _ in indexer.largest_folders(100, self.root)]
+        return (stats['total_files'], stats['total_folders'], stats['top_extensions'],
+                [detail[:3] for detail in stats['extension_details']], sorted(folders))
+
+    def test_interrupted_scan_resumes_from_checkpoint(self):
+        class Interrupted(Exception):
+            pass
+
+        def interrupt(count):
+            raise Interrupted()
+
+        with self.assertRaises(Interrupted):
+            self.indexer.run_scan_pipeline(self.root, on_processed=interrupt)
+        self.assertIsNotNone(self.indexer.get_scan_checkpoint(self.root))
+
+        listed = []
+        list_directory = self.indexer.list_directory
+
+        def recording_list_directory(dir_path, incremental=False, resume_generation=None):
+            dirs, files, mtime_ns = list_directory(dir_path, incremental, resume_generation)
+            if files is not None:
+                listed.append(dir_path)
+            return dirs, files, mtime_ns
+
+        self.indexer.list_directory = recording_list_directory
+        self.indexer.scan_network_folder(self.root)
+        self.assertIsNone(self.indexer.get_scan_checkpoint(self.root))
+        self.assertLess(len(listed), 1 + 3 * 2)
+
+        clean = FileIndexer(os.path.join(self.work_dir, 'clean.db'), max_workers=2)
+        try:
+            clean.scan_network_folder(self.root, resume=False)
+            self.assertEqual(self.indexed_paths(), {row[1] for row in clean.iter_query(clean.index_query())})
+            self.assertEqual(self.summary(self.indexer), self.summary(clean))
+        finally:
+            clean.close()
+        self.assertTrue(self.indexer.check_stats())
+
+    def test_worker_error_fails_the_scan_instead_of_hanging(self):
+        self.indexer.scan_network_folder(self.root, resume=False)
+
+        def broken_filter(batch_data):
+            raise RuntimeError("falha no filtro")
+
+        self.indexer.filter_changed_records = broken_filter
+        with open(os.path.join(self.root, 'pasta0', 'novo.txt'), 'w') as f:
+            f.write('x')
+        errors = []
+
+        def scan():
+            try:
+                self.indexer.scan_network_folder(self.root, update_existing=True, resume=False)
+            except RuntimeError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=scan, daemon=True)
+        thread.start()
+        thread.join(30)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual([str(e) for e in errors], ["falha no filtro"])
+
+    def test_folder_scan_skips_file_stats(self):
+        for options in ({'parallel_walk': True}, {'scan_engine': 'asyncio'}):
+            indexer = FileIndexer(os.path.join(self.work_dir, 'folders.db'), max_workers=2, **options)
+            list_directory = indexer.list_directory
+
+            def counting_list_directory(dir_path, incremental=False, resume_generation=None):
+                dirs, files, mtime_ns = list_directory(dir_path, incremental, resume_generation)
+                return dirs, [CountingEntry(entry) for entry in files or ()], mtime_ns
+
+            indexer.list_directory = counting_list_directory
+            CountingEntry.stat_calls = 0
+            indexer.scan_network_folders(self.root)
+            folders = indexer.search_folders('sub')
+            indexer.close()
+            self.assertEqual(CountingEntry.stat_calls, 0, options)
+            self.assertEqual(len(folders), 3, options)
+
+class WindowsPathsTest(unittest.TestCase):
+    """Chaves de pasta com caminhos do Windows (ntpath), o sistema onde o indexador roda."""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.previous_dir = os.getcwd()
+        os.chdir(self.work_dir)
+        self.indexer = FileIndexer(os.path.join(self.work_dir, 'index.db'))
+        windows_os = SimpleNamespace(path=ntpath, sep='\\')
+        for module in (path_range, directory_ids, write_records):
+            patcher = mock.patch.object(module, 'os', windows_os)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.indexer.close()
+        os.chdir(self.previous_dir)
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def test_directory_key_matches_file_dirname(self):
+        for root, file_path in (('\\\\srv\\share', '\\\\srv\\share\\a.txt'),
+                                ('\\\\srv\\share\\', '\\\\srv\\share\\a.txt'),
+                                ('C:\\', 'C:\\a.txt'),
+                                ('C:/dados/./fotos/', 'C:\\dados\\fotos\\a.txt')):
+            self.assertEqual(path_range.directory_key(root), ntpath.dirname(file_path), root)
+        self.assertEqual(path_range.directory_key('c:\\Dados\\'), 'C:\\Dados')
+
+    def test_share_root_files_survive_bulk_sweep(self):
+        root = path_range.directory_key('\\\\srv\\share')
+        generation = self.indexer.next_scan_generation()
+        records = [(name, ntpath.join(folder, name), 1, "2024-01-01 10:00:00", 1704103200)
+                   for folder in ('\\\\srv\\share', '\\\\srv\\share\\sub') for name in ('a.txt', 'b.txt')]
+        with self.indexer.open_record_writer(True, generation) as writer:
+            writer.touch_directory(root)
+            writer.put(records)
+            writer.finish_directory((root, 1), [])
+            writer.finish_directory(('\\\\srv\\share\\sub', 1), [])
+
+        self.assertEqual(self.indexer.sweep_subtree(root, generation), 0)
+        with self.indexer.read_connection() as conn:
+            paths = [row[0] for row in conn.execute("SELECT path FROM directories WHERE path LIKE '\\\\srv\\share%'")]
+            files = conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+        self.assertEqual(sorted(paths), ['\\\\srv\\share\\', '\\\\srv\\share\\sub'])
+        self.assertEqual(files, 4)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from core.indexer import FileIndexer
+from core.submodules.search_modules.filename_snapshot import FilenameSnapshot
+from modules.search_file import parse_search_term
+
+class SearchTest(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.previous_dir = os.getcwd()
+        os.chdir(self.work_dir)
+        self.root = os.path.join(self.work_dir, 'raiz')
+        self.indexer = FileIndexer(os.path.join(self.work_dir, 'index.db'))
+
+    def tearDown(self):
+        self.indexer.close()
+        os.chdir(self.previous_dir)
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def insert_files(self, count: int):
+        for number in range(count):
+            self.indexer.insert_file_record(f"arquivo{number}.txt", os.path.join(self.root, f"arquivo{number}.txt"),
+                                            number, f"2024-01-{number % 28 + 1:02d} 10:00:00",
+                                            1700000000 + number)
+
+    def all_pages(self, spec, limit: int = 3):
+        rows, page_cursor = self.indexer.query_page(spec, limit)
+        while page_cursor:
+            page, page_cursor = self.indexer.query_page(spec, limit, page_cursor)
+            rows += page
+        return rows
+
+    def test_insert_record_derives_mtime_from_modified_date(self):
+        self.indexer.insert_record("sem_mtime.txt", os.path.join(self.root, "sem_mtime.txt"), self.root,
+                                   10, "2024-02-01 12:00:00", 'file')
+        rows = self.indexer.files_not_modified_since("2024-02-02", 10)
+        self.assertEqual([row[0] for row in rows], ["sem_mtime.txt"])
+
+    def test_mtime_paging_skips_null_mtime(self):
+        self.insert_files(10)
+        conn = self.indexer.get_db_connection()
+        conn.execute("UPDATE files SET mtime = NULL WHERE filename IN ('arquivo0.txt', 'arquivo5.txt')")
+        conn.commit()
+        self.indexer.bump_index_generation()
+
+        rows = self.all_pages(self.indexer.filter_query(order='mtime'))
+        self.assertEqual([row[0] for row in rows],
+                         [f"arquivo{number}.txt" for number in range(10) if number not in (0, 5)])
+
+    def test_snapshot_matches_like_search(self):
+        for name in ('a_b.doc', 'axb.doc', 'aéb.doc', 'ab.doc', 'Relatorio_2024.xlsx'):
+            self.indexer.insert_file_record(name, os.path.join(self.root, name), 1, "2024-01-01 00:00:00")
+        snapshot_indexer = FileIndexer(self.indexer.db_path, filename_snapshot=True)
+        try:
+            self.assertTrue(snapshot_indexer.filename_snapshot.is_current())
+            for term in ('a_b', 'A_B', 'é', 'relatorio_', '%2024%', 'zzz'):
+                self.assertEqual(snapshot_indexer.search_files(term), self.indexer.search_files(term), term)
+        finally:
+            snapshot_indexer.close()
+
+    def test_writes_remove_snapshot_file(self):
+        self.insert_files(3)
+        FileIndexer(self.indexer.db_path, filename_snapshot=True).close()
+        self.assertTrue(os.path.exists(self.indexer.filename_snapshot.path))
+        self.indexer.clear_index()
+        self.assertFalse(os.path.exists(self.indexer.filename_snapshot.path))
+
+    def test_root_path_is_normalized(self):
+        self.insert_files(3)
+        self.indexer.insert_file_record("outro.txt", os.path.join(self.work_dir, "outra", "outro.txt"), 1,
+                                        "2024-01-01 00:00:00")
+        expected = sorted(f"arquivo{number}.txt" for number in range(3))
+        for root_path in (self.root, self.root + os.sep, os.path.join(self.work_dir, '.', 'raiz'),
+                          os.path.join(self.root, 'sub', '..')):
+            rows = self.indexer.search_files('arquivo', root_path=root_path)
+            self.assertEqual(sorted(row[0] for row in rows), expected, root_path)
+
+    def test_brackets_without_prefix_are_substring_search(self):
+        for name in ('Contrato [2023].pdf', 'foto[1].jpg', 'foto1.jpg'):
+            self.indexer.insert_file_record(name, os.path.join(self.root, name), 1, "2024-01-01 00:00:00")
+        for term, expected in (('contrato [2023]', ['Contrato [2023].pdf']), ('foto[1]', ['foto[1].jpg']),
+                               ('glob:foto[1]*', ['foto1.jpg'])):
+            search_term, mode = parse_search_term(term)
+            self.assertEqual([row[0] for row in self.indexer.search_files(search_term, mode=mode)], expected, term)
+
+    def test_locked_snapshot_file_is_marked_stale(self):
+        # No Windows o arquivo mapeado por outro processo não pode ser apagado nem trocado.
+        self.insert_files(3)
+        reader = FileIndexer(self.indexer.db_path, filename_snapshot=True)
+        path = reader.filename_snapshot.path
+        remove, replace = os.remove, os.replace
+
+        def locked_remove(target):
+            if target == path:
+                raise PermissionError(target)
+            remove(target)
+
+        def locked_replace(source, target):
+            if target == path:
+                raise PermissionError(target)
+            replace(source, target)
+        try:
+            with mock.patch('os.remove', locked_remove), mock.patch('os.replace', locked_replace):
+                self.indexer.insert_file_record("novo.txt", os.path.join(self.root, "novo.txt"), 1,
+                                                "2024-01-01 00:00:00")
+                self.assertFalse(reader.filename_snapshot.is_current())
+                self.assertEqual([row[0] for row in reader.search_files('novo')], ["novo.txt"])
+                self.assertFalse(FilenameSnapshot(path).load())
+                reader.rebuild_filename_snapshot()
+                self.assertFalse(reader.filename_snapshot.is_current())
+
+            reader.rebuild_filename_snapshot()
+            self.assertTrue(reader.filename_snapshot.is_current())
+            self.assertFalse(os.path.exists(reader.filename_snapshot.stale_path))
+        finally:
+            reader.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""Compara os motores de escaneamento ('threads' e 'asyncio') com latência de rede simulada.
+
+Cria numa pasta temporária uma árvore com `pastas` subpastas e `arquivos` arquivos
+no total, e escaneia a árvore do zero com cada motor, num banco novo por rodada.
+A latência de um compartilhamento de rede é simulada com uma espera em cada
+listagem (FileIndexer.list_directory) e no primeiro stat de cada arquivo:
+- threads: FileIndexer(max_workers=32, parallel_walk=True), a configuração do menu;
+- asyncio: FileIndexer(scan_engine='asyncio'), com max_in_flight padrão (128).
+
+Uso: python utils/scan_engine_benchmark.py [arquivos] [pastas] [listagem_ms] [stat_ms]
+(padrão: 20000 arquivos em 200 pastas, 20 ms por listagem e 2 ms por stat)
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from core.indexer import FileIndexer
+
+ENGINES = {
+    'threads': dict(max_workers=32, parallel_walk=True),
+    'asyncio': dict(scan_engine='asyncio'),
+}
+
+class SlowEntry:
+    """DirEntry cujo primeiro stat() espera `delay` segundos, como numa pasta de rede."""
+
+    def __init__(self, entry, delay: float):
+        self._entry = entry
+        self._delay = delay
+        self._stat = None
+        self.name = entry.name
+        self.path = entry.path
+
+    def stat(self):
+        if self._stat is None:
+            time.sleep(self._delay)
+            self._stat = self._entry.stat()
+        return self._stat
+
+    def __getattr__(self, name):
+        return getattr(self._entry, name)
+
+def build_tree(root: str, files: int, folders: int):
+    per_folder = max(1, files // folders)
+    for folder in range(folders):
+        path = os.path.join(root, f"pasta{folder:04d}")
+        os.makedirs(path)
+        for number in range(per_folder):
+            open(os.path.join(path, f"arquivo{number:05d}.txt"), 'w').close()
+
+def run_once(engine: str, root: str, db_path: str, listing_delay: float, stat_delay: float):
+    indexer = FileIndexer(db_path, **ENGINES[engine])
+    list_directory = indexer.list_directory
+
+    def slow_list_directory(dir_path, incremental=False, resume_generation=None):
+        time.sleep(listing_delay)
+        dirs, files, mtime_ns = list_directory(dir_path, incremental, resume_generation)
+        return dirs, [SlowEntry(entry, stat_delay) for entry in files or ()], mtime_ns
+
+    indexer.list_directory = slow_list_directory
+    start = time.perf_counter()
+    processed, errors = indexer.run_scan_pipeline(root)
+    elapsed = time.perf_counter() - start
+    indexer.close()
+    return elapsed, processed, errors
+
+def main():
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    folders = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    listing_ms = float(sys.argv[3]) if len(sys.argv) > 3 else 20.0
+    stat_ms = float(sys.argv[4]) if len(sys.argv) > 4 else 2.0
+    work_dir = tempfile.mkdtemp()
+    previous_dir = os.getcwd()
+    os.chdir(work_dir)  # o file_indexer.log fica na pasta temporária
+    try:
+        root = os.path.join(work_dir, 'raiz')
+        build_tree(root, files, folders)
+        print(f"{files} arquivos em {folders} pastas, {listing_ms:g} ms por listagem e {stat_ms:g} ms por stat")
+        for engine in ENGINES:
+            elapsed, processed, errors = run_once(engine, root, os.path.join(work_dir, f"{engine}.db"),
+                                                  listing_ms / 1000, stat_ms / 1000)
+            print(f"  {engine}: {elapsed:.1f} s ({processed} itens, {errors} erros)")
+    finally:
+        os.chdir(previous_dir)
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
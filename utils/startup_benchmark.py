@@ -0,0 +1,58 @@
+"""Mede o tempo até o menu principal aparecer.
+
+Cada rodada inicia um processo Python novo numa pasta temporária (banco e log
+próprios, com um version.py para que a verificação de atualização também seja
+iniciada), responde "0" ao menu e registra:
+- menu: tempo dentro do processo, do primeiro import até o menu ser exibido;
+- processo: tempo total do processo, incluindo a inicialização do interpretador.
+
+Uso: python utils/startup_benchmark.py [rodadas]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TARGET_MS = 200
+
+SNIPPET = '''
+import sys, time
+start = time.perf_counter()
+import file_indexer
+display_menu = file_indexer.display_menu
+def timed_display_menu():
+    display_menu()
+    print(f"MENU_MS={(time.perf_counter() - start) * 1000:.1f}", file=sys.stderr)
+    file_indexer.display_menu = display_menu
+file_indexer.display_menu = timed_display_menu
+file_indexer.main_menu()
+'''
+
+def run_once(work_dir: str):
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-c', SNIPPET], input='0\n', capture_output=True,
+                            text=True, cwd=work_dir, env=env, timeout=60)
+    process_ms = (time.perf_counter() - start) * 1000
+    menu_ms = next(float(line.split('=', 1)[1]) for line in result.stderr.splitlines()
+                   if line.startswith('MENU_MS='))
+    return menu_ms, process_ms
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    with tempfile.TemporaryDirectory() as work_dir:
+        with open(os.path.join(work_dir, 'version.py'), 'w') as f:
+            f.write('__version__ = "0"\n')
+        run_once(work_dir)  # cria o banco e aquece o cache de bytecode
+        samples = [run_once(work_dir) for _ in range(rounds)]
+    menu = statistics.median(sample[0] for sample in samples)
+    process = statistics.median(sample[1] for sample in samples)
+    print(f"Mediana de {rounds} rodadas: menu em {menu:.0f} ms, processo completo em {process:.0f} ms "
+          f"(meta: menu < {TARGET_MS} ms)")
+    return 0 if menu < TARGET_MS else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
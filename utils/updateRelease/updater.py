@@ -1,28 +1,100 @@
 
-import requests
+import json
 import os
 import sys
 import subprocess
+import threading
+import time
+
+# (connect, read) timeouts in seconds, so a blocked network can't hang the app.
+REQUEST_TIMEOUT = (3.05, 10)
+DOWNLOAD_TIMEOUT = (3.05, 60)
+UPDATE_CHECK_TTL = 24 * 60 * 60
+# Set to 0/false/no/off to skip the update check entirely.
+UPDATE_CHECK_ENV_VAR = "FILE_INDEXER_UPDATE_CHECK"
 
 
 class AppUpdater:
-    def __init__(self, repo_owner, repo_name, current_version):
+    def __init__(self, repo_owner, repo_name, current_version,
+                 cache_path="update_check.json", cache_ttl=UPDATE_CHECK_TTL):
         self.repo_owner = repo_owner
         self.repo_name = repo_name
         self.current_version = current_version
         self.github_api_url = f"https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/releases/latest"
         self.executable_name = "pesquisa.exe"
+        self.cache_path = cache_path
+        self.cache_ttl = cache_ttl
+        self._available_release = None
+
+    @staticmethod
+    def is_enabled():
+        """Returns False when the update check was turned off through the environment."""
+        return os.environ.get(UPDATE_CHECK_ENV_VAR, "1").strip().lower() not in ("0", "false", "no", "off")
 
-    def get_latest_release_info(self):
+    def get_latest_release_info(self, verbose=True):
         """Fetches the latest release information from GitHub."""
+        # requests takes longer to import than the rest of the app; load it only here.
+        import requests
         try:
-            response = requests.get(self.github_api_url)
+            response = requests.get(self.github_api_url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status() # Raise an exception for HTTP errors
             return response.json()
         except requests.exceptions.RequestException as e:
-            print(f"Error fetching latest release info: {e}")
+            if verbose:
+                print(f"Error fetching latest release info: {e}")
             return None
 
+    def get_cached_release_info(self):
+        """Returns the latest release info, reusing the on-disk cache while it is younger than cache_ttl.
+
+        Failed checks are cached too, so a restricted network is only retried after the TTL.
+        """
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                cached = json.load(f)
+            if time.time() - cached["checked_at"] < self.cache_ttl:
+                return cached["release"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        release = self.get_latest_release_info(verbose=False)
+        if release is not None:
+            # Only what the update flow reads; the full payload includes the release notes.
+            release = {
+                "tag_name": release.get("tag_name"),
+                "assets": [{"name": asset.get("name"), "browser_download_url": asset.get("browser_download_url")}
+                           for asset in release.get("assets", [])],
+            }
+        try:
+            with open(self.cache_path, "w", encoding="utf-8") as f:
+                json.dump({"checked_at": time.time(), "release": release}, f)
+        except OSError:
+            pass
+        return release
+
+    def start_background_check(self):
+        """Checks for a newer release in a daemon thread, without delaying startup.
+
+        The result is picked up later with take_available_update().
+        """
+        if not self.is_enabled():
+            return
+
+        def check():
+            try:
+                release = self.get_cached_release_info()
+                if self.is_new_version_available(release):
+                    self._available_release = release
+            except Exception:
+                pass
+
+        threading.Thread(target=check, daemon=True).start()
+
+    def take_available_update(self):
+        """Returns the newer release found by the background check (only once), or None."""
+        release, self._available_release = self._available_release, None
+        return release
+
     def is_new_version_available(self, latest_release):
         """Compares the current version with the latest release version."""
         if not latest_release:
@@ -63,9 +135,10 @@ class AppUpdater:
             print(f"Executable '{self.executable_name}' not found in the latest release assets.")
             return False
 
+        import requests
         try:
             print(f"Downloading new version from: {download_url}")
-            response = requests.get(download_url, stream=True)
+            response = requests.get(download_url, stream=True, timeout=DOWNLOAD_TIMEOUT)
             response.raise_for_status()
 
             # Save the downloaded file to a temporary location
@@ -112,10 +185,17 @@ class AppUpdater:
 
     def check_for_updates(self):
         """Checks for updates and performs the update if a new version is available."""
-        current_exe_path = sys.executable # Define current_exe_path here
         print("Checking for updates...")
         latest_release = self.get_latest_release_info()
         if latest_release and self.is_new_version_available(latest_release):
+            self.offer_update(latest_release)
+        else:
+            print("No new updates available. You are running the latest version.")
+
+    def offer_update(self, latest_release):
+        """Asks the user to install a newer release and performs the update if confirmed."""
+        current_exe_path = sys.executable # Define current_exe_path here
+        if latest_release:
             latest_tag_name = latest_release.get("tag_name", "N/A")
             latest_version_str = latest_tag_name.lstrip('v')
             print(f"New version available! Current: {self.current_version}, Latest: {latest_version_str}")
@@ -136,8 +216,6 @@ class AppUpdater:
                         sys.exit(0) # Exit the current application
             else:
                 print("Update cancelled by user.")
-        else:
-            print("No new updates available. You are running the latest version.")
 
     def _restart_application(self, current_exe_path):
         """Restarts the application using a temporary batch script."""